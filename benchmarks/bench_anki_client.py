@@ -0,0 +1,69 @@
+"""Round-trip benchmark of AnkiConnect requests against the local simulator.
+
+Starts the AnkiConnect simulator on localhost with a deck of twenty cards,
+then compares one requests.post per action (the previous implementation,
+a new TCP connection each time) with the pooled AnkiHttpClient.
+
+Usage:
+    python benchmarks/bench_anki_client.py [--requests 500] [--latency-ms 0]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from svt_app.services.anki_http_client import AnkiHttpClient  # noqa: E402
+from svt_app.services.anki_simulator import AnkiSimulator  # noqa: E402
+
+
+def _measure(call: Callable[[], Any], count: int) -> List[float]:
+    """Return the round-trip times in milliseconds of count calls."""
+    timings = []
+    for _ in range(count):
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _report(name: str, timings: List[float]) -> None:
+    """Print the mean, median and p95 of a series of timings."""
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{name:<34} {statistics.mean(timings):>9.3f} {statistics.median(timings):>9.3f} {p95:>9.3f}")
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Run the benchmark and print the round-trip times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500, help="requests per measurement")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated processing time per action")
+    args = parser.parse_args(argv)
+
+    simulator = AnkiSimulator({"Biologie": 20}, latency_ms=args.latency_ms)
+    endpoint = simulator.start()
+    payload = {"action": "findCards", "version": 6, "params": {"query": "deck:Biologie"}}
+    client = AnkiHttpClient(endpoint)
+    try:
+        # Warm both paths up so the first connection is not counted
+        requests.post(endpoint, json=payload, timeout=5)
+        client.post("findCards", payload["params"])
+        print(f"{'client':<34} {'mean (ms)':>9} {'p50 (ms)':>9} {'p95 (ms)':>9}")
+        _report("requests.post, new connection",
+                _measure(lambda: requests.post(endpoint, json=payload, timeout=5).json(), args.requests))
+        _report("AnkiHttpClient, pooled keep-alive",
+                _measure(lambda: client.post("findCards", payload["params"]), args.requests))
+    finally:
+        client.close()
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
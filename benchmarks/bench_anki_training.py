@@ -0,0 +1,118 @@
+"""End-to-end benchmark of the Anki training flow against the AnkiConnect simulator.
+
+Drives the application routes the training page calls (authentication,
+first page of cards, remaining pages, answer then reload) for decks of
+several sizes, and reports latencies and AnkiConnect round trips.
+
+Usage:
+    python benchmarks/bench_anki_training.py [--sizes 100,1000,5000] [--answers 50] [--latency-ms 2]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+
+def _free_port() -> int:
+    """Return a port nothing listens on."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _ms(started: float) -> float:
+    """Return the milliseconds elapsed since a perf_counter value."""
+    return (time.perf_counter() - started) * 1000
+
+
+def run_deck(client: Any, simulator: Any, outbox: Any, deck: str, answers: int) -> Dict[str, Any]:
+    """Run the training flow on one deck and return its measurements."""
+    simulator.requests.clear()
+    started = time.perf_counter()
+    first = client.get(f"/api/anki/cards/{deck}/page?limit=20").get_json()
+    first_page_ms = _ms(started)
+    assert first["success"], first
+
+    started = time.perf_counter()
+    cursor = first["next_cursor"]
+    while cursor:
+        cursor = client.get(f"/api/anki/cards/{deck}/page?limit=20&cursor={cursor}").get_json()["next_cursor"]
+    remaining_ms = _ms(started)
+
+    started = time.perf_counter()
+    client.get(f"/api/anki/cards/{deck}")
+    whole_deck_warm_ms = _ms(started)
+
+    answer_ms: List[float] = []
+    cards = first["cards"]
+    for index in range(answers):
+        if not cards:
+            break
+        started = time.perf_counter()
+        client.post("/api/anki/answer", json={"cardId": cards[0]["cardId"], "ease": 3,
+                                              "idempotencyKey": f"{deck}-{index}"})
+        cards = client.get(f"/api/anki/cards/{deck}/page?limit=20").get_json()["cards"]
+        answer_ms.append(_ms(started))
+
+    started = time.perf_counter()
+    while outbox.depth():
+        time.sleep(0.005)
+    drain_ms = _ms(started)
+    return {
+        'first_page_ms': first_page_ms,
+        'remaining_pages_ms': remaining_ms,
+        'whole_deck_warm_ms': whole_deck_warm_ms,
+        'answer_reload_ms': statistics.median(answer_ms) if answer_ms else 0.0,
+        'outbox_drain_ms': drain_ms,
+        'round_trips': sum(simulator.requests.values()),
+        'answered': len(answer_ms),
+    }
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Run the benchmark and print one line per deck size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,5000", help="comma-separated deck sizes")
+    parser.add_argument("--answers", type=int, default=50, help="cards answered per deck")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="simulated AnkiConnect processing time")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    # The Anki services read their configuration when they are built
+    port = _free_port()
+    data_dir = tempfile.mkdtemp(prefix="bench_anki_")
+    os.environ.update({'ANKI_HOST': '127.0.0.1', 'ANKI_PORT': str(port), 'ANKI_EMAIL': 'bench@example.org',
+                       'ANKI_PASSWORD': 'bench', 'ANKI_OUTBOX_PATH': os.path.join(data_dir, 'outbox.sqlite3')})
+
+    from svt_app import create_app  # noqa: E402
+    from svt_app.services.anki_simulator import AnkiSimulator  # noqa: E402
+    from svt_app.services.service_container import ServiceContainer  # noqa: E402
+
+    simulator = AnkiSimulator({f"Deck{size}": size for size in sizes}, latency_ms=args.latency_ms)
+    simulator.start(port=port)
+    services = ServiceContainer()
+    client = create_app(services).test_client()
+    try:
+        assert client.get("/anki/authenticate").get_json()["authenticated"]
+        columns = ("first page", "other pages", "warm deck", "answer+reload", "outbox drain", "round trips")
+        print(f"{'deck size':>9} " + " ".join(f"{column:>13}" for column in columns))
+        for size in sizes:
+            result = run_deck(client, simulator, services.answer_outbox, f"Deck{size}", args.answers)
+            print(f"{size:>9} {result['first_page_ms']:>10.1f} ms {result['remaining_pages_ms']:>10.1f} ms "
+                  f"{result['whole_deck_warm_ms']:>10.1f} ms {result['answer_reload_ms']:>10.1f} ms "
+                  f"{result['outbox_drain_ms']:>10.1f} ms {result['round_trips']:>13}")
+        print(f"({args.answers} answers per deck, {args.latency_ms} ms simulated AnkiConnect latency)")
+    finally:
+        services.answer_outbox.close()
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark of the Anki card HTML formatting over a synthetic corpus.
+
+Compares the previous formatter (one html.parser tree per question and
+per answer, card after card) with AnkiCardFormatter.extract_cards_fields
+on a cold cache, with and without worker processes, and on a warm cache.
+
+Usage:
+    python benchmarks/bench_card_formatter.py [--cards 2000] [--cloze-ratio 0.3] [--workers 4]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from svt_app.services.anki_card_formatter import AnkiCardFormatter  # noqa: E402
+
+STYLE = "<style>.card { font-family: arial; font-size: 20px; text-align: center; color: black; }</style>"
+WORDS = ("mitose", "méiose", "chromosome", "allèle", "gène", "cellule", "noyau", "ADN", "gamète", "zygote")
+
+
+def legacy_format(content: str) -> str:
+    """Previous format_card_content: a full html.parser round trip for every content."""
+    soup = BeautifulSoup(content, 'html.parser')
+    for style in soup.find_all('style'):
+        style.decompose()
+    for cloze in soup.find_all(class_='cloze'):
+        new_tag = soup.new_tag('span')
+        new_tag['class'] = 'cloze-highlight'
+        new_tag.string = cloze.get('data-cloze', '[...]')
+        cloze.replace_with(new_tag)
+    for inactive in soup.find_all(class_='cloze-inactive'):
+        inactive.replace_with(inactive.get_text())
+    return str(soup)
+
+
+def make_corpus(count: int, cloze_ratio: float, seed: int = 42) -> List[Dict[str, Any]]:
+    """Return synthetic cardsInfo entries shaped like Basic and Cloze notes."""
+    rng = random.Random(seed)
+    cards = []
+    for card_id in range(count):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+        if rng.random() < cloze_ratio:
+            word = rng.choice(WORDS)
+            question = (f'{STYLE}<div class="card">{text} <span class="cloze" data-cloze="{word}">[...]</span> '
+                        f'<span class="cloze-inactive">{rng.choice(WORDS)}</span></div>')
+            answer = f'{STYLE}<div class="card">{text} <span class="cloze">{word}</span></div>'
+        else:
+            question = f'{STYLE}<div class="front"><b>{text}</b>?<br></div>'
+            answer = f'{STYLE}<div class="front"><b>{text}</b>?<br></div><hr id=answer><div>{text}</div>'
+        cards.append({'cardId': card_id, 'question': question, 'answer': answer})
+    return cards
+
+
+def _timed(label: str, run: Any) -> float:
+    """Run a callable once and print its duration."""
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<40} {elapsed * 1000:>10.1f} ms")
+    return elapsed
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Run the benchmark and print the formatting time of the corpus."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=2000, help="number of cards in the corpus")
+    parser.add_argument("--cloze-ratio", type=float, default=0.3, help="share of cloze cards")
+    parser.add_argument("--workers", type=int, default=4, help="worker processes for the parallel run")
+    args = parser.parse_args(argv)
+
+    cards = make_corpus(args.cards, args.cloze_ratio)
+    print(f"{args.cards} cards, {args.cloze_ratio:.0%} cloze, {os.cpu_count()} CPUs")
+    before = _timed("previous formatter", lambda: [(legacy_format(card['question']), legacy_format(card['answer']))
+                                                   for card in cards])
+
+    AnkiCardFormatter.workers = 1
+    AnkiCardFormatter.cache.clear()
+    sequential = _timed("fast path + cache, cold, 1 process", lambda: AnkiCardFormatter.extract_cards_fields(cards))
+    AnkiCardFormatter.workers = args.workers
+    AnkiCardFormatter.cache.clear()
+    AnkiCardFormatter._get_pool()  # Start the workers outside of the measurement
+    parallel = _timed(f"fast path + cache, cold, {args.workers} processes",
+                      lambda: AnkiCardFormatter.extract_cards_fields(cards))
+    warm = _timed("warm cache", lambda: AnkiCardFormatter.extract_cards_fields(cards))
+    print(f"speed-up: {before / sequential:.1f}x cold, {before / parallel:.1f}x cold parallel, "
+          f"{before / warm:.1f}x warm")
+
+    cloze = [card for card in cards if 'cloze' in card['question']]
+    formatted = AnkiCardFormatter.extract_cards_fields(cloze)
+    assert all(fields['question'] == legacy_format(card['question']) for card, fields in zip(cloze, formatted))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Micro-benchmark of the logging facade overhead for a disabled module.
+
+Compares the previous implementation (inspect.currentframe() and a config
+lookup on every call, decorator re-checking the config per call) with the
+current one.
+
+Usage:
+    python benchmarks/bench_logging.py [--number 200000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from svt_app.utils import logging_utils  # noqa: E402
+from svt_app.utils.logging_utils import conditional_log, lazy, log_if_enabled, module_logger  # noqa: E402
+
+log = module_logger(__name__)
+
+QUESTION: Dict[str, Any] = {
+    'text': "Quel élément commence la chaîne d'information ?",
+    'options': ['Une batterie', 'Un moteur', 'Un capteur', 'Une roue'],
+    'correct_answer': 'Un capteur',
+    'statistics': {'correct_answers': 3, 'wrong_answers': 1},
+}
+
+
+def legacy_conditional_log(message: str, *args: Any, level: str = 'DEBUG', module_name: Optional[str] = None) -> None:
+    """Previous conditional_log: inspect frame lookup and config dict lookup per call."""
+    if module_name is None:
+        import inspect
+        frame = inspect.currentframe()
+        if frame is not None:
+            frame = frame.f_back
+            if frame is not None:
+                module_name = frame.f_globals['__name__']
+    if module_name and logging_utils._CONFIG.get('enabled_loggers', {}).get(module_name, False):
+        logging_utils._emit(module_name, message, args, level)
+
+
+def legacy_log_if_enabled(level: str = 'DEBUG') -> Callable:
+    """Previous log_if_enabled: wrapper re-checking the configuration on every call."""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if logging_utils._CONFIG.get('enabled_loggers', {}).get(func.__module__, False):
+                return func(*args, **kwargs)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def plain(value: int) -> int:
+    """Undecorated function used as the baseline."""
+    return value
+
+
+legacy_decorated = legacy_log_if_enabled()(plain)
+decorated = log_if_enabled()(plain)
+
+
+def _per_call_ns(statement: Callable[[], Any], number: int) -> float:
+    """Return the best per-call time in nanoseconds over five runs."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Run the benchmark and print the per-call overhead."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200000, help="calls per measurement")
+    args = parser.parse_args(argv)
+
+    assert not logging_utils.is_logging_enabled(__name__), "the benchmark module must not be enabled"
+    cases = [
+        ("conditional_log, constant message",
+         lambda: legacy_conditional_log("Looking for question {}", 12),
+         lambda: conditional_log("Looking for question {}", 12)),
+        ("conditional_log, question dict argument",
+         lambda: legacy_conditional_log("Updated question data: {}", dict(QUESTION)),
+         lambda: conditional_log("Updated question data: {}", lazy(lambda: dict(QUESTION)))),
+        ("module_logger guard, question dict argument",
+         lambda: legacy_conditional_log("Updated question data: {}", dict(QUESTION)),
+         lambda: log.enabled and log("Updated question data: {}", dict(QUESTION))),
+        ("log_if_enabled wrapper",
+         lambda: legacy_decorated(1),
+         lambda: decorated(1)),
+    ]
+    baseline = _per_call_ns(lambda: None, args.number)
+    print(f"{'case':<44} {'before (ns)':>12} {'after (ns)':>12} {'speed-up':>9}")
+    for name, before, after in cases:
+        before_ns = _per_call_ns(before, args.number) - baseline
+        after_ns = _per_call_ns(after, args.number) - baseline
+        speed_up = f"{before_ns / after_ns:>8.1f}x" if after_ns >= 1 else f"{'n/a':>9}"
+        print(f"{name:<44} {before_ns:>12.1f} {after_ns:>12.1f} {speed_up}")
+    print(f"(cost of an empty call, {baseline:.1f} ns, subtracted)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Question loader benchmark: reading 1k, 10k and 100k question files.
+
+Compares the previous loader (open and json.load one file at a time)
+with load_question_files, serial and with its thread pool, using the
+standard decoder and orjson when it is installed. Files are read from
+the page cache: the first pass over each bank is not timed.
+
+Usage:
+    python benchmarks/bench_question_loader.py [--sizes 1000,10000,100000] [--runs 3] [--workers N]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from bench_startup import generate_bank  # noqa: E402
+from svt_app.services import question_loader  # noqa: E402
+from svt_app.services.question_loader import default_workers, load_question_files  # noqa: E402
+from svt_app.services.question_scanner import scan_question_files  # noqa: E402
+
+
+def load_one_by_one(base_dir: str, rel_paths: List[str]) -> int:
+    """Load the files like the loader did before: open and json.load, one at a time."""
+    loaded = 0
+    for rel_path in rel_paths:
+        with open(os.path.join(base_dir, *rel_path.split("/")), 'r', encoding='utf-8') as f:
+            json.load(f)
+        loaded += 1
+    return loaded
+
+
+def timed(load: Callable[[], object], runs: int) -> float:
+    """Return the median duration of a load in milliseconds."""
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        load()
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Run the benchmark and print one line per bank size and loader."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated numbers of question files")
+    parser.add_argument("--runs", type=int, default=3, help="timed loads per measurement")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="reader threads of the pool")
+    args = parser.parse_args(argv)
+
+    fast_decoder = question_loader.orjson
+    decoders = [("json", None)] + ([("orjson", fast_decoder)] if fast_decoder is not None else [])
+    print(f"{'files':>7} {'loader':>24} {'time':>10} {'files/s':>9}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        base = tempfile.mkdtemp(prefix="bench_loader_")
+        try:
+            generate_bank(base, size)
+            base_dir = os.path.join(base, "assets", "Data", "fill_the_blanks")
+            rel_paths = sorted(scan_question_files(base_dir))
+            load_one_by_one(base_dir, rel_paths)
+            loaders = [("one by one, json", lambda: load_one_by_one(base_dir, rel_paths))]
+            for name, decoder in decoders:
+                loaders.append((f"serial, {name}", lambda decoder=decoder: (
+                    setattr(question_loader, "orjson", decoder), load_question_files(base_dir, rel_paths, 1))))
+                loaders.append((f"{args.workers} threads, {name}", lambda decoder=decoder: (
+                    setattr(question_loader, "orjson", decoder),
+                    load_question_files(base_dir, rel_paths, args.workers))))
+            for name, load in loaders:
+                ms = timed(load, args.runs)
+                print(f"{size:>7} {name:>24} {ms:>7.0f} ms {size / ms * 1000:>9.0f}")
+        finally:
+            question_loader.orjson = fast_decoder
+            shutil.rmtree(base, ignore_errors=True)
+    print(f"(median of {args.runs} loads from the page cache on {os.cpu_count()} CPUs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Startup benchmark: time to the first request for small and large question banks.
+
+Each measurement runs in a fresh interpreter inside a temporary data
+directory holding a generated bank. "eager" reproduces the startup where
+importing the blueprints built two QuestionService instances and the
+Anki services before create_app returned; "cold" is the current one, where
+the service container builds them on first use, without a snapshot of the
+bank; "warm" is the current one reading the snapshot the previous start
+left.
+
+It then prints an import-time report (python -X importtime) of the
+application start, grouped by top-level package, and checks that the Anki
+dependencies are not part of it.
+
+Usage:
+    python benchmarks/bench_startup.py [--sizes 100,20000] [--runs 3] [--top 12]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+QUESTIONS_PER_FOLDER = 100
+# Only needed by the Anki integration, so they must not be imported at startup
+ANKI_DEPENDENCIES = ("bs4", "requests", "urllib3", "dotenv")
+
+
+def generate_bank(base: str, size: int) -> None:
+    """Write size fill-in-the-blank questions under base/assets/Data."""
+    data = os.path.join(base, "assets", "Data")
+    os.makedirs(os.path.join(data, "image_matching"), exist_ok=True)
+    for index in range(size):
+        folder = os.path.join(data, "fill_the_blanks", f"chapitre_{index // QUESTIONS_PER_FOLDER:04d}")
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"question{index + 1:06d}.json"), 'w', encoding='utf-8') as f:
+            json.dump({
+                "text": f"Question {index} : quel organite contient l'ADN ?",
+                "options": ["Le noyau", "La membrane", "Le cytoplasme", "La paroi"],
+                "correct_answer": "Le noyau",
+                "completed": False,
+                "statistics": {"correct_answers": 0, "wrong_answers": 0}
+            }, f, ensure_ascii=False, indent=2)
+
+
+def child(mode: str, base: str) -> None:
+    """Start the application in this interpreter and print the timings as JSON."""
+    if mode != "warm":
+        shutil.rmtree(os.environ['SVT_CACHE_DIR'], ignore_errors=True)
+    started = time.perf_counter()
+    sys.path.insert(0, SRC)
+    from svt_app import create_app
+    from svt_app.services.question_service import QuestionService
+    from svt_app.services.service_container import ServiceContainer
+    imported = time.perf_counter()
+
+    services = ServiceContainer(base)
+    app = create_app(services)
+    if mode == "eager":
+        # What importing the blueprints used to build: one bank per controller and the Anki services
+        QuestionService(base)
+        services.texte_a_trous_service
+        services.question_tree_cache
+        services.training_service
+    created = time.perf_counter()
+
+    client = app.test_client()
+    assert client.get("/").status_code == 200
+    first_request = time.perf_counter()
+    assert client.get("/game/texte_a_trous").status_code == 200
+    first_question = time.perf_counter()
+    print(json.dumps({
+        'import_ms': (imported - started) * 1000,
+        'create_app_ms': (created - imported) * 1000,
+        'first_request_ms': (first_request - started) * 1000,
+        'first_question_ms': (first_question - started) * 1000,
+    }))
+
+
+def measure(mode: str, base: str, runs: int) -> Dict[str, float]:
+    """Return the median timings of several fresh starts."""
+    results: List[Dict[str, float]] = []
+    for _ in range(runs):
+        # Keep the snapshots of the generated bank out of the user's cache
+        env = dict(os.environ, SVT_CACHE_DIR=os.path.join(base, "cache"))
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode, base], cwd=base,
+                                env=env, check=True, capture_output=True, text=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(result[key] for result in results) for key in results[0]}
+
+
+def import_report(base: str) -> Dict[str, float]:
+    """
+    Return the import time of the application start per top-level package.
+
+    Returns:
+        Dict[str, float]: Milliseconds spent importing each package's own
+        modules, from python -X importtime, largest first.
+    """
+    script = f"import sys; sys.path.insert(0, {SRC!r}); from svt_app import create_app; create_app()"
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", script], cwd=base, check=True,
+                            capture_output=True, text=True).stderr
+    packages: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0.0) + int(own) / 1000
+    return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True))
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Run the benchmark and print one line per bank size and startup mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,20000", help="comma-separated numbers of questions")
+    parser.add_argument("--runs", type=int, default=3, help="fresh starts per measurement")
+    parser.add_argument("--top", type=int, default=12, help="packages listed in the import-time report")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "BASE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        child(*args.child)
+        return
+
+    print(f"{'questions':>9} {'startup':>7} {'import':>10} {'create_app':>10} {'1st request':>11} "
+          f"{'1st question':>12}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        base = tempfile.mkdtemp(prefix="bench_startup_")
+        try:
+            generate_bank(base, size)
+            for mode in ("eager", "cold", "warm"):
+                result = measure(mode, base, args.runs)
+                print(f"{size:>9} {mode:>7} {result['import_ms']:>7.0f} ms {result['create_app_ms']:>7.0f} ms "
+                      f"{result['first_request_ms']:>8.0f} ms {result['first_question_ms']:>9.0f} ms")
+        finally:
+            shutil.rmtree(base, ignore_errors=True)
+    print(f"(median of {args.runs} fresh interpreters; times to the first request and question include the import)")
+
+    base = tempfile.mkdtemp(prefix="bench_startup_")
+    try:
+        generate_bank(base, 0)
+        packages = import_report(base)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+    print(f"\nimport time of the application start: {sum(packages.values()):.0f} ms")
+    for package, ms in list(packages.items())[:args.top]:
+        print(f"{package:>24} {ms:>7.1f} ms")
+    loaded = [package for package in ANKI_DEPENDENCIES if package in packages]
+    print(f"Anki dependencies imported at startup: {', '.join(loaded) if loaded else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ import sys
 import webbrowser
 from threading import Timer
 import argparse
+import multiprocessing
 
 # Add src directory to Python path
 src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
@@ -67,4 +68,6 @@ def main() -> None:
         serve(app, host='localhost', port=8080)
 
 if __name__ == '__main__':
+    # Card formatting workers re-run this script in the frozen executable
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
@@ -1,9 +1,16 @@
 # -*- mode: python ; coding: utf-8 -*-
 
-# Add this at the top of the file
+import os
+import sys
+
+sys.path.append(os.path.abspath('src'))
+
+# Compile the question bank into one file, mapped by the executable instead of unpacking every question
+from svt_app.services.question_pack import pack_questions
+pack_questions(os.path.join('assets', 'Data'), os.path.join('build', 'questions.pack'))
+
 added_files = [
-    ('assets/Data/fill_the_blanks', 'assets/Data/fill_the_blanks'),
-    ('assets/Data/image_matching', 'assets/Data/image_matching'),
+    ('build/questions.pack', 'assets'),
 ]
 
 a = Analysis(
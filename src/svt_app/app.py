@@ -11,14 +11,21 @@ from svt_app.controllers.settings_controller import settings_bp
 from svt_app.controllers.image_matching_controller import image_matching_bp
 from svt_app.routes.anki_routes import anki_bp
 from svt_app.routes.anki_training_routes import training_bp
+from svt_app.services.service_container import EXTENSION_KEY, ServiceContainer
 from svt_app.utils.logging_utils import conditional_log, log_if_enabled
+from svt_app.utils.request_metrics import init_request_metrics
+from svt_app.utils.request_tracing import init_request_tracing
 from svt_app.state import GameScores
 
 @log_if_enabled()
-def create_app() -> Flask:
+def create_app(services: Optional[ServiceContainer] = None) -> Flask:
     """
     Create and configure the Flask application.
     
+    Args:
+        services: Container of the services shared by the blueprints, a new
+            one by default. Services are only built when a request needs them.
+    
     Returns:
         Flask: The configured Flask application instance.
     """
@@ -31,16 +38,19 @@ def create_app() -> Flask:
     
     conditional_log("Debug mode is {}", app.debug)
 
-    @app.before_request
-    def before_request() -> None:
-        """Log session data before each request."""
-        conditional_log("Session before request: {}", dict(session))
+    # Time every request first so the metrics include the other hooks
+    init_request_metrics(app)
+
+    # Keep sampled and slow requests in a ring buffer instead of dumping the session on every call
+    init_request_tracing(app)
 
-    @app.after_request
-    def after_request(response: Any) -> Any:
-        """Log session data after each request."""
-        conditional_log("Session after request: {}", dict(session))
-        return response
+    # Build services on first use instead of when the blueprints are imported
+    services = services or ServiceContainer()
+    # Answers and scores are journaled through the container: the journal is opened, and a
+    # previous run replayed, by the first request that reads or records one
+    app.extensions[EXTENSION_KEY] = services
+    # Anki answers queued by a previous run are sent without waiting for a training page
+    services.resume_answer_outbox()
 
     # Register blueprints
     conditional_log("Registering blueprints")
@@ -1,10 +1,30 @@
 """Configuration for Anki integration."""
 import os
-from typing import Optional
-from dotenv import load_dotenv
+from typing import Dict, Optional
+
+_env_loaded = False
+ENV_FILE = '.env.local'
+DEFAULT_OUTBOX_PATH = 'assets/Data/anki_outbox.sqlite3'
+
+
+def _getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Read an environment variable, loading .env.local the first time.
+    
+    Args:
+        name: Name of the variable
+        default: Value returned when the variable is not set
+        
+    Returns:
+        The value of the variable, or default
+    """
+    global _env_loaded
+    if not _env_loaded:
+        # Imported here so the application starts without python-dotenv until Anki is used
+        from dotenv import load_dotenv
+        load_dotenv(ENV_FILE)
+        _env_loaded = True
+    return os.getenv(name, default)
 
-# Load environment variables from .env.local
-load_dotenv('.env.local')
 
 class AnkiConfig:
     """Configuration class for Anki settings."""
@@ -17,8 +37,8 @@ class AnkiConfig:
             tuple: (email, password) from environment variables
         """
         return (
-            os.getenv('ANKI_EMAIL'),
-            os.getenv('ANKI_PASSWORD')
+            _getenv('ANKI_EMAIL'),
+            _getenv('ANKI_PASSWORD')
         )
     
     @staticmethod
@@ -28,6 +48,81 @@ class AnkiConfig:
         Returns:
             str: The API endpoint URL
         """
-        host = os.getenv('ANKI_HOST', 'localhost')
-        port = os.getenv('ANKI_PORT', '8765')
-        return f"http://{host}:{port}" 
\ No newline at end of file
+        host = _getenv('ANKI_HOST', 'localhost')
+        port = _getenv('ANKI_PORT', '8765')
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def get_http_settings() -> Dict[str, float]:
+        """Get the AnkiConnect HTTP client settings.
+        
+        Returns:
+            Dict[str, float]: Pool size (ANKI_POOL_SIZE), default timeout in
+            seconds (ANKI_TIMEOUT), retries of idempotent actions
+            (ANKI_MAX_RETRIES) and base backoff in seconds (ANKI_RETRY_BACKOFF)
+        """
+        return {
+            'pool_size': int(_getenv('ANKI_POOL_SIZE', '4')),
+            'timeout': float(_getenv('ANKI_TIMEOUT', '5')),
+            'max_retries': int(_getenv('ANKI_MAX_RETRIES', '2')),
+            'backoff': float(_getenv('ANKI_RETRY_BACKOFF', '0.1'))
+        }
+
+    @staticmethod
+    def get_answer_window() -> float:
+        """Get how long answer submissions are grouped before being sent.
+        
+        Returns:
+            float: The window in seconds, from ANKI_ANSWER_WINDOW_MS (default 50)
+        """
+        return float(_getenv('ANKI_ANSWER_WINDOW_MS', '50')) / 1000
+
+    @staticmethod
+    def get_card_cache_ttl() -> float:
+        """Get how long the cards of a deck are served without asking Anki.
+        
+        Returns:
+            float: The TTL in seconds, from ANKI_CARD_CACHE_TTL (default 30)
+        """
+        return float(_getenv('ANKI_CARD_CACHE_TTL', '30'))
+
+    @staticmethod
+    def get_outbox_path() -> str:
+        """Get the path of the database holding the answers not sent to Anki yet.
+        
+        Returns:
+            str: The path, from ANKI_OUTBOX_PATH (default assets/Data/anki_outbox.sqlite3)
+        """
+        return _getenv('ANKI_OUTBOX_PATH', DEFAULT_OUTBOX_PATH)
+
+    @staticmethod
+    def peek_outbox_path() -> str:
+        """Get the outbox path at startup, before Anki is used.
+        
+        Same value as get_outbox_path, but python-dotenv is only imported
+        when a .env.local file could set it.
+        
+        Returns:
+            str: The path of the outbox database
+        """
+        if _env_loaded or os.path.exists(ENV_FILE):
+            return AnkiConfig.get_outbox_path()
+        return os.getenv('ANKI_OUTBOX_PATH', DEFAULT_OUTBOX_PATH)
+
+    @staticmethod
+    def get_breaker_settings() -> Dict[str, float]:
+        """Get the circuit breaker settings of the AnkiConnect connection.
+        
+        Returns:
+            Dict[str, float]: Consecutive failures opening the circuit
+            (ANKI_BREAKER_THRESHOLD), seconds before a trial request
+            (ANKI_BREAKER_RESET), seconds a connection test is reused
+            (ANKI_HEALTH_TTL) and seconds between two background probes
+            (ANKI_PROBE_INTERVAL)
+        """
+        return {
+            'failure_threshold': int(_getenv('ANKI_BREAKER_THRESHOLD', '3')),
+            'reset_timeout': float(_getenv('ANKI_BREAKER_RESET', '10')),
+            'health_ttl': float(_getenv('ANKI_HEALTH_TTL', '5')),
+            'probe_interval': float(_getenv('ANKI_PROBE_INTERVAL', '2'))
+        } 
\ No newline at end of file
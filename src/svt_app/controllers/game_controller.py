@@ -3,23 +3,21 @@
 from typing import Dict, Any, List, Optional
 import os
 import json
-from flask import Blueprint, render_template, request, redirect, url_for, jsonify, session
+from flask import Blueprint, render_template, request, redirect, url_for, jsonify, session, current_app
 import subprocess
 
-from svt_app.services.question_service import QuestionService
-from svt_app.services.texte_a_trous_service import TexteATrousService
-from svt_app.utils.logging_utils import conditional_log, log_if_enabled
+from svt_app.services.question_index import normalize_folder
+from svt_app.services.question_tree_pages import DEFAULT_PAGE_SIZE, page_children
+from svt_app.services.service_container import get_services
+from svt_app.utils.logging_utils import log_if_enabled, module_logger
 from svt_app.controllers.settings_controller import load_settings
-from svt_app.state import GameScores
+from svt_app.state import FocusState, GameScores
+
+log = module_logger(__name__)
 
 # Create a Blueprint for the game routes
 game_bp = Blueprint("game", __name__)
 
-# Initialize the services
-conditional_log("Initializing services")
-question_service = QuestionService()
-texte_a_trous_service = TexteATrousService(question_service)
-
 @game_bp.route("/texte_a_trous")
 def texte_a_trous() -> str:
     """
@@ -30,13 +28,15 @@ def texte_a_trous() -> str:
     """
     # Get question ID from request parameters
     question_id = request.args.get("question_id", None, type=int)
+    # Folder of the question, since several folders may reuse an ID
+    question_folder = request.args.get("folder", None)
     
     # Get focused folder from request parameters
     focused_folder = request.args.get("focus", "")
-    conditional_log("Texte à trous: received focus parameter: '{}'", focused_folder)
+    log("Texte à trous: received focus parameter: '{}'", focused_folder)
     
     # Get game data from service
-    game_data = texte_a_trous_service.get_game_data(question_id, focused_folder)
+    game_data = get_services().texte_a_trous_service.get_game_data(question_id, focused_folder, question_folder)
     
     # Render template with game data
     return render_template("texte_a_trous.html", **game_data)
@@ -50,13 +50,13 @@ def relier_images() -> str:
     Returns:
         str: Rendered HTML template for the 'Relier les images' game.
     """
-    questions = question_service.get_image_matching_questions()
+    questions = get_services().question_service.get_image_matching_questions()
     
     # Get the current question ID from the query parameters, default to 1
     question_id = request.args.get("question_id", 1, type=int)
     
     # Get the current question
-    current_question = question_service.get_image_matching_question_by_id(question_id)
+    current_question = get_services().question_service.get_image_matching_question_by_id(question_id)
     
     # If the question doesn't exist, redirect to the first question
     if current_question is None and questions:
@@ -89,104 +89,65 @@ def check_answer() -> Dict[str, Any]:
     """
     try:
         data = request.get_json()
-        conditional_log("Received answer data: {}", data)
+        log("Received answer data: {}", data)
         
         if not data:
-            conditional_log("No data provided in answer submission")
+            log("No data provided in answer submission")
             return jsonify({"success": False, "message": "No data provided"})
         
         game_type = data.get("game_type")
         question_id = data.get("question_id")
         answer = data.get("answer")
         focused_folder = data.get("focused_folder", "")
+        # Folder of the question shown on the page, sent by clients that know it
+        question_folder = data.get("question_folder")
 
-        conditional_log("Processing answer - Game: {}, Question: {}, Answer: {}, Focused: '{}'",
+        log("Processing answer - Game: {}, Question: {}, Answer: {}, Focused: '{}'",
                  game_type, question_id, answer, focused_folder)
 
         # Validate required fields
         if not all([game_type, question_id is not None, answer]):
-            conditional_log("Missing required fields in answer submission")
+            log("Missing required fields in answer submission")
             return jsonify({"success": False, "message": "Missing required fields"})
 
         # Ensure question_id is an integer
         try:
             question_id = int(question_id)
         except (TypeError, ValueError):
-            conditional_log("Invalid question ID format: {}", question_id)
+            log("Invalid question ID format: {}", question_id)
             return jsonify({"success": False, "message": "Invalid question ID"})
 
         # Check the answer based on the game type
         if game_type == "texte_a_trous":
+            # Without an explicit focus, the persisted focus applies
+            focused_folder = focused_folder or FocusState.get_focus() or ""
             # Find the question file
-            base_dir = "assets/Data/fill_the_blanks"
-            file_path = None
             correct_answer_value = None
-
-            # Try multiple filename formats
-            question_file_formats = [
-                f"question{question_id:02d}.json",  # question01.json
-                f"question{question_id:03d}.json",  # question001.json
-                f"question{question_id}.json"       # question1.json
-            ]
-
-            if focused_folder:
-                # If focused, look only in the focused folder
-                focused_path = os.path.join(base_dir, focused_folder)
-                conditional_log("Looking for question {} in focused folder: {}", question_id, focused_path)
-
-                for question_file in question_file_formats:
-                    test_path = os.path.join(focused_path, question_file)
-                    if os.path.exists(test_path):
-                        file_path = test_path
-                        conditional_log("Found question file: {}", file_path)
-                        break
+            log("Looking for question {} (focused: '{}')", question_id, focused_folder)
+            if question_folder is not None:
+                file_path = get_services().question_path_resolver.resolve_in(question_folder, question_id)
             else:
-                # If not focused, search everywhere (but skip backups)
-                for question_file in question_file_formats:
-                    # First try root directory
-                    root_path = os.path.join(base_dir, question_file)
-                    if os.path.exists(root_path):
-                        file_path = root_path
-                        break
-
-                    # Then search subdirectories
-                    if not file_path:
-                        for root, dirs, files in os.walk(base_dir):
-                            # Skip backup directories
-                            dirs[:] = [d for d in dirs if not d.startswith('.focused_backup_')]
-
-                            if question_file in files:
-                                test_path = os.path.join(root, question_file)
-                                if '.focused_backup_' not in test_path:
-                                    file_path = test_path
-                                    break
-
-                    if file_path:
-                        break
+                file_path = get_services().question_path_resolver.resolve(focused_folder, question_id)
 
             if not file_path:
-                conditional_log("Could not find file for question {}", question_id)
+                log("Could not find file for question {}", question_id)
                 return jsonify({"success": False, "message": "Question file not found"})
 
-            # Load question data from file
+            # Load question data from file, including answers not compacted into it yet
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    question_data = json.load(f)
-                    correct_answer_value = question_data.get('correct_answer')
+                question_data = get_services().answer_journal.read_question(file_path)
+                correct_answer_value = question_data.get('correct_answer')
             except Exception as e:
-                conditional_log("Error reading question file {}: {}", file_path, str(e))
+                log("Error reading question file {}: {}", file_path, str(e))
                 return jsonify({"success": False, "message": "Error reading question file"})
 
             is_correct = answer == correct_answer_value
-            conditional_log("Answer is {} (expected: {}, got: {})", "correct" if is_correct else "incorrect", correct_answer_value, answer)
+            log("Answer is {} (expected: {}, got: {})", "correct" if is_correct else "incorrect", correct_answer_value, answer)
             
             try:
-                # Load existing data
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    question_data = json.load(f)
-                
+                completed: Optional[bool] = None
                 # Update statistics
-                stats = question_data.get('statistics', {'correct_answers': 0, 'wrong_answers': 0})
+                stats = dict(question_data.get('statistics', {'correct_answers': 0, 'wrong_answers': 0}))
                 if is_correct:
                     stats['correct_answers'] = stats.get('correct_answers', 0) + 1
                     GameScores.increment_score("texte_a_trous")
@@ -196,121 +157,69 @@ def check_answer() -> Dict[str, Any]:
                     # Only mark as completed when auto_validate is true
                     if settings.get('auto_validate', True):
                         question_data['completed'] = True
-                        conditional_log("Question {} marked as completed", question_id)
+                        completed = True
+                        log("Question {} marked as completed", question_id)
                 else:
                     stats['wrong_answers'] = stats.get('wrong_answers', 0) + 1
                 
                 question_data['statistics'] = stats
                 
-                # Save updated data
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(question_data, f, indent=4, ensure_ascii=False)
+                # Journal the answer; the background compactor rewrites the file later
+                get_services().answer_journal.record_answer(file_path, is_correct, completed)
                 
-                conditional_log("Updated question data: {}", question_data)
+                log("Updated question data: {}", question_data)
                 
-                # Find the next available question ID
-                active_questions = []
-                conditional_log("Finding next available question after ID {} (focused: '{}')", question_id, focused_folder)
-
-                # Determine search path based on focus
-                if focused_folder:
-                    search_path = os.path.join(base_dir, focused_folder)
-                    conditional_log("Searching for active questions in focused folder: {}", search_path)
-                else:
-                    search_path = base_dir
-                    conditional_log("Searching for active questions in all folders")
-
-                # Find all question files in the search path
-                try:
-                    if os.path.exists(search_path):
-                        for item in sorted(os.listdir(search_path)):
-                            if item.startswith("question") and item.endswith(".json"):
-                                item_path = os.path.join(search_path, item)
-
-                                # Extract question ID
-                                import re
-                                match = re.search(r'question(\d+)\.json', item)
-                                if not match:
-                                    continue
-
-                                q_id = int(match.group(1))
-
-                                try:
-                                    with open(item_path, 'r', encoding='utf-8') as f:
-                                        q_data = json.load(f)
-                                        if not q_data.get('completed', False):
-                                            active_questions.append(q_id)
-                                            conditional_log("Found active question: {}", q_id)
-                                except Exception as e:
-                                    conditional_log("Error reading question file {}: {}", item_path, str(e))
-                                    continue
-                except Exception as e:
-                    conditional_log("Error searching for questions: {}", str(e))
-
-                conditional_log("Active (non-completed) questions: {}", active_questions)
+                # Keep the index and its active-question sets in sync with the file
+                get_services().question_service.update_fill_in_blank_question(file_path, question_data)
+
+                # Find the next available question from the sorted active (folder, ID) pairs, without reading files
+                scope = normalize_folder(focused_folder) if focused_folder else None
+                current_folder = normalize_folder(os.path.dirname(os.path.relpath(
+                    file_path, get_services().question_service.fill_blanks_path)))
+                active_questions = get_services().question_service.fill_in_blank_index.active
+                if log.enabled:
+                    log("Finding next available question after {}/{} (focused: '{}', {} remaining)",
+                        current_folder, question_id, focused_folder, active_questions.count(scope))
+                next_key = active_questions.next_key(scope, current_folder, question_id)
+                next_question_folder, next_question_id = next_key if next_key is not None else (None, None)
                 
-                # Find the next available question ID after the current one
-                next_question_id = None
-                
-                if active_questions:
-                    # Sort active questions to ensure proper order
-                    active_questions.sort()
-                    conditional_log("Sorted active questions: {}", active_questions)
-                    
-                    # Try to find the next question after current one
-                    for q_id in active_questions:
-                        if q_id > question_id:
-                            next_question_id = q_id
-                            conditional_log("Found next question ID: {}", next_question_id)
-                            break
-                    
-                    # If no next question found, loop back to the first active question
-                    if next_question_id is None:
-                        # Make sure we don't return to the current question
-                        remaining_questions = [q for q in active_questions if q != question_id]
-                        if remaining_questions:
-                            next_question_id = remaining_questions[0]
-                            conditional_log("No next question found, looping back to first remaining question: {}", next_question_id)
-                        else:
-                            conditional_log("No other active questions available")
-                else:
-                    conditional_log("No active questions found")
-                
-                conditional_log("Final next_question_id: {}", next_question_id)
+                log("Final next question: {} in '{}'", next_question_id, next_question_folder)
                 
                 # Create the response data
                 response_data = {
                     "success": True,
                     "correct": is_correct,
                     "score": GameScores.get_score("texte_a_trous"),
-                    "next_question_id": next_question_id
+                    "next_question_id": next_question_id,
+                    "next_question_folder": next_question_folder
                 }
-                conditional_log("Sending response: {}", response_data)
+                log("Sending response: {}", response_data)
                 return jsonify(response_data)
                 
             except Exception as e:
-                conditional_log("Error processing question: {}", str(e))
+                log("Error processing question: {}", str(e))
                 return jsonify({
                     "success": True,
                     "correct": is_correct,
                     "score": GameScores.get_score("texte_a_trous"),
                     "next_question_id": None,
+                    "next_question_folder": None,
                     "error": str(e)
                 })
                 
         elif game_type == "relier_images":
-            question = question_service.get_image_matching_question_by_id(question_id)
-            conditional_log("Image matching question: {}", question)
+            question = get_services().question_service.get_image_matching_question_by_id(question_id)
+            log("Image matching question: {}", question)
             if question and answer == question.correct_word:
                 GameScores.increment_score("relier_images")
                 return jsonify({"success": True, "correct": True, "score": GameScores.get_score("relier_images")})
             return jsonify({"success": True, "correct": False, "score": GameScores.get_score("relier_images")})
         
-        conditional_log("Invalid game type")
+        log("Invalid game type")
         return jsonify({"success": False, "message": "Invalid game type"})
     
     except Exception as e:
-        conditional_log("Error processing request: {}", str(e))
+        log("Error processing request: {}", str(e))
         return jsonify({"success": False, "message": "Une erreur est survenue lors de la validation"})
 
 
@@ -326,7 +235,7 @@ def reset_scores() -> Dict[str, Any]:
     """
     GameScores.reset_scores()  # Use the correct method name
     
-    conditional_log("Scores reset - texte_a_trous: {}, relier_images: {}", 
+    log("Scores reset - texte_a_trous: {}, relier_images: {}", 
               GameScores.get_score("texte_a_trous"), GameScores.get_score("relier_images"))
     
     return jsonify({"success": True})
@@ -415,248 +324,133 @@ def save_question() -> Dict[str, Any]:
         filepath = os.path.join(base_dir, filename)
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(question_data, f, ensure_ascii=False, indent=2)
+        if game_type == 'texte_a_trous':
+            get_services().question_path_resolver.invalidate("")
+        get_services().question_tree_cache.invalidate()
         
         return jsonify({"success": True, "message": "Question créée avec succès"})
     
     except Exception as e:
-        conditional_log("Error saving question: {}", str(e))
+        log("Error saving question: {}", str(e))
         return jsonify({"success": False, "message": "Une erreur est survenue lors de la sauvegarde de la question"})
 
 
 
-@game_bp.route("/questions_tree")
-def questions_tree() -> str:
+def _resolve_tree_request() -> tuple:
     """
-    Render the questions tree visualization page.
-    
+    Read the game type and focus of a questions tree request.
+
     Returns:
-        str: Rendered HTML template for the questions tree.
+        tuple: The game type, its question directory and the effective focused folder.
     """
-    # Reload questions to capture any newly created ones
-    question_service.load_questions()
-    
     # Get the game type from query parameters, default to texte_a_trous
     game_type = request.args.get('type', 'texte_a_trous')
     
     # Get the focused folder from query parameters
     focused_folder = request.args.get('focus', '')
-    conditional_log("Received focus parameter: '{}'", focused_folder)
+    log("Received focus parameter: '{}'", focused_folder)
     
     # Validate game type
     if game_type not in ['texte_a_trous', 'relier_images']:
         game_type = 'texte_a_trous'
 
-    # Check if there's an active focus by looking for backup directories
-    def find_active_focus(directory: str, current_relative_path: str = "") -> Optional[str]:
-        """
-        Recursively find if there's an active focus by looking for backup directories.
-        Returns the focused folder path (relative to base_dir) if found, None otherwise.
-        """
-        conditional_log("Searching for active focus in: {} (relative: '{}')", directory, current_relative_path)
-        try:
-            items = os.listdir(directory)
-            conditional_log("Items in directory: {}", items)
-
-            for item in items:
-                item_path = os.path.join(directory, item)
-
-                if item.startswith('.focused_backup_'):
-                    # Extract the focused folder name from the backup directory name
-                    focused_folder_name = item.replace('.focused_backup_', '')
-                    conditional_log("Found backup directory for: '{}'", focused_folder_name)
-
-                    # Check if the focused folder still exists
-                    focused_folder_path = os.path.join(directory, focused_folder_name)
-                    if os.path.exists(focused_folder_path):
-                        # Get relative path from base_dir
-                        if current_relative_path:
-                            result = os.path.join(current_relative_path, focused_folder_name)
-                        else:
-                            result = focused_folder_name
-                        conditional_log("Returning focused folder: '{}'", result)
-                        return result
-                    else:
-                        conditional_log("Focused folder does not exist: '{}'", focused_folder_path)
-
-                # Recursively search in subdirectories (but skip backup directories)
-                elif os.path.isdir(item_path) and not item.startswith('.focused_backup_'):
-                    new_relative_path = os.path.join(current_relative_path, item) if current_relative_path else item
-                    result = find_active_focus(item_path, new_relative_path)
-                    if result:
-                        return result
-
-        except Exception as e:
-            conditional_log("Error finding active focus in {}: {}", directory, str(e))
-        return None
-
-    def get_questions_in_directory(directory: str, relative_path: str = "") -> List[Dict[str, Any]]:
-        """
-        Recursively get all questions in a directory and its subdirectories.
-        
-        Args:
-            directory: The absolute directory path
-            relative_path: The relative path from the base questions directory
-            
-        Returns:
-            List[Dict[str, Any]]: List of questions and folders
-        """
-        items: List[Dict[str, Any]] = []
-        
-        try:
-            # Make sure directory exists
-            if not os.path.exists(directory):
-                conditional_log("Directory does not exist: {}", directory)
-                return items
-                
-            # Get all items in the directory
-            dir_contents = os.listdir(directory)
-            conditional_log("Found {} items in directory {}", len(dir_contents), directory)
-            
-            for item in sorted(dir_contents):
-                full_path = os.path.join(directory, item)
-                rel_path = os.path.join(relative_path, item) if relative_path else item
-
-                # Skip backup directories (hidden folders used for focus)
-                if item.startswith('.focused_backup_'):
-                    conditional_log("Skipping backup directory: {}", item)
-                    continue
-
-                if os.path.isdir(full_path):
-                    # If it's a directory, recursively get its contents
-                    conditional_log("Found directory: {}", full_path)
-                    subfolder_items = get_questions_in_directory(full_path, rel_path)
-
-                    # Add folder even if empty
-                    folder_data = {
-                        'type': 'folder',
-                        'name': item,
-                        'path': rel_path,
-                        'children': subfolder_items
-                    }
-                    items.append(folder_data)
-                    conditional_log("Added folder: {} with {} children", item, len(subfolder_items))
-                    
-                elif item.startswith("question") and item.endswith(".json"):
-                    # If it's a question file, add it to the list
-                    try:
-                        with open(full_path, 'r', encoding='utf-8') as f:
-                            question_data = json.load(f)
-                            items.append({
-                                'type': 'question',
-                                'id': item[8:11],  # Extract number from filename
-                                'text': question_data.get('text', 'No text available'),
-                                'file': rel_path,
-                                'completed': question_data.get('completed', False),
-                                'statistics': question_data.get('statistics', {
-                                    'correct_answers': 0,
-                                    'wrong_answers': 0
-                                })
-                            })
-                            conditional_log("Added question: {}", item)
-                    except Exception as e:
-                        conditional_log("Error reading question file {}: {}", full_path, str(e))
-                        continue
-        except Exception as e:
-            conditional_log("Error reading directory {}: {}", directory, str(e))
-            return []
-        
-        return items
-
-    def get_questions_in_focused_folder(directory: str, focused_folder: str) -> List[Dict[str, Any]]:
-        """
-        Get questions only from a specific focused folder (no subfolders).
-        
-        Args:
-            directory: The absolute base directory path
-            focused_folder: The relative path of the folder to focus on
-            
-        Returns:
-            List[Dict[str, Any]]: List of questions from the focused folder only
-        """
-        items: List[Dict[str, Any]] = []
-        
-        try:
-            # Build the full path to the focused folder
-            focused_path = os.path.join(directory, focused_folder) if focused_folder else directory
-            
-            # Make sure the focused directory exists
-            if not os.path.exists(focused_path):
-                conditional_log("Focused directory does not exist: {}", focused_path)
-                return items
-                
-            # Get all items in the focused directory only
-            dir_contents = os.listdir(focused_path)
-            conditional_log("Found {} items in focused directory {}", len(dir_contents), focused_path)
-            
-            for item in sorted(dir_contents):
-                full_path = os.path.join(focused_path, item)
-                rel_path = os.path.join(focused_folder, item) if focused_folder else item
-                
-                if item.startswith("question") and item.endswith(".json"):
-                    # If it's a question file, add it to the list
-                    try:
-                        with open(full_path, 'r', encoding='utf-8') as f:
-                            question_data = json.load(f)
-                            items.append({
-                                'type': 'question',
-                                'id': item[8:11],  # Extract number from filename
-                                'text': question_data.get('text', 'No text available'),
-                                'file': rel_path,
-                                'completed': question_data.get('completed', False),
-                                'statistics': question_data.get('statistics', {
-                                    'correct_answers': 0,
-                                    'wrong_answers': 0
-                                })
-                            })
-                            conditional_log("Added focused question: {}", item)
-                    except Exception as e:
-                        conditional_log("Error reading question file {}: {}", full_path, str(e))
-                        continue
-                        
-        except Exception as e:
-            conditional_log("Error reading focused directory {}: {}", focused_path, str(e))
-            return []
-        
-        return items
-    
     # Set the base directory based on game type
     base_dir = "assets/Data/fill_the_blanks" if game_type == "texte_a_trous" else "assets/Data/image_matching"
 
     # Create the base directory if it doesn't exist
     if not os.path.exists(base_dir):
         os.makedirs(base_dir)
-        conditional_log("Created directory: {}", base_dir)
+        log("Created directory: {}", base_dir)
 
     # If no focused_folder specified in URL, check if there's an active focus
-    if not focused_folder:
-        active_focus = find_active_focus(base_dir)
+    if not focused_folder and game_type == "texte_a_trous":
+        active_focus = FocusState.get_focus()
         if active_focus:
             focused_folder = active_focus
-            conditional_log("Found active focus: {}", focused_folder)
+            log("Found active focus: {}", focused_folder)
 
     # Check if we have a focused folder
     if focused_folder:
         # Validate the focused folder path exists
         focused_path = os.path.join(base_dir, focused_folder)
         if not os.path.exists(focused_path) or not os.path.isdir(focused_path):
-            conditional_log("Invalid focused folder: {}", focused_folder)
+            log("Invalid focused folder: {}", focused_folder)
             focused_folder = ""  # Reset if invalid
 
-    if focused_folder:
-        # Get questions only from the focused folder
-        conditional_log("Getting questions from focused folder: {}", focused_folder)
-        tree_data = get_questions_in_focused_folder(base_dir, focused_folder)
-        conditional_log("Found {} questions in focused folder", len(tree_data))
-        conditional_log("Tree data items: {}", [item.get('file', item.get('name', 'unknown')) for item in tree_data])
-    else:
-        # Get all questions and folders starting from the base directory
-        conditional_log("Scanning directory tree starting from: {}", base_dir)
-        tree_data = get_questions_in_directory(base_dir)
-        conditional_log("Found {} top-level items in tree", len(tree_data))
+    return game_type, base_dir, focused_folder
+
+
+@game_bp.route("/questions_tree")
+def questions_tree() -> str:
+    """
+    Render the questions tree visualization page.
+    
+    Returns:
+        str: Rendered HTML template for the questions tree.
+    """
+    game_type, base_dir, focused_folder = _resolve_tree_request()
+
+    # The tree is only rebuilt when questions or folders changed since the last render
+    tree_data = get_services().question_tree_cache.snapshot(game_type, base_dir, focused_folder).tree
+    log("Found {} top-level items in tree", len(tree_data))
     
     return render_template("questions_tree.html", tree_data=tree_data, game_type=game_type, focused_folder=focused_folder)
 
 
+@game_bp.route("/questions_tree.json")
+def questions_tree_json() -> Any:
+    """
+    Return the questions tree as JSON with a strong ETag.
+
+    A request whose If-None-Match matches the current tree gets an empty
+    304 response.
+
+    Returns:
+        Any: The JSON response, or a 304 response.
+    """
+    game_type, base_dir, focused_folder = _resolve_tree_request()
+    snapshot = get_services().question_tree_cache.snapshot(game_type, base_dir, focused_folder)
+    response = current_app.response_class(snapshot.body, mimetype="application/json")
+    response.set_etag(snapshot.etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
+
+@game_bp.route("/questions_tree/children")
+def questions_tree_children() -> Dict[str, Any]:
+    """
+    Return one page of the direct children of a folder of the questions tree.
+
+    Query parameters: type and focus as for the tree page, path (folder
+    relative to the tree root), cursor (from the previous page) and limit.
+
+    Returns:
+        Dict[str, Any]: JSON response with the children and the folder aggregates.
+    """
+    game_type, base_dir, focused_folder = _resolve_tree_request()
+    snapshot = get_services().question_tree_cache.snapshot(game_type, base_dir, focused_folder)
+    try:
+        page = page_children(snapshot, request.args.get('path', ''), request.args.get('cursor') or None,
+                             request.args.get('limit', DEFAULT_PAGE_SIZE, type=int))
+    except ValueError as e:
+        log("Invalid tree page request: {}", str(e))
+        return jsonify({"success": False, "message": "Invalid cursor"}), 400
+    if page is None:
+        return jsonify({"success": False, "message": "Folder not found"}), 404
+    return jsonify({"success": True, "game_type": game_type, "focused_folder": focused_folder, **page})
+
+
+@game_bp.route("/questions_tree/cache_stats")
+def questions_tree_cache_stats() -> Dict[str, Any]:
+    """
+    Report the hit rate of the questions tree cache.
+
+    Returns:
+        Dict[str, Any]: JSON response with the cache counters.
+    """
+    return jsonify(get_services().question_tree_cache.stats())
+
+
 @game_bp.route("/toggle_question_completion", methods=["POST"])
 def toggle_question_completion() -> Dict[str, Any]:
     """
@@ -667,6 +461,8 @@ def toggle_question_completion() -> Dict[str, Any]:
     """
     try:
         data = request.get_json()
+        # Fold journaled answers first so none of them points to a file that is about to change
+        get_services().answer_journal.compact()
         if not data or 'file' not in data:
             return jsonify({"success": False, "message": "No file specified"})
         
@@ -691,6 +487,7 @@ def toggle_question_completion() -> Dict[str, Any]:
         # Save updated question data
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(question_data, f, ensure_ascii=False, indent=2)
+        get_services().question_service.update_fill_in_blank_question(file_path, question_data)
         
         return jsonify({
             "success": True, 
@@ -699,7 +496,7 @@ def toggle_question_completion() -> Dict[str, Any]:
         })
     
     except Exception as e:
-        conditional_log("Error toggling question completion: {}", str(e))
+        log("Error toggling question completion: {}", str(e))
         return jsonify({"success": False, "message": "Une erreur est survenue lors de la mise à jour de la question"})
 
 
@@ -713,6 +510,8 @@ def delete_question() -> Dict[str, Any]:
     """
     try:
         data = request.get_json()
+        # Fold journaled answers first so none of them points to a file that is about to change
+        get_services().answer_journal.compact()
         if not data or 'file' not in data:
             return jsonify({"success": False, "message": "No file specified"})
         
@@ -729,11 +528,13 @@ def delete_question() -> Dict[str, Any]:
         
         # Delete the file
         os.remove(file_path)
+        get_services().question_path_resolver.invalidate(os.path.dirname(filename))
+        get_services().question_tree_cache.invalidate()
         
         return jsonify({"success": True, "message": "Question supprimée avec succès"})
     
     except Exception as e:
-        conditional_log("Error deleting question: {}", str(e))
+        log("Error deleting question: {}", str(e))
         return jsonify({"success": False, "message": "Une erreur est survenue lors de la suppression de la question"})
 
 
@@ -767,6 +568,7 @@ def create_folder() -> Dict[str, Any]:
         
         # Create the folder
         os.makedirs(new_folder_path)
+        get_services().question_tree_cache.invalidate()
         
         return jsonify({
             "success": True,
@@ -778,7 +580,7 @@ def create_folder() -> Dict[str, Any]:
         })
     
     except Exception as e:
-        conditional_log("Error creating folder: {}", str(e))
+        log("Error creating folder: {}", str(e))
         return jsonify({"success": False, "message": "Une erreur est survenue lors de la création du dossier"})
 
 
@@ -792,6 +594,8 @@ def rename_folder() -> Dict[str, Any]:
     """
     try:
         data = request.get_json()
+        # Fold journaled answers first so none of them points to a file that is about to change
+        get_services().answer_journal.compact()
         if not data or 'old_path' not in data or 'new_name' not in data:
             return jsonify({"success": False, "message": "Missing required fields"})
         
@@ -815,6 +619,9 @@ def rename_folder() -> Dict[str, Any]:
         
         # Rename the folder
         os.rename(old_full_path, new_full_path)
+        get_services().question_path_resolver.invalidate(os.path.dirname(old_path))
+        get_services().question_tree_cache.invalidate()
+        FocusState.follow_move(old_path, os.path.join(os.path.dirname(old_path), new_name))
         
         return jsonify({
             "success": True,
@@ -823,7 +630,7 @@ def rename_folder() -> Dict[str, Any]:
         })
     
     except Exception as e:
-        conditional_log("Error renaming folder: {}", str(e))
+        log("Error renaming folder: {}", str(e))
         return jsonify({"success": False, "message": "Une erreur est survenue lors du renommage du dossier"})
 
 
@@ -837,6 +644,8 @@ def delete_folder() -> Dict[str, Any]:
     """
     try:
         data = request.get_json()
+        # Fold journaled answers first so none of them points to a file that is about to change
+        get_services().answer_journal.compact()
         if not data or 'path' not in data:
             return jsonify({"success": False, "message": "Missing folder path"})
         
@@ -853,6 +662,9 @@ def delete_folder() -> Dict[str, Any]:
         # Delete the folder and all its contents
         import shutil
         shutil.rmtree(full_path)
+        get_services().question_path_resolver.invalidate(folder_path)
+        get_services().question_tree_cache.invalidate()
+        FocusState.follow_move(folder_path, None)
         
         return jsonify({
             "success": True,
@@ -860,7 +672,7 @@ def delete_folder() -> Dict[str, Any]:
         })
     
     except Exception as e:
-        conditional_log("Error deleting folder: {}", str(e))
+        log("Error deleting folder: {}", str(e))
         return jsonify({"success": False, "message": "Une erreur est survenue lors de la suppression du dossier"})
 
 
@@ -874,58 +686,60 @@ def move_items() -> Dict[str, Any]:
         Dict[str, Any]: JSON response indicating success or failure.
     """
     try:
-        conditional_log("Move items request received")
+        log("Move items request received")
         data = request.get_json()
-        conditional_log("Request data: {}", data)
+        # Fold journaled answers first so none of them points to a file that is about to change
+        get_services().answer_journal.compact()
+        log("Request data: {}", data)
         
         if not data or 'items' not in data or 'target_folder' not in data or 'types' not in data:
-            conditional_log("Missing required fields in request data")
+            log("Missing required fields in request data")
             return jsonify({"success": False, "message": "Missing required fields"})
         
         items = data['items']  # List of file/folder paths to move
         types = data['types']  # Dictionary mapping paths to their types (folder/question)
         target_folder = data['target_folder'].strip()  # Target folder path
-        conditional_log("Moving items: {} with types {} to target folder: '{}'", items, types, target_folder)
+        log("Moving items: {} with types {} to target folder: '{}'", items, types, target_folder)
         
         base_dir = "assets/Data/fill_the_blanks"
-        conditional_log("Base directory: {}", base_dir)
+        log("Base directory: {}", base_dir)
         
         # Handle root directory case
         target_path = base_dir if target_folder == "" else os.path.join(base_dir, target_folder)
-        conditional_log("Resolved target path: {}", target_path)
+        log("Resolved target path: {}", target_path)
         
         # Create target directory if it doesn't exist
         os.makedirs(target_path, exist_ok=True)
-        conditional_log("Target directory ensured: {}", target_path)
+        log("Target directory ensured: {}", target_path)
         
         moved_items = []
         for item_path in items:
             try:
                 item_type = types.get(item_path)
                 if not item_type:
-                    conditional_log("No type information for item: {}", item_path)
+                    log("No type information for item: {}", item_path)
                     continue
                     
                 source_path = os.path.join(base_dir, item_path)
-                conditional_log("Processing {} - source path: {}", item_type, source_path)
+                log("Processing {} - source path: {}", item_type, source_path)
                 
                 if not os.path.exists(source_path):
-                    conditional_log("Source path does not exist: {}", source_path)
+                    log("Source path does not exist: {}", source_path)
                     continue
                 
                 # Get the base name of the item
                 item_name = os.path.basename(item_path)
                 new_path = os.path.join(target_path, item_name)
-                conditional_log("Target path for {}: {}", item_type, new_path)
+                log("Target path for {}: {}", item_type, new_path)
                 
                 # Skip if source and target are the same
                 if os.path.abspath(source_path) == os.path.abspath(new_path):
-                    conditional_log("Source and target paths are the same, skipping: {}", source_path)
+                    log("Source and target paths are the same, skipping: {}", source_path)
                     continue
                 
                 # For folders, check if we're trying to move a folder into itself
                 if item_type == 'folder' and new_path.startswith(source_path):
-                    conditional_log("Cannot move folder into itself: {} -> {}", source_path, new_path)
+                    log("Cannot move folder into itself: {} -> {}", source_path, new_path)
                     continue
                 
                 # Check if an item with the same name already exists in target
@@ -938,23 +752,28 @@ def move_items() -> Dict[str, Any]:
                         new_name = f"{base_name}_{counter}{ext}"
                         new_path = os.path.join(target_path, new_name)
                         counter += 1
-                    conditional_log("Generated unique path for existing {}: {}", item_type, new_path)
+                    log("Generated unique path for existing {}: {}", item_type, new_path)
                 
                 # Move the item
                 import shutil
-                conditional_log("Attempting to move {} to {}", source_path, new_path)
+                log("Attempting to move {} to {}", source_path, new_path)
                 shutil.move(source_path, new_path)
+                get_services().question_path_resolver.invalidate(os.path.dirname(item_path))
+                if item_type == 'folder':
+                    FocusState.follow_move(item_path, os.path.relpath(new_path, base_dir))
                 moved_items.append(item_path)
-                conditional_log("Successfully moved {} to {}", source_path, new_path)
+                log("Successfully moved {} to {}", source_path, new_path)
                 
             except Exception as e:
-                conditional_log("Error moving item {}: {}", item_path, str(e), level="ERROR")
+                log("Error moving item {}: {}", item_path, str(e), level="ERROR")
                 continue
         
-        conditional_log("Move operation completed. Moved items: {}", moved_items)
+        log("Move operation completed. Moved items: {}", moved_items)
+        get_services().question_path_resolver.invalidate(target_folder)
+        get_services().question_tree_cache.invalidate()
         
         if not moved_items:
-            conditional_log("No items were successfully moved")
+            log("No items were successfully moved")
             return jsonify({
                 "success": False,
                 "message": "Aucun élément n'a pu être déplacé"
@@ -965,11 +784,11 @@ def move_items() -> Dict[str, Any]:
             "message": f"{len(moved_items)} élément(s) déplacé(s) avec succès",
             "moved_items": moved_items
         }
-        conditional_log("Sending response: {}", response_data)
+        log("Sending response: {}", response_data)
         return jsonify(response_data)
     
     except Exception as e:
-        conditional_log("Error moving items: {}", str(e), level="ERROR")
+        log("Error moving items: {}", str(e), level="ERROR")
         return jsonify({"success": False, "message": "Une erreur est survenue lors du déplacement des éléments"})
 
 
@@ -1013,7 +832,10 @@ def open_folder():
 @game_bp.route('/focus_folder', methods=['POST'])
 def focus_folder():
     """
-    Focus on a specific folder by moving all other sibling folders to a temporary backup location.
+    Focus on a specific folder by persisting it as the active filter.
+
+    Sibling folders stay where they are; every view simply hides them until
+    the focus is removed.
 
     Returns:
         Dict[str, Any]: JSON response indicating success or failure.
@@ -1024,83 +846,39 @@ def focus_folder():
             return jsonify({"success": False, "message": "Missing folder path"})
 
         folder_path = data['path'].strip()
-        conditional_log("Focus request for folder: '{}'", folder_path)
+        log("Focus request for folder: '{}'", folder_path)
 
         # Get the base directory
         base_dir = "assets/Data/fill_the_blanks"
         focused_folder_path = os.path.join(base_dir, folder_path)
-        conditional_log("Full focused folder path: '{}'", focused_folder_path)
+        log("Full focused folder path: '{}'", focused_folder_path)
 
         # Check if folder exists
         if not os.path.exists(focused_folder_path) or not os.path.isdir(focused_folder_path):
-            conditional_log("Folder not found: '{}'", focused_folder_path)
+            log("Folder not found: '{}'", focused_folder_path)
             return jsonify({"success": False, "message": "Folder not found"})
 
-        # Get the parent directory
-        parent_dir = os.path.dirname(focused_folder_path)
-        focused_folder_name = os.path.basename(focused_folder_path)
-        conditional_log("Parent dir: '{}', Folder name: '{}'", parent_dir, focused_folder_name)
-
-        # Create backup directory at the same level as the focused folder
-        backup_dir = os.path.join(parent_dir, f".focused_backup_{focused_folder_name}")
-
         # Check if already focused
-        if os.path.exists(backup_dir):
-            return jsonify({"success": False, "message": "Un dossier est déjà en focus dans ce répertoire"})
-
-        # Create the backup directory
-        os.makedirs(backup_dir, exist_ok=True)
-
-        # Move all sibling folders (except the focused one) to the backup
-        moved_folders = []
-        try:
-            for item in os.listdir(parent_dir):
-                item_path = os.path.join(parent_dir, item)
-
-                # Skip if it's the focused folder, backup folder, or not a directory
-                if item == focused_folder_name or item.startswith('.focused_backup_') or not os.path.isdir(item_path):
-                    continue
-
-                # Move folder to backup
-                import shutil
-                dest_path = os.path.join(backup_dir, item)
-                shutil.move(item_path, dest_path)
-                moved_folders.append(item)
-                conditional_log("Moved {} to backup", item)
-
-        except Exception as e:
-            # If something goes wrong, try to restore what we've moved
-            conditional_log("Error during focus, attempting restore: {}", str(e))
-            for folder in moved_folders:
-                try:
-                    shutil.move(os.path.join(backup_dir, folder), os.path.join(parent_dir, folder))
-                except:
-                    pass
-
-            # Remove backup directory if empty
-            try:
-                if os.path.exists(backup_dir) and not os.listdir(backup_dir):
-                    os.rmdir(backup_dir)
-            except:
-                pass
-
-            return jsonify({"success": False, "message": f"Erreur lors du focus: {str(e)}"})
+        if FocusState.get_focus():
+            return jsonify({"success": False, "message": "Un dossier est déjà en focus"})
 
+        FocusState.set_focus(folder_path)
+        focused_folder_name = os.path.basename(focused_folder_path)
         return jsonify({
             "success": True,
-            "message": f"Focus activé sur {focused_folder_name}. {len(moved_folders)} dossier(s) déplacé(s).",
-            "moved_folders": moved_folders
+            "message": f"Focus activé sur {focused_folder_name}.",
+            "focused_folder": FocusState.get_focus()
         })
 
     except Exception as e:
-        conditional_log("Error focusing folder: {}", str(e))
+        log("Error focusing folder: {}", str(e))
         return jsonify({"success": False, "message": "Une erreur est survenue lors du focus"})
 
 
 @game_bp.route('/unfocus_folder', methods=['POST'])
 def unfocus_folder():
     """
-    Remove focus from a folder by restoring all folders from the backup location.
+    Remove focus from a folder by clearing the persisted filter.
 
     Returns:
         Dict[str, Any]: JSON response indicating success or failure.
@@ -1110,58 +888,18 @@ def unfocus_folder():
         if not data or 'path' not in data:
             return jsonify({"success": False, "message": "Missing folder path"})
 
-        folder_path = data['path'].strip()
-
-        # Get the base directory
-        base_dir = "assets/Data/fill_the_blanks"
-        focused_folder_path = os.path.join(base_dir, folder_path)
-
-        # Get the parent directory
-        parent_dir = os.path.dirname(focused_folder_path)
-        focused_folder_name = os.path.basename(focused_folder_path)
-
-        # Find the backup directory
-        backup_dir = os.path.join(parent_dir, f".focused_backup_{focused_folder_name}")
-
-        # Check if backup exists
-        if not os.path.exists(backup_dir):
-            return jsonify({"success": False, "message": "Aucun backup trouvé pour ce dossier"})
-
-        # Restore all folders from backup
-        restored_folders = []
-        import shutil
-
-        try:
-            for item in os.listdir(backup_dir):
-                item_path = os.path.join(backup_dir, item)
-
-                if os.path.isdir(item_path):
-                    # Move folder back to parent directory
-                    dest_path = os.path.join(parent_dir, item)
-
-                    # If destination already exists, skip (shouldn't happen normally)
-                    if os.path.exists(dest_path):
-                        conditional_log("Warning: {} already exists, skipping", item)
-                        continue
-
-                    shutil.move(item_path, dest_path)
-                    restored_folders.append(item)
-                    conditional_log("Restored {} from backup", item)
-
-            # Remove the backup directory
-            if os.path.exists(backup_dir) and not os.listdir(backup_dir):
-                os.rmdir(backup_dir)
+        folder_path = normalize_folder(data['path'].strip())
 
-        except Exception as e:
-            conditional_log("Error during unfocus: {}", str(e))
-            return jsonify({"success": False, "message": f"Erreur lors de la restauration: {str(e)}"})
+        # Check if this folder is the focused one
+        if FocusState.get_focus() != folder_path:
+            return jsonify({"success": False, "message": "Aucun focus actif pour ce dossier"})
 
+        FocusState.clear_focus()
         return jsonify({
             "success": True,
-            "message": f"Focus retiré. {len(restored_folders)} dossier(s) restauré(s).",
-            "restored_folders": restored_folders
+            "message": "Focus retiré."
         })
 
     except Exception as e:
-        conditional_log("Error unfocusing folder: {}", str(e))
+        log("Error unfocusing folder: {}", str(e))
         return jsonify({"success": False, "message": "Une erreur est survenue lors du retrait du focus"}) 
\ No newline at end of file
@@ -3,15 +3,12 @@
 from typing import List
 from flask import Blueprint, render_template, request, redirect, url_for
 
-from svt_app.services.question_service import QuestionService
+from svt_app.services.service_container import get_services
 from svt_app.state import GameScores
 
 # Create a Blueprint for the image matching routes
 image_matching_bp = Blueprint("image_matching", __name__)
 
-# Initialize the question service
-question_service = QuestionService()
-
 @image_matching_bp.route("/relier_images")
 def relier_images() -> str:
     """
@@ -20,6 +17,7 @@ def relier_images() -> str:
     Returns:
         str: Rendered HTML template for the 'Relier les images' game.
     """
+    question_service = get_services().question_service
     questions = question_service.get_image_matching_questions()
     
     # Get the current question ID from the query parameters, default to 1
@@ -1,13 +1,13 @@
 """Routes for Anki integration."""
 from typing import Dict, Any
 from flask import Blueprint, jsonify, render_template, session, request
-from ..services.anki_service import AnkiService
-from ..services.anki_training_service import AnkiTrainingService
-from ..utils.logging_utils import conditional_log
+from ..services.anki_review_order import DEFAULT_PAGE_SIZE
+from ..services.service_container import get_services
+from ..utils.logging_utils import module_logger
+
+log = module_logger(__name__)
 
 anki_bp = Blueprint('anki', __name__)
-anki_service = AnkiService()
-training_service = AnkiTrainingService(anki_service)
 
 @anki_bp.route('/anki/authenticate', methods=['GET'])
 def authenticate() -> Dict[str, Any]:
@@ -16,19 +16,19 @@ def authenticate() -> Dict[str, Any]:
     Returns:
         JSON response indicating authentication status
     """
-    conditional_log("Attempting Anki authentication")
-    is_authenticated, error_diagnosis = anki_service.authenticate()
+    log("Attempting Anki authentication")
+    is_authenticated, error_diagnosis = get_services().anki_service.authenticate()
     
     if is_authenticated:
         session['anki_authenticated'] = True
-        conditional_log("Anki authentication successful")
+        log("Anki authentication successful")
         return jsonify({
             'authenticated': True,
             'message': 'Successfully authenticated with Anki'
         })
     else:
         session['anki_authenticated'] = False
-        conditional_log("Anki authentication failed: {}", error_diagnosis)
+        log("Anki authentication failed: {}", error_diagnosis)
         return jsonify({
             'authenticated': False,
             'message': 'Failed to authenticate with Anki',
@@ -42,8 +42,8 @@ def test_anki_connection() -> Dict[str, Any]:
     Returns:
         JSON response indicating connection status
     """
-    conditional_log("Testing Anki connection")
-    is_connected, error_diagnosis = anki_service.test_connection()
+    log("Testing Anki connection")
+    is_connected, error_diagnosis = get_services().anki_service.test_connection()
     
     if is_connected:
         return jsonify({
@@ -51,7 +51,7 @@ def test_anki_connection() -> Dict[str, Any]:
             'message': 'Successfully connected to Anki'
         })
     else:
-        conditional_log("Connection test failed: {}", error_diagnosis)
+        log("Connection test failed: {}", error_diagnosis)
         return jsonify({
             'connected': False,
             'message': 'Failed to connect to Anki',
@@ -66,7 +66,7 @@ def get_decks() -> Dict[str, Any]:
         JSON response containing list of deck names
     """
     if not session.get('anki_authenticated'):
-        conditional_log("Attempting to get decks without authentication")
+        log("Attempting to get decks without authentication")
         return jsonify({
             'success': False,
             'error': {
@@ -76,24 +76,24 @@ def get_decks() -> Dict[str, Any]:
         })
 
     try:
-        conditional_log("Fetching Anki decks")
-        response, error_diagnosis = anki_service._make_request("deckNames")
+        log("Fetching Anki decks")
+        response, error_diagnosis = get_services().anki_service._make_request("deckNames")
         
         if response and 'result' in response:
             decks = response['result']
-            conditional_log("Successfully retrieved {} decks", len(decks))
+            log("Successfully retrieved {} decks", len(decks))
             return jsonify({
                 'success': True,
                 'decks': decks
             })
         else:
-            conditional_log("Failed to retrieve decks: {}", error_diagnosis)
+            log("Failed to retrieve decks: {}", error_diagnosis)
             return jsonify({
                 'success': False,
                 'error': error_diagnosis
             })
     except Exception as e:
-        conditional_log("Error fetching Anki decks: {}", str(e), level='ERROR')
+        log("Error fetching Anki decks: {}", str(e), level='ERROR')
         return jsonify({
             'success': False,
             'error': str(e)
@@ -106,7 +106,7 @@ def anki_page() -> str:
     Returns:
         Rendered HTML template
     """
-    conditional_log("Rendering Anki page")
+    log("Rendering Anki page")
     return render_template('anki.html')
 
 @anki_bp.route('/training/<deck_name>')
@@ -122,13 +122,23 @@ def training_view(deck_name: str):
 def get_review_cards(deck_name: str) -> Dict[str, Any]:
     """Get cards available for review in a deck.
     
+    With a limit or cursor query parameter, only one page of cards is
+    returned, with the cursor of the next page.
+    
     Args:
         deck_name: Name of the deck to get cards from
         
     Returns:
         JSON response with cards data
     """
-    cards = training_service.get_cards_for_review(deck_name)
+    if 'limit' in request.args or 'cursor' in request.args:
+        try:
+            page = get_services().training_service.get_review_page(deck_name, request.args.get('cursor'),
+                                                    request.args.get('limit', DEFAULT_PAGE_SIZE, type=int))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify(page or {'cards': [], 'next_cursor': None, 'total': 0})
+    cards = get_services().training_service.get_cards_for_review(deck_name)
     return jsonify({'cards': cards})
 
 @anki_bp.route('/cards/answer', methods=['POST'])
@@ -149,5 +159,5 @@ def submit_answer() -> Dict[str, Any]:
     if not card_id or not ease:
         return jsonify({'error': 'Missing required parameters'}), 400
         
-    success = training_service.answer_card(card_id, ease)
+    success = get_services().training_service.answer_card(card_id, ease)
     return jsonify({'success': success}) 
\ No newline at end of file
@@ -1,13 +1,13 @@
 """Routes for Anki training interface."""
 from typing import Dict, Any, List, Optional, Union
 from flask import Blueprint, jsonify, render_template, session, request
-from ..services.anki_service import AnkiService
-from ..services.anki_training_service import AnkiTrainingService
-from ..utils.logging_utils import conditional_log
+from ..services.anki_review_order import DEFAULT_PAGE_SIZE
+from ..services.service_container import get_services
+from ..utils.logging_utils import module_logger
+
+log = module_logger(__name__)
 
 training_bp = Blueprint('anki_training', __name__)
-anki_service = AnkiService()
-training_service = AnkiTrainingService(anki_service)
 
 @training_bp.route('/anki/train/<deck_name>')
 def train_deck(deck_name: str) -> str:
@@ -19,7 +19,7 @@ def train_deck(deck_name: str) -> str:
     Returns:
         Rendered HTML template
     """
-    conditional_log("Rendering training interface for deck: {}", deck_name)
+    log("Rendering training interface for deck: {}", deck_name)
     return render_template('anki_training.html', deck_name=deck_name)
 
 @training_bp.route('/api/anki/cards/<deck_name>')
@@ -39,18 +39,50 @@ def get_due_cards(deck_name: str) -> Dict[str, Any]:
         })
 
     try:
-        cards = training_service.get_cards_for_review(deck_name)
+        cards = get_services().training_service.get_cards_for_review(deck_name)
         return jsonify({
             'success': True,
             'cards': cards
         })
     except Exception as e:
-        conditional_log("Error getting due cards: {}", str(e), level='ERROR')
+        log("Error getting due cards: {}", str(e), level='ERROR')
         return jsonify({
             'success': False,
             'error': str(e)
         })
 
+@training_bp.route('/api/anki/cards/<deck_name>/page')
+def get_due_cards_page(deck_name: str) -> Dict[str, Any]:
+    """Get one page of the cards due for review in a deck, in review order.
+    
+    Query parameters:
+        cursor: Cursor returned with the previous page, absent for the first page
+        limit: Maximum number of cards in the page
+        
+    Args:
+        deck_name: Name of the deck
+        
+    Returns:
+        JSON response with the cards, the next cursor and the number of cards
+    """
+    if not session.get('anki_authenticated'):
+        return jsonify({
+            'success': False,
+            'error': 'Not authenticated'
+        })
+
+    try:
+        page = get_services().training_service.get_review_page(deck_name, request.args.get('cursor'),
+                                                request.args.get('limit', DEFAULT_PAGE_SIZE, type=int))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    if page is None:
+        return jsonify({
+            'success': False,
+            'error': 'Failed to get cards from Anki'
+        })
+    return jsonify({'success': True, **page})
+
 @training_bp.route('/api/anki/answer', methods=['POST'])
 def submit_answer() -> Dict[str, Any]:
     """Submit an answer for a card.
@@ -59,7 +91,7 @@ def submit_answer() -> Dict[str, Any]:
         JSON response indicating success
     """
     if not session.get('anki_authenticated'):
-        conditional_log("Answer submission failed: Not authenticated")
+        log("Answer submission failed: Not authenticated")
         return jsonify({
             'success': False,
             'error': 'Not authenticated'
@@ -67,21 +99,21 @@ def submit_answer() -> Dict[str, Any]:
 
     try:
         data = request.get_json()
-        conditional_log("Received answer submission data: {}", data)
+        log("Received answer submission data: {}", data)
         
         cardId = data.get('cardId')
         ease = data.get('ease')
         
         if not cardId or not ease:
-            conditional_log("Answer submission failed: Missing cardId or ease")
+            log("Answer submission failed: Missing cardId or ease")
             return jsonify({
                 'success': False,
                 'error': 'Missing cardId or ease'
             })
             
-        conditional_log("Submitting answer for card {} with ease {}", cardId, ease)
-        success = training_service.answer_card(cardId, ease)
-        conditional_log("Answer submission result: {}", success)
+        log("Submitting answer for card {} with ease {}", cardId, ease)
+        success = get_services().training_service.answer_card(cardId, ease, data.get('idempotencyKey'))
+        log("Answer submission result: {}", success)
         
         if not success:
             return jsonify({
@@ -91,8 +123,26 @@ def submit_answer() -> Dict[str, Any]:
             
         return jsonify({'success': True})
     except Exception as e:
-        conditional_log("Error submitting answer: {}", str(e), level='ERROR')
+        log("Error submitting answer: {}", str(e), level='ERROR')
         return jsonify({
             'success': False,
             'error': str(e)
-        }) 
\ No newline at end of file
+        })
+
+@training_bp.route('/api/anki/outbox')
+def outbox_status() -> Dict[str, Any]:
+    """Get the state of the answers waiting to be sent to Anki.
+    
+    Returns:
+        JSON response with the outbox depth and the last sync status
+    """
+    return jsonify(get_services().answer_outbox.status())
+
+@training_bp.route('/api/anki/connection')
+def connection_status() -> Dict[str, Any]:
+    """Get the state of the circuit breaker guarding the Anki connection.
+    
+    Returns:
+        JSON response with the circuit state and consecutive failures
+    """
+    return jsonify(get_services().anki_service.connection.status()) 
\ No newline at end of file
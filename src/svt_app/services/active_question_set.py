@@ -0,0 +1,139 @@
+"""Sorted sets of active (non-completed) question IDs for Révijouer application."""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Tuple
+
+
+class ActiveQuestionSet:
+    """
+    Active question IDs kept sorted per folder and for the whole bank.
+
+    Lookups of the next question, wrap-around and remaining counts are
+    O(log n) bisections over sorted arrays, so they never touch the disk.
+    The bank-wide array may hold the same ID several times when several
+    folders reuse it; bank-wide navigation therefore goes through the
+    (id, folder) pairs, kept sorted in the order the bank is played in.
+    Every method holds the lock, shared with the owning bank if any.
+    """
+
+    def __init__(self, lock: Optional[threading.RLock] = None) -> None:
+        """
+        Initialize an empty set.
+
+        Args:
+            lock: Lock guarding the arrays, a new one by default.
+        """
+        self._lock = lock or threading.RLock()
+        self._by_folder: Dict[str, List[int]] = {}
+        self._all: List[int] = []
+        self._keys: List[Tuple[int, str]] = []
+
+    def add(self, folder: str, question_id: int) -> None:
+        """Mark a question of a folder as active."""
+        with self._lock:
+            ids = self._by_folder.setdefault(folder, [])
+            position = bisect_left(ids, question_id)
+            if position < len(ids) and ids[position] == question_id:
+                return
+            ids.insert(position, question_id)
+            insort(self._all, question_id)
+            insort(self._keys, (question_id, folder))
+
+    def discard(self, folder: str, question_id: int) -> None:
+        """Mark a question of a folder as no longer active."""
+        with self._lock:
+            ids = self._by_folder.get(folder)
+            if not ids:
+                return
+            position = bisect_left(ids, question_id)
+            if position == len(ids) or ids[position] != question_id:
+                return
+            del ids[position]
+            if not ids:
+                del self._by_folder[folder]
+            del self._all[bisect_left(self._all, question_id)]
+            del self._keys[bisect_left(self._keys, (question_id, folder))]
+
+    def _ids(self, folder: Optional[str]) -> List[int]:
+        """Return the sorted IDs of a folder, or of the whole bank for None."""
+        return self._all if folder is None else self._by_folder.get(folder, [])
+
+    def contains(self, folder: Optional[str], question_id: int) -> bool:
+        """Return whether a question ID is active in a folder (or anywhere for None)."""
+        with self._lock:
+            ids = self._ids(folder)
+            position = bisect_left(ids, question_id)
+            return position < len(ids) and ids[position] == question_id
+
+    def ids(self, folder: Optional[str] = None) -> List[int]:
+        """Return a copy of the sorted active IDs of a folder (or of the whole bank)."""
+        with self._lock:
+            return list(self._ids(folder))
+
+    def count(self, folder: Optional[str] = None) -> int:
+        """Return how many questions remain active in a folder (or in the whole bank)."""
+        with self._lock:
+            return len(self._ids(folder))
+
+    def first(self, folder: Optional[str] = None) -> Optional[int]:
+        """Return the smallest active ID of a folder, or None."""
+        with self._lock:
+            ids = self._ids(folder)
+            return ids[0] if ids else None
+
+    def next_after(self, folder: Optional[str], question_id: int) -> Optional[int]:
+        """
+        Return the next active ID after a question, wrapping around.
+
+        Args:
+            folder: The folder to navigate, or None for the whole bank.
+            question_id: The current question ID.
+
+        Returns:
+            Optional[int]: The next active ID, never the current one, or None.
+        """
+        with self._lock:
+            ids = self._ids(folder)
+            position = bisect_right(ids, question_id)
+            if position < len(ids):
+                return ids[position]
+            # Loop back to the first remaining question other than the current one
+            for candidate in ids:
+                if candidate != question_id:
+                    return candidate
+            return None
+
+    def first_key(self, scope: Optional[str] = None) -> Optional[Tuple[str, int]]:
+        """Return the (folder, id) of the first active question of a folder (or of the whole bank), or None."""
+        with self._lock:
+            if scope is not None:
+                first = self.first(scope)
+                return (scope, first) if first is not None else None
+            return (self._keys[0][1], self._keys[0][0]) if self._keys else None
+
+    def next_key(self, scope: Optional[str], folder: str, question_id: int) -> Optional[Tuple[str, int]]:
+        """
+        Return the (folder, id) of the next active question after one, wrapping around.
+
+        Args:
+            scope: The folder to navigate, or None for the whole bank.
+            folder: The folder of the current question.
+            question_id: The current question ID.
+
+        Returns:
+            Optional[Tuple[str, int]]: The next active question, never the current one, or None.
+        """
+        with self._lock:
+            if scope is not None:
+                next_id = self.next_after(scope, question_id)
+                return (scope, next_id) if next_id is not None else None
+            current = (question_id, folder)
+            position = bisect_right(self._keys, current)
+            if position < len(self._keys):
+                return self._keys[position][1], self._keys[position][0]
+            # Loop back to the first remaining question other than the current one
+            for candidate in self._keys:
+                if candidate != current:
+                    return candidate[1], candidate[0]
+            return None
@@ -0,0 +1,116 @@
+"""Coalescing of AnkiConnect answer submissions into batched calls."""
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.logging_utils import conditional_log
+
+AnswerSender = Callable[[List[Dict[str, Any]]], Optional[List[bool]]]
+
+
+class AnswerBatch:
+    """
+    Answers sent to AnkiConnect together.
+
+    Attributes:
+        answers (List[Dict[str, Any]]): The answers, as expected by answerCards.
+        results (List[bool]): Whether each answer was recorded, filled when the batch completes.
+        done (threading.Event): Set once the results are known.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty batch."""
+        self.answers: List[Dict[str, Any]] = []
+        self.results: List[bool] = []
+        self.done = threading.Event()
+
+
+class AnswerCoalescer:
+    """
+    Group the answers submitted within a short window into one answerCards call.
+
+    The first answer of a batch waits for the window to elapse, then sends
+    every answer submitted in the meantime. A full batch is sent right away
+    by the submitter that filled it. A batch can also be taken before the
+    window ends, so it travels with another request in a multi action.
+    Each submitter gets the result of its own answer.
+    """
+
+    def __init__(self, send: AnswerSender, window: float = 0.05, max_batch: int = 100) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            send: Function submitting answers and returning their results, or None on failure.
+            window: Seconds the first answer of a batch waits for others.
+            max_batch: Number of answers sent at once at most.
+        """
+        self.send = send
+        self.window = window
+        self.max_batch = max_batch
+        self._open: Optional[AnswerBatch] = None
+        self._condition = threading.Condition()
+
+    def submit(self, card_id: int, ease: int) -> bool:
+        """
+        Submit one answer and wait for the result of its batch.
+
+        Args:
+            card_id: ID of the card being answered.
+            ease: Ease rating (1=Again, 2=Hard, 3=Good, 4=Easy).
+
+        Returns:
+            bool: True if AnkiConnect recorded the answer.
+        """
+        with self._condition:
+            batch = self._open
+            leader = batch is None
+            if batch is None:
+                batch = self._open = AnswerBatch()
+            index = len(batch.answers)
+            batch.answers.append({"cardId": card_id, "ease": ease})
+            owner = len(batch.answers) >= self.max_batch
+            if owner:
+                self._open = None
+                self._condition.notify_all()
+            elif leader:
+                self._condition.wait_for(lambda: self._open is not batch, timeout=self.window)
+                if self._open is batch:
+                    self._open = None
+                    owner = True
+        if owner:
+            try:
+                results = self.send(batch.answers)
+            except Exception as e:
+                conditional_log("Answer batch failed: {}", str(e), level='ERROR')
+                results = None
+            self.complete(batch, results)
+        batch.done.wait()
+        return batch.results[index]
+
+    def take(self) -> Optional[AnswerBatch]:
+        """
+        Take the pending answers before their window ends.
+
+        The caller must send them and pass the results to complete().
+
+        Returns:
+            Optional[AnswerBatch]: The pending batch, or None if no answer is waiting.
+        """
+        with self._condition:
+            batch, self._open = self._open, None
+            self._condition.notify_all()
+        return batch
+
+    def complete(self, batch: AnswerBatch, results: Optional[List[bool]]) -> None:
+        """
+        Hand the results of a batch to its submitters.
+
+        Args:
+            batch: The batch that was sent.
+            results: Whether each answer was recorded, or None if the call failed.
+        """
+        if results is None or len(results) != len(batch.answers):
+            results = [False] * len(batch.answers)
+        batch.results = [bool(result) for result in results]
+        conditional_log("Sent {} answers in one batch, {} recorded", len(batch.answers), sum(batch.results))
+        batch.done.set()
@@ -0,0 +1,159 @@
+"""Per-deck cache of formatted Anki cards."""
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..utils.logging_utils import conditional_log
+from .anki_review_order import ReviewKey
+
+
+@dataclass
+class CachedCard:
+    """
+    A card, formatted on first use, and the modification time it was fetched at.
+
+    Attributes:
+        mod (int): Modification time reported by AnkiConnect.
+        key (ReviewKey): Position of the card in the review order.
+        raw (Dict[str, Any]): Card ID and raw question and answer HTML.
+        card (Optional[Dict[str, Any]]): The formatted card, as sent to the training page.
+    """
+    mod: int
+    key: ReviewKey
+    raw: Dict[str, Any]
+    card: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class DeckEntry:
+    """
+    The cached reviewable cards of one deck.
+
+    Attributes:
+        card_ids (List[int]): Reviewable card IDs, in review order.
+        keys (List[ReviewKey]): Review key of each card of card_ids.
+        cards (Dict[int, CachedCard]): Cards by ID.
+        refreshed_at (float): Monotonic time of the last refresh.
+        version (int): Invalidation counter the entry was refreshed at.
+    """
+    card_ids: List[int] = field(default_factory=list)
+    keys: List[ReviewKey] = field(default_factory=list)
+    cards: Dict[int, CachedCard] = field(default_factory=dict)
+    refreshed_at: float = 0.0
+    version: int = -1
+
+    def position_after(self, key: ReviewKey) -> int:
+        """Return the index of the first card after a review key."""
+        return bisect_right(self.keys, key)
+
+
+class DeckCardCache:
+    """
+    Keep the formatted reviewable cards of each deck between requests.
+
+    A deck is served from memory while its entry is younger than the TTL
+    and no answer touched it. After that the caller refreshes it: the card
+    IDs and modification times are fetched again, and only the cards that
+    are new or whose modification time changed are fetched again. Cards
+    are only formatted when they are first served.
+    """
+
+    def __init__(self, ttl: float = 30.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a deck is served without asking AnkiConnect.
+        """
+        self.ttl = ttl
+        self._decks: Dict[str, DeckEntry] = {}
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.refreshes = 0
+        self._lock = threading.Lock()
+
+    def fresh(self, deck_name: str) -> Optional[DeckEntry]:
+        """
+        Return the cards of a deck if they can be served without a refresh.
+
+        Args:
+            deck_name: Name of the deck.
+
+        Returns:
+            Optional[DeckEntry]: The cards, or None if the deck must be refreshed.
+        """
+        with self._lock:
+            entry = self._decks.get(deck_name)
+            if (entry is None or entry.version != self._versions.get(deck_name, 0)
+                    or time.monotonic() - entry.refreshed_at >= self.ttl):
+                return None
+            self.hits += 1
+            return entry
+
+    def version(self, deck_name: str) -> int:
+        """Return the invalidation counter of a deck, to pass to store() after a refresh."""
+        with self._lock:
+            return self._versions.get(deck_name, 0)
+
+    def known(self, deck_name: str) -> Dict[int, CachedCard]:
+        """Return a copy of the cached cards of a deck, fresh or not."""
+        with self._lock:
+            entry = self._decks.get(deck_name)
+            return dict(entry.cards) if entry else {}
+
+    def store(self, deck_name: str, card_ids: List[int], cards: Dict[int, CachedCard],
+              version: int) -> DeckEntry:
+        """
+        Record the result of a refresh.
+
+        The entry is only served as fresh if the deck was not invalidated
+        while the refresh was running.
+
+        Args:
+            deck_name: Name of the deck.
+            card_ids: Reviewable card IDs.
+            cards: Cards, including at least every reviewable card.
+            version: Value of version() taken before the refresh started.
+
+        Returns:
+            DeckEntry: The reviewable cards, in review order.
+        """
+        card_ids = sorted((card_id for card_id in card_ids if card_id in cards),
+                          key=lambda card_id: cards[card_id].key)
+        entry = DeckEntry(card_ids=card_ids, keys=[cards[card_id].key for card_id in card_ids],
+                          cards={card_id: cards[card_id] for card_id in card_ids},
+                          refreshed_at=time.monotonic(), version=version)
+        with self._lock:
+            self._decks[deck_name] = entry
+            self.refreshes += 1
+        return entry
+
+    def invalidate(self, deck_name: Optional[str] = None) -> None:
+        """Force a refresh of one deck, or of every deck."""
+        with self._lock:
+            for name in ([deck_name] if deck_name else list(self._decks)):
+                self._versions[name] = self._versions.get(name, 0) + 1
+
+    def invalidate_card(self, card_id: int) -> None:
+        """Force a refresh of the decks containing a card, or of every deck if none does."""
+        with self._lock:
+            names = [name for name, entry in self._decks.items() if card_id in entry.cards] or list(self._decks)
+            for name in names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+        conditional_log("Card {} answered, refreshing decks {}", card_id, names)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, refreshes and the number of cached cards per deck.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'refreshes': self.refreshes,
+                'decks': {name: len(entry.card_ids) for name, entry in self._decks.items()}
+            }
@@ -1,70 +1,199 @@
 """Service for formatting Anki card content."""
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+from collections import OrderedDict
+import atexit
+import hashlib
+import os
 import re
-from bs4 import BeautifulSoup
-from ..utils.logging_utils import conditional_log
+import threading
+from ..utils.logging_utils import module_logger
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+log = module_logger(__name__)
+
+# Anki card templates are style blocks followed by markup; a style block cannot contain "</style"
+STYLE_BLOCK = re.compile(r'<style\b[^>]*>.*?</style\s*>', re.IGNORECASE | re.DOTALL)
+
+# Cards formatted in the calling process when fewer are left after the cache
+PARALLEL_THRESHOLD = 200
+
+
+def _format_uncached(content: str) -> str:
+    """Format card content without the cache (runs in worker processes too)."""
+    if 'cloze' not in content:
+        # Nothing to rewrite: only drop style blocks. The browser parses the
+        # result exactly as the html.parser serialization of the same markup.
+        return STYLE_BLOCK.sub('', content) if '<style' in content.lower() else content
+
+    # Only cloze cards need the parser, which is slow to import
+    from bs4 import BeautifulSoup
+
+    # Parse HTML
+    soup = BeautifulSoup(content, 'html.parser')
+
+    # Remove style tags
+    for style in soup.find_all('style'):
+        style.decompose()
+
+    # Handle cloze deletions
+    for cloze in soup.find_all(class_='cloze'):
+        # Get the actual content that was clozed
+        cloze_content = cloze.get('data-cloze', '[...]')
+        # Replace with a span that matches our styling
+        new_tag = soup.new_tag('span')
+        new_tag['class'] = 'cloze-highlight'
+        new_tag.string = cloze_content
+        cloze.replace_with(new_tag)
+
+    # Remove cloze-inactive spans but keep their content
+    for inactive in soup.find_all(class_='cloze-inactive'):
+        inactive.replace_with(inactive.get_text())
+
+    return str(soup)
+
+
+def _format_chunk(contents: List[str]) -> List[str]:
+    """Format a chunk of contents in a worker process."""
+    return [_format_uncached(content) for content in contents]
+
+
+class FormattedContentCache:
+    """Thread-safe LRU cache of formatted content, keyed by a hash of the raw HTML."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Number of formatted contents kept
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(content: str) -> bytes:
+        """Return the cache key of a raw content."""
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Return the formatted content of a key, or None if it is not cached."""
+        with self._lock:
+            formatted = self._entries.get(key)
+            if formatted is not None:
+                self._entries.move_to_end(key)
+            return formatted
+
+    def put(self, key: bytes, formatted: str) -> None:
+        """Cache a formatted content, evicting the least recently used one when full."""
+        with self._lock:
+            self._entries[key] = formatted
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached content."""
+        with self._lock:
+            self._entries.clear()
+
 
 class AnkiCardFormatter:
     """Service for formatting and cleaning Anki card content."""
-    
+
+    cache = FormattedContentCache(int(os.getenv('ANKI_FORMAT_CACHE_SIZE', '4096')))
+    workers = int(os.getenv('ANKI_FORMAT_WORKERS', str(min(4, os.cpu_count() or 1))))
+    _pool: Optional["ProcessPoolExecutor"] = None
+    _pool_lock = threading.Lock()
+
     @staticmethod
     def format_card_content(content: str) -> str:
         """Format card content by cleaning HTML and handling cloze deletions.
-        
+
         Args:
             content: Raw HTML content from Anki
-            
+
         Returns:
             Cleaned and formatted content
         """
-        conditional_log("Formatting card content: {}", content)
-        
-        # Parse HTML
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Remove style tags
-        for style in soup.find_all('style'):
-            style.decompose()
-            
-        # Handle cloze deletions
-        for cloze in soup.find_all(class_='cloze'):
-            # Get the actual content that was clozed
-            cloze_content = cloze.get('data-cloze', '[...]')
-            # Replace with a span that matches our styling
-            new_tag = soup.new_tag('span')
-            new_tag['class'] = 'cloze-highlight'
-            new_tag.string = cloze_content
-            cloze.replace_with(new_tag)
-            
-        # Remove cloze-inactive spans but keep their content
-        for inactive in soup.find_all(class_='cloze-inactive'):
-            inactive.replace_with(inactive.get_text())
-            
-        result = str(soup)
-        conditional_log("Formatted content: {}", result)
+        log("Formatting card content: {}", content)
+        key = AnkiCardFormatter.cache.key(content)
+        result = AnkiCardFormatter.cache.get(key)
+        if result is None:
+            result = _format_uncached(content)
+            AnkiCardFormatter.cache.put(key, result)
+        log("Formatted content: {}", result)
         return result
-        
+
     @staticmethod
     def extract_card_fields(card: Dict[str, Any]) -> Dict[str, str]:
         """Extract and format question and answer fields from an Anki card.
-        
+
         Args:
             card: Raw card data from Anki
-            
+
         Returns:
             Dict with formatted question and answer
         """
-        conditional_log("Extracting fields from card: {}", card)
-        
+        log("Extracting fields from card: {}", card)
+
         # Extract question and answer from card data
         question = card.get('question', '')
         answer = card.get('answer', '')
-        
+
         # Format both fields
         formatted_question = AnkiCardFormatter.format_card_content(question)
         formatted_answer = AnkiCardFormatter.format_card_content(answer)
-        
+
         return {
             'question': formatted_question,
             'answer': formatted_answer
-        } 
\ No newline at end of file
+        }
+
+    @classmethod
+    def extract_cards_fields(cls, cards: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """Extract and format the fields of many cards at once.
+
+        Contents already in the cache are reused. When many contents are
+        left, they are formatted in a pool of worker processes, since the
+        HTML parser is pure Python and holds the GIL.
+
+        Args:
+            cards: Raw card data from Anki
+
+        Returns:
+            Dict with formatted question and answer for each card, in order
+        """
+        contents = [card.get(field, '') for card in cards for field in ('question', 'answer')]
+        keys = [cls.cache.key(content) for content in contents]
+        formatted: Dict[bytes, Optional[str]] = {key: cls.cache.get(key) for key in keys}
+        missing = list({key: content for key, content in zip(keys, contents) if formatted[key] is None}.items())
+        if log.enabled:
+            log("Formatting {} contents, {} cached", len(contents), len(formatted) - len(missing))
+
+        pool = cls._get_pool() if len(missing) >= PARALLEL_THRESHOLD else None
+        if pool is not None:
+            size = max(1, len(missing) // (cls.workers * 4))
+            chunks = [[content for _, content in missing[i:i + size]] for i in range(0, len(missing), size)]
+            results = [result for chunk in pool.map(_format_chunk, chunks) for result in chunk]
+        else:
+            results = [_format_uncached(content) for _, content in missing]
+        for (key, _), result in zip(missing, results):
+            formatted[key] = result
+            cls.cache.put(key, result)
+
+        return [{'question': formatted[keys[2 * i]], 'answer': formatted[keys[2 * i + 1]]}
+                for i in range(len(cards))]
+
+    @classmethod
+    def _get_pool(cls) -> Optional["ProcessPoolExecutor"]:
+        """Return the shared worker pool, started on first use, or None if disabled."""
+        if cls.workers < 2:
+            return None
+        with cls._pool_lock:
+            if cls._pool is None:
+                from concurrent.futures import ProcessPoolExecutor
+                cls._pool = ProcessPoolExecutor(max_workers=cls.workers)
+                atexit.register(cls._pool.shutdown)
+            return cls._pool
@@ -0,0 +1,179 @@
+"""Circuit breaker and cached health state of the AnkiConnect connection."""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..utils.logging_utils import conditional_log
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+Health = Tuple[bool, Optional[Dict[str, Any]]]
+
+
+class AnkiConnectionState:
+    """
+    Track whether AnkiConnect answers and stop calling it while it does not.
+
+    The circuit is closed while requests succeed. After failure_threshold
+    consecutive transport failures it opens: requests fail at once instead
+    of each waiting for a timeout. Once reset_timeout has elapsed one
+    request is let through as a trial (half-open); its success closes the
+    circuit, its failure opens it again. While the circuit is not closed a
+    background prober sends a version request every probe_interval and
+    closes the circuit as soon as Anki answers.
+
+    The result of the last connection test is also kept for health_ttl
+    seconds, so authentication and status checks do not reach Anki on
+    every page load.
+    """
+
+    def __init__(self, probe: Callable[[], bool], failure_threshold: int = 3, reset_timeout: float = 10.0,
+                 health_ttl: float = 5.0, probe_interval: float = 2.0) -> None:
+        """
+        Initialize a closed circuit.
+
+        Args:
+            probe: Function returning whether AnkiConnect answers, bypassing the circuit.
+            failure_threshold: Consecutive failures opening the circuit.
+            reset_timeout: Seconds before an open circuit lets a trial request through.
+            health_ttl: Seconds a connection test result is reused.
+            probe_interval: Seconds between two probes while the circuit is not closed.
+        """
+        self.probe = probe
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.health_ttl = health_ttl
+        self.probe_interval = probe_interval
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_diagnosis: Optional[Dict[str, Any]] = None
+        self._trial_in_flight = False
+        self._health: Optional[Health] = None
+        self._health_at = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._prober: Optional[threading.Thread] = None
+
+    def allow_request(self) -> bool:
+        """
+        Return whether a request may be sent to AnkiConnect now.
+
+        Returns:
+            bool: True while closed, and for the single trial request of a half-open circuit.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - (self.opened_at or 0.0) >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a request AnkiConnect answered, closing the circuit."""
+        with self._lock:
+            self.failures = 0
+            self._trial_in_flight = False
+            if self.state != CLOSED:
+                conditional_log("AnkiConnect answers again, closing the circuit")
+                self.state = CLOSED
+                self.opened_at = None
+                self._health = (True, None)
+                self._health_at = time.monotonic()
+
+    def record_failure(self, diagnosis: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a request AnkiConnect did not answer, opening the circuit if needed.
+
+        Args:
+            diagnosis: Diagnosis of the failure, returned while the circuit is open.
+        """
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if diagnosis is not None:
+                self.last_diagnosis = diagnosis
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state == CLOSED:
+                    conditional_log("AnkiConnect failed {} times, opening the circuit", self.failures)
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self._health = (False, self.open_diagnosis())
+                self._health_at = self.opened_at
+        self._ensure_prober()
+
+    def open_diagnosis(self) -> Dict[str, Any]:
+        """
+        Return the error reported for requests refused by the open circuit.
+
+        Returns:
+            Dict[str, Any]: A diagnosis in the format of diagnose_connection_error.
+        """
+        last = self.last_diagnosis or {}
+        return {
+            'error_type': 'AnkiUnavailable',
+            'message': 'Anki is not answering; the connection is retried in the background',
+            'possible_causes': list(last.get('possible_causes') or ['Anki is not running']),
+            'suggestions': list(last.get('suggestions') or ['Start Anki application'])
+        }
+
+    def cached_health(self) -> Optional[Health]:
+        """Return the last connection test result, or None if it is older than the TTL."""
+        with self._lock:
+            if self._health is not None and time.monotonic() - self._health_at < self.health_ttl:
+                return self._health
+            return None
+
+    def store_health(self, connected: bool, diagnosis: Optional[Dict[str, Any]] = None) -> None:
+        """Keep the result of a connection test for the TTL."""
+        with self._lock:
+            self._health = (connected, diagnosis)
+            self._health_at = time.monotonic()
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Return the state of the connection.
+
+        Returns:
+            Dict[str, Any]: Circuit state, consecutive failures and seconds since the circuit opened.
+        """
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'open_for': time.monotonic() - self.opened_at if self.opened_at is not None else None,
+                'last_error': (self.last_diagnosis or {}).get('message') if self.state != CLOSED else None
+            }
+
+    def _ensure_prober(self) -> None:
+        """Start the background prober if the circuit is not closed."""
+        with self._lock:
+            if self.state == CLOSED or self._prober is not None:
+                return
+            self._prober = threading.Thread(target=self._run_prober, name="anki-prober", daemon=True)
+            self._prober.start()
+
+    def _run_prober(self) -> None:
+        """Probe AnkiConnect until the circuit closes."""
+        while not self._stop.wait(self.probe_interval):
+            with self._lock:
+                if self.state == CLOSED:
+                    self._prober = None
+                    return
+            try:
+                answered = self.probe()
+            except Exception as e:
+                conditional_log("AnkiConnect probe failed: {}", str(e))
+                answered = False
+            if answered:
+                self.record_success()
+
+    def close(self) -> None:
+        """Stop the background prober."""
+        self._stop.set()
@@ -0,0 +1,111 @@
+"""Pooled keep-alive HTTP client for AnkiConnect."""
+import time
+from typing import Any, Dict, FrozenSet, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config.anki_config import AnkiConfig
+from ..utils.logging_utils import conditional_log
+
+# Read-only actions, safe to send again when the first attempt failed
+IDEMPOTENT_ACTIONS: FrozenSet[str] = frozenset({
+    "version", "deckNames", "deckNamesAndIds", "findCards", "cardsInfo", "cardsModTime",
+    "notesInfo", "getDeckStats", "getReviewsOfCards"
+})
+
+# Read timeouts in seconds of the actions that can be slow on a large collection
+ACTION_TIMEOUTS: Dict[str, float] = {
+    "version": 2.0,
+    "findCards": 10.0,
+    "cardsInfo": 15.0,
+    "multi": 15.0,
+}
+
+CONNECT_TIMEOUT = 2.0
+
+
+class AnkiHttpClient:
+    """
+    Send AnkiConnect actions over a pool of keep-alive connections.
+
+    Every action goes through one requests session, so consecutive calls
+    reuse an open TCP connection instead of paying the connection setup
+    each time. Idempotent actions are retried with exponential backoff on
+    connection errors and timeouts; other actions, such as answerCards, are
+    sent once so an answer is never recorded twice.
+    """
+
+    def __init__(self, endpoint: str, pool_size: int = 4, timeout: float = 5.0, max_retries: int = 2,
+                 backoff: float = 0.1, action_timeouts: Optional[Dict[str, float]] = None) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            endpoint: The AnkiConnect URL.
+            pool_size: Maximum number of connections kept open to AnkiConnect.
+            timeout: Read timeout in seconds of actions without a specific timeout.
+            max_retries: Additional attempts of a failed idempotent action.
+            backoff: Delay in seconds before the first retry, doubled at each retry.
+            action_timeouts: Read timeout in seconds per action, ACTION_TIMEOUTS by default.
+        """
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.action_timeouts = ACTION_TIMEOUTS if action_timeouts is None else action_timeouts
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @classmethod
+    def from_config(cls, endpoint: str) -> "AnkiHttpClient":
+        """
+        Create a client configured from the environment.
+
+        Args:
+            endpoint: The AnkiConnect URL.
+
+        Returns:
+            AnkiHttpClient: The configured client.
+        """
+        settings = AnkiConfig.get_http_settings()
+        return cls(endpoint, pool_size=int(settings['pool_size']), timeout=settings['timeout'],
+                   max_retries=int(settings['max_retries']), backoff=settings['backoff'])
+
+    def timeout_for(self, action: str) -> float:
+        """Return the read timeout in seconds of an action."""
+        return self.action_timeouts.get(action, self.timeout)
+
+    def post(self, action: str, params: Dict[str, Any]) -> Any:
+        """
+        Send one action and return the decoded response.
+
+        Args:
+            action: The AnkiConnect action to perform.
+            params: Parameters for the action.
+
+        Returns:
+            Any: The decoded JSON response.
+
+        Raises:
+            requests.exceptions.RequestException: If every attempt failed.
+        """
+        payload = {"action": action, "version": 6, "params": params}
+        attempts = 1 + (self.max_retries if action in IDEMPOTENT_ACTIONS else 0)
+        timeout = (CONNECT_TIMEOUT, self.timeout_for(action))
+        for attempt in range(attempts):
+            try:
+                response = self.session.post(self.endpoint, json=payload, timeout=timeout)
+                return response.json()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt + 1 >= attempts:
+                    raise
+                delay = self.backoff * (2 ** attempt)
+                conditional_log("AnkiConnect {} failed ({}), retrying in {}s", action, type(e).__name__, delay)
+                time.sleep(delay)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
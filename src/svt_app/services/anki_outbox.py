@@ -0,0 +1,321 @@
+"""Durable outbox of Anki answers, synced to AnkiConnect in the background."""
+import atexit
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..utils.logging_utils import conditional_log
+from .anki_service import AnkiService
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    card_id INTEGER NOT NULL,
+    ease INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    attempted_at INTEGER,
+    status TEXT NOT NULL DEFAULT 'pending'
+);
+CREATE INDEX IF NOT EXISTS answers_by_status ON answers (status, id);
+"""
+
+# Synced and rejected answers are kept this long, so a resubmitted key is still recognized
+RETENTION = 24 * 3600
+
+
+@dataclass
+class OutboxEntry:
+    """
+    An answer waiting in the outbox.
+
+    Attributes:
+        id (int): Row ID, giving the submission order.
+        key (str): Idempotency key of the answer.
+        card_id (int): ID of the answered card.
+        ease (int): Ease rating (1=Again, 2=Hard, 3=Good, 4=Easy).
+        attempted_at (Optional[int]): Epoch milliseconds of the last send attempt, None if never sent.
+    """
+    id: int
+    key: str
+    card_id: int
+    ease: int
+    attempted_at: Optional[int]
+
+
+class AnkiOutbox:
+    """
+    Accept answers locally and deliver them to AnkiConnect in batches.
+
+    Answers are committed to a SQLite database before the browser gets its
+    reply, so neither a slow nor a restarting Anki loses them. A background
+    worker sends the pending answers in one answerCards call per batch,
+    backing off exponentially while Anki is unreachable.
+
+    Each answer carries an idempotency key: submitting the same key twice
+    records one answer. An answer whose send failed without a reply may
+    still have reached Anki, so before sending it again the worker looks
+    for a review of the card logged after the attempt and skips the answer
+    if there is one.
+    """
+
+    def __init__(self, anki: AnkiService, db_path: str, batch_size: int = 100, base_backoff: float = 1.0,
+                 max_backoff: float = 60.0, poll_interval: float = 30.0,
+                 on_synced: Optional[Callable[[List[int]], None]] = None) -> None:
+        """
+        Open (and create if needed) the outbox.
+
+        Args:
+            anki: The service answers are sent through.
+            db_path: Path of the SQLite database file.
+            batch_size: Number of answers sent in one call at most.
+            base_backoff: Seconds to wait after the first failure, doubled at each failure.
+            max_backoff: Longest wait in seconds between two attempts.
+            poll_interval: Seconds between two checks for pending answers when idle.
+            on_synced: Called with the card IDs of the answers Anki recorded.
+        """
+        self.anki = anki
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+        self.on_synced = on_synced
+        self.failures = 0
+        self.next_attempt_at = 0.0
+        self.last_attempt_at: Optional[float] = None
+        self.last_sync_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._local = threading.local()
+        self._sending = threading.Lock()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+        if self.depth():
+            # Deliver the answers left by a previous run now, not after the first poll interval
+            self._wake.set()
+            self._ensure_worker()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=FULL")
+            self._local.connection = connection
+        return connection
+
+    def enqueue(self, card_id: int, ease: int, key: Optional[str] = None) -> str:
+        """
+        Record an answer and wake the worker.
+
+        Args:
+            card_id: ID of the answered card.
+            ease: Ease rating (1=Again, 2=Hard, 3=Good, 4=Easy).
+            key: Idempotency key chosen by the client, a new one by default.
+
+        Returns:
+            str: The idempotency key of the answer.
+        """
+        key = key or uuid.uuid4().hex
+        self._connection().execute(
+            "INSERT OR IGNORE INTO answers (idempotency_key, card_id, ease, created_at) VALUES (?, ?, ?, ?)",
+            (key, int(card_id), int(ease), time.time()))
+        conditional_log("Answer {} for card {} queued", key, card_id)
+        self._ensure_worker()
+        self._wake.set()
+        return key
+
+    def depth(self) -> int:
+        """Return the number of answers not delivered yet."""
+        return self._connection().execute("SELECT COUNT(*) FROM answers WHERE status = 'pending'").fetchone()[0]
+
+    def pending_card_ids(self) -> Set[int]:
+        """Return the cards with an answer not delivered yet."""
+        rows = self._connection().execute("SELECT DISTINCT card_id FROM answers WHERE status = 'pending'")
+        return {row[0] for row in rows}
+
+    def take(self, include_attempted: bool = False) -> Optional[List[OutboxEntry]]:
+        """
+        Claim the next batch of pending answers for sending.
+
+        Only one batch is claimed at a time. The caller must pass the
+        outcome to settle(), which releases the claim.
+
+        Args:
+            include_attempted: Whether answers sent before without a reply are included.
+
+        Returns:
+            Optional[List[OutboxEntry]]: The batch, or None if nothing is pending or a batch is in flight.
+        """
+        if not self._sending.acquire(blocking=False):
+            return None
+        try:
+            condition = "" if include_attempted else "AND attempted_at IS NULL "
+            rows = self._connection().execute(
+                f"SELECT id, idempotency_key, card_id, ease, attempted_at FROM answers "
+                f"WHERE status = 'pending' {condition}ORDER BY id LIMIT ?", (self.batch_size,)).fetchall()
+            if not rows:
+                self._sending.release()
+                return None
+            return [OutboxEntry(row[0], row[1], row[2], row[3], row[4]) for row in rows]
+        except Exception:
+            self._sending.release()
+            raise
+
+    def mark_attempted(self, entries: List[OutboxEntry]) -> None:
+        """Record that a batch is about to be sent, so a lost reply is detected after a restart."""
+        now = int(time.time() * 1000)
+        self._connection().executemany("UPDATE answers SET attempted_at = ? WHERE id = ?",
+                                       [(now, entry.id) for entry in entries])
+        for entry in entries:
+            entry.attempted_at = now
+
+    def settle(self, entries: List[OutboxEntry], results: Optional[List[bool]], error: Optional[str] = None) -> None:
+        """
+        Record the outcome of a claimed batch and release the claim.
+
+        Args:
+            entries: The claimed batch.
+            results: Whether Anki recorded each answer, or None if the call failed.
+            error: Description of the failure.
+        """
+        try:
+            now = time.time()
+            with self._lock:
+                self.last_attempt_at = now
+                if results is None or len(results) != len(entries):
+                    self.failures += 1
+                    delay = min(self.base_backoff * (2 ** (self.failures - 1)), self.max_backoff)
+                    self.next_attempt_at = now + delay
+                    self.last_error = error or "AnkiConnect did not answer"
+                    conditional_log("Outbox sync failed ({}), next attempt in {}s", self.last_error, delay)
+                    return
+                self.failures = 0
+                self.next_attempt_at = 0.0
+                self.last_sync_at = now
+                self.last_error = None
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany("UPDATE answers SET status = ? WHERE id = ?",
+                                   [("synced" if result else "rejected", entry.id)
+                                    for entry, result in zip(entries, results)])
+            connection.execute("DELETE FROM answers WHERE status != 'pending' AND created_at < ?",
+                               (now - RETENTION,))
+            connection.execute("COMMIT")
+            synced = [entry.card_id for entry, result in zip(entries, results) if result]
+            conditional_log("Outbox delivered {} answers, {} rejected", len(synced), len(entries) - len(synced))
+            if self.on_synced and entries:
+                self.on_synced([entry.card_id for entry in entries])
+        finally:
+            self._sending.release()
+
+    def _already_reviewed(self, entries: List[OutboxEntry]) -> Optional[Set[int]]:
+        """
+        Return the IDs of attempted answers Anki logged a review for.
+
+        Returns:
+            Optional[Set[int]]: Entry IDs to consider delivered, or None if Anki did not answer.
+        """
+        attempted = [entry for entry in entries if entry.attempted_at is not None]
+        if not attempted:
+            return set()
+        response, _ = self.anki._make_request("getReviewsOfCards",
+                                              {"cards": sorted({entry.card_id for entry in attempted})})
+        if not response:
+            return None
+        if response.get('error') is not None or not isinstance(response.get('result'), dict):
+            # Reviews cannot be checked on this AnkiConnect version: send again
+            return set()
+        reviews: Dict[str, Any] = response['result']
+        return {entry.id for entry in attempted
+                if any(review.get('id', 0) >= entry.attempted_at for review in reviews.get(str(entry.card_id)) or [])}
+
+    def sync_once(self) -> int:
+        """
+        Send one batch of pending answers.
+
+        Returns:
+            int: Number of answers settled, delivered or rejected by Anki.
+        """
+        entries = self.take(include_attempted=True)
+        if entries is None:
+            return 0
+        results: Optional[List[bool]] = None
+        try:
+            delivered = self._already_reviewed(entries)
+            if delivered is not None:
+                to_send = [entry for entry in entries if entry.id not in delivered]
+                sent: Optional[List[bool]] = []
+                if to_send:
+                    self.mark_attempted(to_send)
+                    sent = self.anki.answer_cards([{"cardId": entry.card_id, "ease": entry.ease}
+                                                   for entry in to_send])
+                if sent is not None and len(sent) == len(to_send):
+                    outcome = dict(zip((entry.id for entry in to_send), sent))
+                    results = [bool(outcome.get(entry.id, True)) for entry in entries]
+        finally:
+            self.settle(entries, results)
+        return len(entries) if results is not None else 0
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Return the state of the outbox.
+
+        Returns:
+            Dict[str, Any]: Depth, failure count and the times of the last attempt and sync.
+        """
+        with self._lock:
+            return {
+                'depth': self.depth(),
+                'last_sync_at': self.last_sync_at,
+                'last_attempt_at': self.last_attempt_at,
+                'last_error': self.last_error,
+                'consecutive_failures': self.failures,
+                'next_attempt_in': max(0.0, self.next_attempt_at - time.time()) if self.failures else 0.0
+            }
+
+    def _ensure_worker(self) -> None:
+        """Start the background sender on first use."""
+        if self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run, name="anki-outbox", daemon=True)
+            self._worker.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Deliver pending answers as they arrive, backing off while Anki is unreachable."""
+        while not self._stop.is_set():
+            if self.failures:
+                self._wake.wait(max(0.0, self.next_attempt_at - time.time()))
+            else:
+                self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            if self._stop.is_set() or time.time() < self.next_attempt_at:
+                continue
+            try:
+                while self.sync_once() and not self.failures:
+                    pass
+            except Exception as e:
+                conditional_log("Error syncing Anki outbox: {}", str(e), level="ERROR")
+
+    def close(self) -> None:
+        """Stop the background sender; pending answers stay in the database."""
+        self._stop.set()
+        self._wake.set()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=5)
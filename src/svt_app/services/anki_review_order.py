@@ -0,0 +1,51 @@
+"""Anki review order of cards and cursors over it."""
+import base64
+import binascii
+import json
+from typing import Any, Dict, Tuple
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 200
+
+# Rank of each Anki queue in a review session: learning, day learning, review, then new cards
+QUEUE_RANKS: Dict[int, int] = {1: 0, 3: 1, 2: 2, 0: 3}
+OTHER_QUEUES_RANK = 4
+
+ReviewKey = Tuple[int, int, int]
+
+
+def review_key(card: Dict[str, Any]) -> ReviewKey:
+    """
+    Return the position of a card in the review order.
+
+    Cards are ordered by queue as Anki shows them, then by due value
+    (a timestamp for learning cards, a day for review cards, a position
+    for new cards), then by card ID.
+
+    Args:
+        card: Card data returned by cardsInfo.
+
+    Returns:
+        ReviewKey: The sort key of the card.
+    """
+    return (QUEUE_RANKS.get(card.get('queue', 0), OTHER_QUEUES_RANK), int(card.get('due') or 0),
+            int(card.get('cardId') or 0))
+
+
+def encode_cursor(key: ReviewKey) -> str:
+    """Return the opaque cursor pointing after a card."""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode('ascii')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> ReviewKey:
+    """
+    Return the review key a cursor points after.
+
+    Raises:
+        ValueError: If the cursor was not produced by encode_cursor.
+    """
+    try:
+        rank, due, card_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return (int(rank), int(due), int(card_id))
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -1,13 +1,18 @@
 """Service for interacting with Anki through AnkiConnect."""
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import json
 import requests
 from typing import TypedDict
 
 from ..config.anki_config import AnkiConfig
-from ..utils.logging_utils import conditional_log
+from .anki_batching import AnswerCoalescer
+from .anki_connection_state import AnkiConnectionState
+from .anki_http_client import AnkiHttpClient
+from ..utils.logging_utils import module_logger
 from ..utils.anki_error_handler import diagnose_connection_error
 
+log = module_logger(__name__)
+
 class AnkiResponse(TypedDict):
     """Type definition for Anki API response."""
     result: Optional[Any]
@@ -20,8 +25,15 @@ class AnkiService:
         """Initialize the AnkiService using configuration."""
         self.endpoint = AnkiConfig.get_api_endpoint()
         self.email, self.password = AnkiConfig.get_credentials()
-        conditional_log("AnkiService initialized with endpoint: {}", self.endpoint)
-        conditional_log("Using email: {}", self.email if self.email else "Not set")
+        self.client = AnkiHttpClient.from_config(self.endpoint)
+        self.answers = AnswerCoalescer(self.answer_cards, window=AnkiConfig.get_answer_window())
+        settings = AnkiConfig.get_breaker_settings()
+        self.connection = AnkiConnectionState(self._probe, failure_threshold=int(settings['failure_threshold']),
+                                              reset_timeout=settings['reset_timeout'],
+                                              health_ttl=settings['health_ttl'],
+                                              probe_interval=settings['probe_interval'])
+        log("AnkiService initialized with endpoint: {}", self.endpoint)
+        log("Using email: {}", self.email if self.email else "Not set")
 
     def _make_request(self, action: str, params: Dict[str, Any] = {}) -> Tuple[Optional[AnkiResponse], Optional[Dict[str, Any]]]:
         """Make a request to the Anki API.
@@ -36,23 +48,79 @@ class AnkiService:
         Raises:
             requests.exceptions.RequestException: If the request fails
         """
-        payload = {
-            "action": action,
-            "version": 6,
-            "params": params
-        }
+        if not self.connection.allow_request():
+            log("Anki API request {} refused: circuit open", action)
+            return None, self.connection.open_diagnosis()
         
-        conditional_log("Making Anki API request: action={}, params={}", action, params)
+        log("Making Anki API request: action={}, params={}", action, params)
         
         try:
-            response = requests.post(self.endpoint, json=payload, timeout=5)
-            response_data = response.json()
-            conditional_log("Anki API response: {}", response_data)
+            response_data = self.client.post(action, params)
+            self.connection.record_success()
+            log("Anki API response: {}", response_data)
             return response_data, None
         except requests.exceptions.RequestException as e:
             error_diagnosis = diagnose_connection_error(e)
-            conditional_log("Anki API request failed: {}", error_diagnosis)
+            self.connection.record_failure(error_diagnosis)
+            log("Anki API request failed: {}", error_diagnosis)
+            return None, error_diagnosis
+
+    def _probe(self) -> bool:
+        """Check whether AnkiConnect answers, bypassing the circuit breaker.
+        
+        Returns:
+            True if AnkiConnect answered the version action
+        """
+        try:
+            response = self.client.post("version", {})
+        except requests.exceptions.RequestException:
+            return False
+        return isinstance(response, dict) and response.get("error") is None
+
+    def multi(self, actions: List[Tuple[str, Dict[str, Any]]]) -> Tuple[Optional[List[AnkiResponse]], Optional[Dict[str, Any]]]:
+        """Run several actions in one round trip with the AnkiConnect multi action.
+        
+        AnkiConnect runs the actions in order, so an action may depend on
+        the side effects of the previous ones but not on their results.
+        
+        Args:
+            actions: (action, params) pairs to run in order
+            
+        Returns:
+            Tuple of (one response per action, error diagnosis) if error occurs
+        """
+        response, error_diagnosis = self._make_request("multi", {
+            "actions": [{"action": action, "version": 6, "params": params} for action, params in actions]
+        })
+        if not response or response.get('error') is not None or not isinstance(response.get('result'), list):
             return None, error_diagnosis
+        return response['result'], None
+
+    def answer_cards(self, answers: List[Dict[str, Any]]) -> Optional[List[bool]]:
+        """Submit several answers in one answerCards call.
+        
+        Args:
+            answers: Answers with cardId and ease
+            
+        Returns:
+            Whether each answer was recorded, or None if the request failed
+        """
+        response, _ = self._make_request("answerCards", {"answers": answers})
+        if not response or response.get('error') is not None or not isinstance(response.get('result'), list):
+            return None
+        return response['result']
+
+    def submit_answer(self, card_id: int, ease: int) -> bool:
+        """Submit one answer, grouped with the answers submitted at the same time.
+        
+        Args:
+            card_id: ID of the card being answered
+            ease: Ease rating (1=Again, 2=Hard, 3=Good, 4=Easy)
+            
+        Returns:
+            True if the answer was recorded
+        """
+        return self.answers.submit(card_id, ease)
 
     def authenticate(self) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Authenticate with Anki using credentials.
@@ -61,7 +129,7 @@ class AnkiService:
             Tuple of (success status, error diagnosis if any)
         """
         if not self.email or not self.password:
-            conditional_log("Missing Anki credentials")
+            log("Missing Anki credentials")
             return False, {
                 'error_type': 'ConfigError',
                 'message': 'Missing credentials',
@@ -70,13 +138,13 @@ class AnkiService:
             }
 
         try:
-            conditional_log("Attempting Anki authentication with email: {}", self.email)
+            log("Attempting Anki authentication with email: {}", self.email)
             is_connected, error_diagnosis = self.test_connection()
             if is_connected:
-                conditional_log("Anki authentication successful")
+                log("Anki authentication successful")
                 return True, None
             else:
-                conditional_log("Anki authentication failed")
+                log("Anki authentication failed")
                 return False, error_diagnosis
         except Exception as e:
             error_diagnosis = {
@@ -85,28 +153,37 @@ class AnkiService:
                 'possible_causes': ['Unexpected error during authentication'],
                 'suggestions': ['Check application logs for details']
             }
-            conditional_log("Anki authentication error: {}", str(e), level='ERROR')
+            log("Anki authentication error: {}", str(e), level='ERROR')
             return False, error_diagnosis
 
     def test_connection(self) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Test the connection to Anki.
         
+        The result is reused for a few seconds, and is known at once while
+        the circuit breaker is open.
+        
         Returns:
             Tuple of (success status, error diagnosis if any)
         """
+        cached = self.connection.cached_health()
+        if cached is not None:
+            log("Using cached Anki connection test result: {}", cached[0])
+            return cached
         try:
-            conditional_log("Testing Anki connection")
+            log("Testing Anki connection")
             response, error_diagnosis = self._make_request("version")
             
             if response and "result" in response and response.get("error") is None:
-                conditional_log("Anki connection test successful")
+                log("Anki connection test successful")
+                self.connection.store_health(True)
                 return True, None
             else:
-                conditional_log("Anki connection test failed: invalid response")
+                log("Anki connection test failed: invalid response")
+                self.connection.store_health(False, error_diagnosis)
                 return False, error_diagnosis
         except Exception as e:
             error_diagnosis = diagnose_connection_error(e)
-            conditional_log("Anki connection test failed: {}", str(e), level='ERROR')
+            log("Anki connection test failed: {}", str(e), level='ERROR')
             return False, error_diagnosis
 
     def get_deck_names(self) -> list[str]:
@@ -118,8 +195,8 @@ class AnkiService:
         Raises:
             requests.exceptions.RequestException: If the request fails
         """
-        conditional_log("Fetching Anki deck names")
-        response = self._make_request("deckNames")
-        decks = response.get("result", [])
-        conditional_log("Retrieved {} Anki decks", len(decks))
+        log("Fetching Anki deck names")
+        response, _ = self._make_request("deckNames")
+        decks = (response or {}).get("result") or []
+        log("Retrieved {} Anki decks", len(decks))
         return decks 
\ No newline at end of file
@@ -0,0 +1,319 @@
+"""Local AnkiConnect simulator for tests, benchmarks and development without Anki.
+
+Usage:
+    python -m svt_app.services.anki_simulator [--port 8765] [--deck Biologie:500] [--latency-ms 5]
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+STYLE = "<style>.card { font-family: arial; font-size: 20px; text-align: center; }</style>"
+WORDS = ("mitose", "méiose", "chromosome", "allèle", "gène", "cellule", "noyau", "ADN", "gamète", "zygote")
+
+# Days until the next review for each ease of a card answered correctly
+INTERVALS = {2: 1, 3: 3, 4: 7}
+LEARNING_STEP = 60
+
+
+@dataclass
+class SimulatedCard:
+    """
+    A card of the simulated collection.
+
+    Attributes:
+        card_id (int): Card ID.
+        deck (str): Name of the deck.
+        question (str): Question HTML, as rendered by Anki.
+        answer (str): Answer HTML, as rendered by Anki.
+        queue (int): 0 new, 1 learning, 2 review.
+        due (int): New card position, learning timestamp or review day.
+        mod (int): Modification time in seconds.
+        reviews (List[Dict[str, Any]]): Review log, as returned by getReviewsOfCards.
+    """
+    card_id: int
+    deck: str
+    question: str
+    answer: str
+    queue: int = 0
+    due: int = 0
+    mod: int = 0
+    reviews: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class AnkiSimulator:
+    """
+    In-memory AnkiConnect answering over HTTP on localhost.
+
+    Supports the actions the application sends: version, deckNames,
+    findCards, cardsInfo, cardsModTime, answerCards, getReviewsOfCards and
+    multi. Latency, failures and an unreachable Anki can be injected:
+    failure_rate is the share of requests answered with an AnkiConnect
+    error, drop_rate the share of connections closed without a reply, and
+    down makes every connection close without a reply.
+    """
+
+    def __init__(self, decks: Optional[Dict[str, int]] = None, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 failure_rate: float = 0.0, drop_rate: float = 0.0, cloze_ratio: float = 0.3, seed: int = 42) -> None:
+        """
+        Initialize the simulated collection.
+
+        Args:
+            decks: Number of new cards per deck name, {"Default": 20} by default.
+            latency_ms: Processing time added to every request.
+            jitter_ms: Maximum random time added on top of the latency.
+            failure_rate: Share of requests answered with an error.
+            drop_rate: Share of requests whose connection is closed without a reply.
+            cloze_ratio: Share of generated cards using cloze deletions.
+            seed: Seed of the card content and failure generators.
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.down = False
+        self.created = time.time()
+        self.cards: Dict[int, SimulatedCard] = {}
+        self.decks: List[str] = []
+        self.requests: Dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        for name, size in (decks if decks is not None else {"Default": 20}).items():
+            self.add_deck(name, size, cloze_ratio)
+
+    def add_deck(self, name: str, size: int, cloze_ratio: float = 0.3) -> None:
+        """Add a deck of new cards with generated content."""
+        with self._lock:
+            self.decks.append(name)
+            first_id = 1500000000000 + len(self.cards)
+            for position in range(size):
+                question, answer = self._generate_content(cloze_ratio)
+                card_id = first_id + position
+                self.cards[card_id] = SimulatedCard(card_id, name, question, answer, due=position,
+                                                    mod=int(self.created))
+
+    def _generate_content(self, cloze_ratio: float) -> Tuple[str, str]:
+        """Return the question and answer HTML of a Basic or Cloze card."""
+        text = " ".join(self._random.choice(WORDS) for _ in range(self._random.randint(8, 40)))
+        word = self._random.choice(WORDS)
+        if self._random.random() < cloze_ratio:
+            return (f'{STYLE}<div class="card">{text} <span class="cloze" data-cloze="{word}">[...]</span></div>',
+                    f'{STYLE}<div class="card">{text} <span class="cloze">{word}</span></div>')
+        return (f'{STYLE}<div class="card">{text} : <b>{word}</b> ?</div>',
+                f'{STYLE}<div class="card">{text} : <b>{word}</b> ?</div><hr id=answer>{word}')
+
+    def today(self) -> int:
+        """Return the current day of the collection, review due values being days."""
+        return int((time.time() - self.created) // 86400)
+
+    # Actions
+
+    def handle(self, action: str, params: Dict[str, Any]) -> Any:
+        """
+        Run one action and return its result.
+
+        Raises:
+            ValueError: If the action is not supported.
+        """
+        handler: Optional[Callable[[Dict[str, Any]], Any]] = getattr(self, f"_action_{action}", None)
+        if handler is None:
+            raise ValueError(f"unsupported action: {action}")
+        with self._lock:
+            self.requests[action] = self.requests.get(action, 0) + 1
+            return handler(params)
+
+    def _action_version(self, params: Dict[str, Any]) -> int:
+        """Return the AnkiConnect API version."""
+        return 6
+
+    def _action_deckNames(self, params: Dict[str, Any]) -> List[str]:
+        """Return the deck names."""
+        return list(self.decks)
+
+    def _action_findCards(self, params: Dict[str, Any]) -> List[int]:
+        """Return the cards of a deck matching is:new, is:learn and is:due terms."""
+        query = params.get("query", "")
+        match = re.search(r'deck:"([^"]*)"|deck:(\S+)', query)
+        deck = (match.group(1) or match.group(2)) if match else None
+        states = set(re.findall(r'is:(new|learn|due)', query)) or {"new", "learn", "due"}
+        today = self.today()
+        return [card.card_id for card in self.cards.values()
+                if (deck is None or card.deck == deck)
+                and (("new" in states and card.queue == 0)
+                     or ("learn" in states and card.queue == 1)
+                     or ("due" in states and card.queue == 2 and card.due <= today))]
+
+    def _action_cardsInfo(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the details of cards, an empty object for unknown ones."""
+        infos: List[Dict[str, Any]] = []
+        for card_id in params.get("cards", []):
+            card = self.cards.get(card_id)
+            infos.append({} if card is None else {
+                "cardId": card.card_id, "deckName": card.deck, "question": card.question, "answer": card.answer,
+                "queue": card.queue, "type": card.queue, "due": card.due, "mod": card.mod,
+                "reps": len(card.reviews)
+            })
+        return infos
+
+    def _action_cardsModTime(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the modification time of cards."""
+        return [{"cardId": card_id, "mod": self.cards[card_id].mod}
+                for card_id in params.get("cards", []) if card_id in self.cards]
+
+    def _action_answerCards(self, params: Dict[str, Any]) -> List[bool]:
+        """Answer cards, rescheduling them with fixed intervals."""
+        results = []
+        now = time.time()
+        for answer in params.get("answers", []):
+            card = self.cards.get(answer.get("cardId"))
+            if card is None:
+                results.append(False)
+                continue
+            ease = int(answer.get("ease", 3))
+            if ease <= 1:
+                card.queue, card.due = 1, int(now) + LEARNING_STEP
+            else:
+                card.queue, card.due = 2, self.today() + INTERVALS.get(ease, 3)
+            card.mod = int(now)
+            card.reviews.append({"id": int(now * 1000) + len(card.reviews), "ease": ease})
+            results.append(True)
+        return results
+
+    def _action_getReviewsOfCards(self, params: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the review log of cards."""
+        return {str(card_id): list(self.cards[card_id].reviews) if card_id in self.cards else []
+                for card_id in params.get("cards", [])}
+
+    def run_multi(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the actions of a multi request in order, each with its own result and error."""
+        responses = []
+        for sub in params.get("actions", []):
+            try:
+                responses.append({"result": self.handle(sub.get("action", ""), sub.get("params", {})), "error": None})
+            except Exception as e:
+                responses.append({"result": None, "error": str(e)})
+        return responses
+
+    # Transport
+
+    def respond(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Produce the reply to a request, after the injected latency.
+
+        Returns:
+            Optional[Dict[str, Any]]: The reply, or None if the connection must be dropped.
+        """
+        delay = self.latency_ms + (self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay:
+            time.sleep(delay / 1000)
+        if self.down or (self.drop_rate and self._random.random() < self.drop_rate):
+            return None
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            return {"result": None, "error": "simulated failure"}
+        action = payload.get("action", "")
+        try:
+            if action == "multi":
+                with self._lock:
+                    self.requests["multi"] = self.requests.get("multi", 0) + 1
+                return {"result": self.run_multi(payload.get("params", {})), "error": None}
+            return {"result": self.handle(action, payload.get("params", {})), "error": None}
+        except Exception as e:
+            return {"result": None, "error": str(e)}
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Serve the simulator in a background thread.
+
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on, a free one by default.
+
+        Returns:
+            str: The endpoint URL.
+        """
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Keep-alive HTTP handler forwarding requests to the simulator."""
+
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self) -> None:
+                """Answer one AnkiConnect request."""
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                reply = simulator.respond(payload)
+                if reply is None:
+                    self.close_connection = True
+                    return
+                body = json.dumps(reply).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                """Keep the output quiet."""
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="anki-simulator", daemon=True).start()
+        return self.endpoint
+
+    @property
+    def endpoint(self) -> str:
+        """Return the URL the simulator listens on."""
+        if self._server is None:
+            raise RuntimeError("The simulator is not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "AnkiSimulator":
+        """Start the simulator on a free port."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Stop the simulator."""
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the simulator in the foreground until interrupted."""
+    parser = argparse.ArgumentParser(description="Local AnkiConnect simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--deck", action="append", default=[], metavar="NAME:SIZE",
+                        help="deck to create, repeatable (default Default:20)")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    decks = {name: int(size) for name, _, size in (deck.rpartition(":") for deck in args.deck)} or None
+    simulator = AnkiSimulator(decks, latency_ms=args.latency_ms, failure_rate=args.failure_rate,
+                              drop_rate=args.drop_rate)
+    print(f"AnkiConnect simulator listening on {simulator.start(args.host, args.port)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
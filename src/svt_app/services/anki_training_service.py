@@ -1,25 +1,39 @@
 """Service for handling Anki card training."""
-from typing import Dict, Any, List, Optional
-from ..utils.logging_utils import conditional_log
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
+from ..utils.logging_utils import module_logger
 from .anki_service import AnkiService
 from .anki_card_formatter import AnkiCardFormatter
 from .anki_card_types import AnkiCardTypes
+from .anki_card_cache import CachedCard, DeckCardCache, DeckEntry
+from .anki_review_order import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor, review_key
+from .anki_outbox import AnkiOutbox
+from ..config.anki_config import AnkiConfig
+
+log = module_logger(__name__)
 
 class AnkiTrainingService:
     """Service for managing Anki card training sessions."""
 
-    def __init__(self, anki_service: AnkiService):
+    def __init__(self, anki_service: AnkiService, outbox: Optional[AnkiOutbox] = None):
         """Initialize the training service.
         
         Args:
             anki_service: Instance of AnkiService for API communication
+            outbox: Outbox answers are queued in, or None to send them synchronously
         """
         self.anki = anki_service
         self.formatter = AnkiCardFormatter()
         self.card_types = AnkiCardTypes()
+        self.cache = DeckCardCache(ttl=AnkiConfig.get_card_cache_ttl())
+        self.outbox = outbox
+        if outbox is not None:
+            outbox.on_synced = self._answers_synced
 
     def get_cards_for_review(self, deck_name: str) -> List[Dict[str, Any]]:
-        """Get all cards available for review in a deck.
+        """Get all cards available for review in a deck, in review order.
+        
+        Cards with an answer still waiting in the outbox are left out, as
+        Anki does not know yet they were reviewed.
         
         Args:
             deck_name: Name of the deck to get cards from
@@ -27,67 +41,228 @@ class AnkiTrainingService:
         Returns:
             List of card data dictionaries
         """
-        conditional_log("Fetching all reviewable cards for deck: {}", deck_name)
+        entry = self._deck_entry(deck_name)
+        if entry is None:
+            return []
+        answered = self._answered_card_ids()
+        return self._format([entry.cards[card_id] for card_id in entry.card_ids if card_id not in answered])
+
+    def get_review_page(self, deck_name: str, cursor: Optional[str] = None,
+                        limit: int = DEFAULT_PAGE_SIZE) -> Optional[Dict[str, Any]]:
+        """Get one page of the cards available for review in a deck, in review order.
+        
+        Only the cards of the page are formatted, so the first page does not
+        wait for the formatting of the whole deck.
+        
+        Args:
+            deck_name: Name of the deck to get cards from
+            cursor: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of cards in the page
+            
+        Returns:
+            The cards, the cursor of the next page (None on the last page) and
+            the number of reviewable cards, or None if Anki could not be reached
+            
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        after = decode_cursor(cursor) if cursor else None
+        entry = self._deck_entry(deck_name)
+        if entry is None:
+            return None
+        start = entry.position_after(after) if after is not None else 0
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        answered = self._answered_card_ids()
+        page: List[CachedCard] = []
+        index = start
+        while index < len(entry.card_ids) and len(page) < limit:
+            if entry.card_ids[index] not in answered:
+                page.append(entry.cards[entry.card_ids[index]])
+            index += 1
+        # Another page follows if an unanswered card is left: stop at the first one
+        while index < len(entry.card_ids) and entry.card_ids[index] in answered:
+            index += 1
+        has_more = index < len(entry.card_ids)
+        return {
+            'cards': self._format(page),
+            'next_cursor': encode_cursor(page[-1].key) if has_more and page else None,
+            # The outbox holds few answers: count them rather than the whole deck
+            'total': len(entry.card_ids) - sum(1 for card_id in answered if card_id in entry.cards)
+        }
+
+    def _answered_card_ids(self) -> Set[int]:
+        """Return the cards with an answer waiting in the outbox."""
+        return self.outbox.pending_card_ids() if self.outbox is not None else set()
+
+    def _format(self, cards: List[CachedCard]) -> List[Dict[str, Any]]:
+        """Format the cards that were not formatted yet and return them all.
+        
+        Args:
+            cards: Cached cards
+            
+        Returns:
+            The formatted cards, in order
+        """
+        missing = [cached for cached in cards if cached.card is None]
+        if missing:
+            formatted = self.formatter.extract_cards_fields([cached.raw for cached in missing])
+            for cached, formatted_fields in zip(missing, formatted):
+                cached.card = {
+                    'cardId': cached.raw.get('cardId'),
+                    'question': formatted_fields['question'],
+                    'answer': formatted_fields['answer']
+                }
+        return [cached.card for cached in cards if cached.card is not None]
+
+    def _deck_entry(self, deck_name: str) -> Optional[DeckEntry]:
+        """Get the reviewable cards of a deck according to Anki.
+        
+        Cards are served from the deck cache while it is fresh. Otherwise
+        only the cards that are new or were modified since they were
+        cached are fetched again.
+        
+        Args:
+            deck_name: Name of the deck to get cards from
+            
+        Returns:
+            The deck cache entry, or None if Anki could not be reached
+        """
+        cached = self.cache.fresh(deck_name)
+        if cached is not None:
+            log("Serving {} cached cards for deck: {}", len(cached.card_ids), deck_name)
+            return cached
+            
+        log("Fetching all reviewable cards for deck: {}", deck_name)
+        version = self.cache.version(deck_name)
         query = self.card_types.build_deck_query(deck_name)
         
-        response, _ = self.anki._make_request("findCards", {
-            "query": query
-        })
+        response = self._find_cards(query)
         
         if not response or 'result' not in response:
-            conditional_log("No cards found or error occurred")
-            return []
+            log("No cards found or error occurred")
+            return None
             
         card_ids = response['result']
         if not card_ids:
-            conditional_log("No cards found in deck")
-            return []
+            log("No cards found in deck")
+            return self.cache.store(deck_name, [], {}, version)
             
-        # Get card details
-        response, _ = self.anki._make_request("cardsInfo", {
-            "cards": card_ids
-        })
+        known = self.cache.known(deck_name)
+        changed = self._changed_cards(card_ids, known)
+        log("{} of {} cards changed since the last refresh", len(changed), len(card_ids))
+        if changed:
+            # Get card details
+            response, _ = self.anki._make_request("cardsInfo", {
+                "cards": changed
+            })
+            
+            if not response or 'result' not in response:
+                return None
+                
+            for card in response['result']:
+                known[card.get('cardId')] = CachedCard(card.get('mod', 0), review_key(card), {
+                    'cardId': card.get('cardId'),
+                    'question': card.get('question', ''),
+                    'answer': card.get('answer', '')
+                })
+            
+        return self.cache.store(deck_name, card_ids, known, version)
+
+    def _changed_cards(self, card_ids: List[int], known: Dict[int, CachedCard]) -> List[int]:
+        """Return the cards that are not cached or were modified since they were cached.
         
-        if not response or 'result' not in response:
-            return []
+        Args:
+            card_ids: Reviewable card IDs
+            known: Cached cards of the deck
             
-        raw_cards = response['result']
-        conditional_log("Found {} cards", len(raw_cards))
-        
-        # Format each card's content
-        formatted_cards = []
-        for card in raw_cards:
-            formatted_fields = self.formatter.extract_card_fields(card)
-            formatted_card = {
-                'cardId': card.get('cardId'),
-                'question': formatted_fields['question'],
-                'answer': formatted_fields['answer']
-            }
-            formatted_cards.append(formatted_card)
+        Returns:
+            IDs of the cards to fetch again, every card if modification times are unavailable
+        """
+        if not known:
+            return list(card_ids)
+        response, _ = self.anki._make_request("cardsModTime", {"cards": card_ids})
+        if not response or response.get('error') is not None or not isinstance(response.get('result'), list):
+            return list(card_ids)
+        mods = {entry.get('cardId'): entry.get('mod') for entry in response['result']}
+        return [card_id for card_id in card_ids
+                if card_id not in known or mods.get(card_id) is None or known[card_id].mod != mods[card_id]]
+
+    def _find_cards(self, query: str) -> Optional[Dict[str, Any]]:
+        """Run a findCards query, sending the pending answers in the same round trip.
+        
+        The answers go first in the multi action, so the query already sees
+        the cards they rescheduled.
+        
+        Args:
+            query: The AnkiConnect search query
             
-        return formatted_cards
+        Returns:
+            The findCards response, or None if the request failed
+        """
+        answers, settle = self._claim_answers()
+        if settle is None:
+            response, _ = self.anki._make_request("findCards", {"query": query})
+            return response
+        responses = None
+        try:
+            responses, _ = self.anki.multi([
+                ("answerCards", {"answers": answers}),
+                ("findCards", {"query": query})
+            ])
+        finally:
+            answered = responses[0] if responses else None
+            settle(answered.get('result') if isinstance(answered, dict) else None)
+        return responses[1] if responses and len(responses) > 1 else None
 
-    def answer_card(self, card_id: int, ease: int) -> bool:
+    def _claim_answers(self) -> Tuple[List[Dict[str, Any]], Optional[Callable[[Optional[List[bool]]], None]]]:
+        """Claim the answers waiting to be sent, from the outbox or the answer window.
+        
+        Returns:
+            Tuple of (answers, function taking their results), or ([], None) if none is waiting
+        """
+        if self.outbox is None:
+            batch = self.anki.answers.take()
+            if batch is None:
+                return [], None
+            return batch.answers, lambda results: self.anki.answers.complete(batch, results)
+        entries = self.outbox.take()
+        if entries is None:
+            return [], None
+        try:
+            self.outbox.mark_attempted(entries)
+        except Exception:
+            self.outbox.settle(entries, None)
+            raise
+        return ([{"cardId": entry.card_id, "ease": entry.ease} for entry in entries],
+                lambda results: self.outbox.settle(entries, results))
+
+    def _answers_synced(self, card_ids: List[int]) -> None:
+        """Refresh the decks of the cards whose answers reached Anki."""
+        for card_id in set(card_ids):
+            self.cache.invalidate_card(card_id)
+
+    def answer_card(self, card_id: int, ease: int, idempotency_key: Optional[str] = None) -> bool:
         """Submit an answer for a card.
         
+        With an outbox, the answer is queued and sent in the background.
+        
         Args:
             card_id: ID of the card being answered
             ease: Ease rating (1=Again, 2=Hard, 3=Good, 4=Easy)
+            idempotency_key: Key identifying the answer, so a resubmission is recorded once
             
         Returns:
             True if answer was submitted successfully
         """
-        conditional_log("Answering card {} with ease {}", card_id, ease)
-        response, _ = self.anki._make_request("answerCards", {
-            "answers": [
-                {
-                    "cardId": card_id,
-                    "ease": ease
-                }
-            ]
-        })
-        
-        success = response and 'result' in response and response.get('error') is None
-        conditional_log("Answer submission {}", "successful" if success else "failed")
+        log("Answering card {} with ease {}", card_id, ease)
+        if self.outbox is not None:
+            self.cache.invalidate_card(card_id)
+            self.outbox.enqueue(card_id, ease, idempotency_key)
+            return True
+        # Invalidate on both sides, so a refresh racing the answer is not kept as fresh
+        self.cache.invalidate_card(card_id)
+        success = self.anki.submit_answer(card_id, ease)
+        self.cache.invalidate_card(card_id)
+        log("Answer submission {}", "successful" if success else "failed")
         return success
 
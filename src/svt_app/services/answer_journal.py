@@ -0,0 +1,438 @@
+"""Append-only answer journal with background compaction for Révijouer application."""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from svt_app.services.question_index import normalize_folder
+from svt_app.utils.logging_utils import module_logger
+
+log = module_logger(__name__)
+
+COMPACTING_SUFFIX = '.compacting'
+DONE_SUFFIX = '.done'
+# Key of the scores file in the done file
+SCORES_MARKER = ':scores'
+
+
+@dataclass
+class QuestionDelta:
+    """
+    Pending changes to the statistics of one question file.
+
+    Attributes:
+        correct_answers (int): Correct answers to add.
+        wrong_answers (int): Wrong answers to add.
+        completed (Optional[bool]): Completion flag to set, or None to keep it.
+    """
+    correct_answers: int = 0
+    wrong_answers: int = 0
+    completed: Optional[bool] = None
+
+    def apply(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of the question data with the delta applied."""
+        merged = dict(data)
+        stats = dict(merged.get('statistics', {'correct_answers': 0, 'wrong_answers': 0}))
+        stats['correct_answers'] = stats.get('correct_answers', 0) + self.correct_answers
+        stats['wrong_answers'] = stats.get('wrong_answers', 0) + self.wrong_answers
+        merged['statistics'] = stats
+        if self.completed is not None:
+            merged['completed'] = self.completed
+        return merged
+
+
+@dataclass
+class ScoreDelta:
+    """
+    Pending change to one game score.
+
+    Attributes:
+        value (Optional[int]): Value the score was set to, or None to start from the stored score.
+        delta (int): Amount added after that.
+    """
+    value: Optional[int] = None
+    delta: int = 0
+
+    def apply(self, score: int) -> int:
+        """Return the score with the delta applied."""
+        return (score if self.value is None else self.value) + self.delta
+
+
+QuestionDeltas = Dict[str, QuestionDelta]
+ScoreDeltas = Dict[str, ScoreDelta]
+
+
+def _apply_record(record: Dict[str, Any], questions: QuestionDeltas, scores: ScoreDeltas) -> None:
+    """Fold one journal record into pending question and score deltas."""
+    if record.get('type') == 'answer':
+        delta = questions.setdefault(record['path'], QuestionDelta())
+        if record.get('correct'):
+            delta.correct_answers += 1
+        else:
+            delta.wrong_answers += 1
+        if 'completed' in record:
+            delta.completed = record['completed']
+    elif record.get('type') == 'score':
+        score = scores.setdefault(record['game'], ScoreDelta())
+        if 'value' in record:
+            score.value = record['value']
+            score.delta = 0
+        score.delta += record.get('delta', 0)
+
+
+def _write_bytes_atomic(path: str, content: bytes) -> None:
+    """Write a file through a temporary file so readers never see a partial file."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+def _digest(content: bytes) -> str:
+    """Return the digest identifying a folded file's content in the done file."""
+    return hashlib.sha1(content).hexdigest()
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """Return the digest of a file's current content, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return _digest(f.read())
+    except OSError:
+        return None
+
+
+class AnswerJournal:
+    """
+    Write-behind journal of answers and score changes.
+
+    Answering a question appends one JSON line instead of rewriting the
+    question file and the scores file. A background worker periodically
+    folds the journal into those files; reads merge the files with the
+    records not folded yet. A journal left behind by a crash is replayed
+    when the journal is created.
+
+    Routes that move, rename or delete question files must call compact()
+    first so that no pending record points to a stale path.
+    """
+
+    def __init__(self, journal_path: str, questions_dir: str, scores_file: str,
+                 interval: float = 2.0, threshold: int = 256) -> None:
+        """
+        Initialize the journal and replay any records left by a previous run.
+
+        Args:
+            journal_path: Path of the JSONL journal file.
+            questions_dir: Root directory of the question files the records refer to.
+            scores_file: Path of the persistent scores file.
+            interval: Seconds between background compactions.
+            threshold: Number of records that triggers an early compaction.
+        """
+        self.journal_path = journal_path
+        self.questions_dir = os.path.abspath(questions_dir)
+        self.scores_file = scores_file
+        self.interval = interval
+        self.threshold = threshold
+        self._pending_questions: QuestionDeltas = {}
+        self._pending_scores: ScoreDeltas = {}
+        self._folding_questions: QuestionDeltas = {}
+        self._folding_scores: ScoreDeltas = {}
+        self._records = 0
+        self._file: Optional[Any] = None
+        # Guards the pending state and the journal file; appends only take this lock
+        self._lock = threading.Lock()
+        # Serializes compactions with merged reads so a record is never counted twice
+        self._fold_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self.recover()
+
+    @property
+    def compacting_path(self) -> str:
+        """Return the path the journal is moved to while it is being folded."""
+        return f"{self.journal_path}{COMPACTING_SUFFIX}"
+
+    def _key(self, file_path: str) -> str:
+        """Return the journal key of a question file: its path relative to the questions root."""
+        return normalize_folder(os.path.relpath(os.path.abspath(file_path), self.questions_dir))
+
+    def record_answer(self, file_path: str, correct: bool, completed: Optional[bool] = None) -> None:
+        """
+        Append an answer to the journal.
+
+        Args:
+            file_path: Path of the answered question file.
+            correct: Whether the answer was correct.
+            completed: Completion flag to set on the question, or None to keep it.
+        """
+        record: Dict[str, Any] = {'type': 'answer', 'path': self._key(file_path), 'correct': correct}
+        if completed is not None:
+            record['completed'] = completed
+        self._append(record)
+
+    def record_score(self, game_type: str, delta: int = 0, value: Optional[int] = None) -> None:
+        """
+        Append a score change to the journal.
+
+        Args:
+            game_type: The game whose score changes.
+            delta: Amount to add to the score.
+            value: Value to set the score to before adding delta, or None.
+        """
+        record: Dict[str, Any] = {'type': 'score', 'game': game_type, 'delta': delta}
+        if value is not None:
+            record['value'] = value
+        self._append(record)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Write one record to the journal and fold it into the pending state."""
+        with self._lock:
+            if self._file is None:
+                directory = os.path.dirname(self.journal_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.journal_path, 'a', encoding='utf-8')
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+            _apply_record(record, self._pending_questions, self._pending_scores)
+            self._records += 1
+            if self._records >= self.threshold:
+                self._wake.set()
+        self._ensure_worker()
+
+    def read_question(self, file_path: str) -> Dict[str, Any]:
+        """
+        Read a question file merged with the answers not folded into it yet.
+
+        Args:
+            file_path: Path of the question file.
+
+        Returns:
+            Dict[str, Any]: The question data including pending statistics.
+        """
+        with self._fold_lock:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return self.merge_question(file_path, data)
+
+    def merge_question(self, file_path: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return question data merged with the pending records of its file."""
+        key = self._key(file_path)
+        with self._lock:
+            for deltas in (self._folding_questions, self._pending_questions):
+                if key in deltas:
+                    data = deltas[key].apply(data)
+        return data
+
+    def read_scores(self, defaults: Dict[str, int]) -> Dict[str, int]:
+        """
+        Read the scores file merged with the score changes not folded into it yet.
+
+        Args:
+            defaults: Scores to start from when the file is missing.
+
+        Returns:
+            Dict[str, int]: The current scores.
+        """
+        with self._fold_lock:
+            try:
+                with open(self.scores_file, 'r', encoding='utf-8') as f:
+                    scores = json.load(f)
+            except FileNotFoundError:
+                scores = dict(defaults)
+            with self._lock:
+                for deltas in (self._folding_scores, self._pending_scores):
+                    for game_type, delta in deltas.items():
+                        scores[game_type] = delta.apply(scores.get(game_type, 0))
+            return scores
+
+    def compact(self) -> int:
+        """
+        Fold every pending record into the question and scores files.
+
+        If the fold fails, its records stay in the compacting journal on
+        disk and the next compaction finishes it; reads do not merge them
+        in the meantime, so they are never counted twice.
+
+        Returns:
+            int: Number of files rewritten.
+        """
+        with self._fold_lock:
+            try:
+                # A previous compaction that failed half-way is finished first
+                written = self._fold_leftover()
+                with self._lock:
+                    if not self._records:
+                        return written
+                    if self._file is not None:
+                        self._file.close()
+                        self._file = None
+                    os.replace(self.journal_path, self.compacting_path)
+                    self._folding_questions, self._pending_questions = self._pending_questions, {}
+                    self._folding_scores, self._pending_scores = self._pending_scores, {}
+                    self._records = 0
+                written += self._fold(self._folding_questions, self._folding_scores)
+            finally:
+                with self._lock:
+                    self._folding_questions, self._folding_scores = {}, {}
+        log("Answer journal compacted into {} files", written)
+        return written
+
+    def recover(self) -> int:
+        """
+        Replay the records left on disk by a previous run.
+
+        Returns:
+            int: Number of files rewritten.
+        """
+        with self._fold_lock:
+            written = self._fold_leftover()
+            if os.path.exists(self.journal_path):
+                os.replace(self.journal_path, self.compacting_path)
+                written += self._fold_leftover()
+        if written:
+            log("Replayed answer journal into {} files", written)
+        return written
+
+    def _fold_leftover(self) -> int:
+        """Fold a compacting journal found on disk, skipping files it already reached."""
+        if not os.path.exists(self.compacting_path):
+            return 0
+        questions: QuestionDeltas = {}
+        scores: ScoreDeltas = {}
+        for record in self._read_records(self.compacting_path):
+            _apply_record(record, questions, scores)
+        return self._fold(questions, scores)
+
+    @staticmethod
+    def _read_records(path: str) -> Iterable[Dict[str, Any]]:
+        """Yield the records of a journal file, ignoring a torn last line."""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    log("Skipping unreadable journal line: {!r}", line, level="WARNING")
+
+    def _fold(self, questions: QuestionDeltas, scores: ScoreDeltas) -> int:
+        """
+        Apply deltas to the files, then drop the compacting journal.
+
+        Before a file is replaced, its key and the digest of its new content
+        are appended to a done file. After a crash, a listed file whose
+        content has that digest was already folded and is skipped; any
+        other listed file was not replaced yet and is folded again. A
+        record is therefore applied exactly once.
+        """
+        done_path = f"{self.compacting_path}{DONE_SUFFIX}"
+        done = self._read_done(done_path)
+        written = 0
+        with open(done_path, 'a', encoding='utf-8') as marker:
+            for rel_path, delta in sorted(questions.items()):
+                path = os.path.join(self.questions_dir, *rel_path.split("/"))
+                if self._already_folded(done, rel_path, path):
+                    continue
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    log("Dropping journaled answers for {}: {}", rel_path, str(e), level="WARNING")
+                    continue
+                content = json.dumps(delta.apply(data), indent=4, ensure_ascii=False).encode('utf-8')
+                self._mark(marker, rel_path, content)
+                _write_bytes_atomic(path, content)
+                written += 1
+            if scores and not self._already_folded(done, SCORES_MARKER, self.scores_file):
+                content = self._folded_scores(scores)
+                self._mark(marker, SCORES_MARKER, content)
+                directory = os.path.dirname(self.scores_file)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                _write_bytes_atomic(self.scores_file, content)
+                written += 1
+        os.remove(self.compacting_path)
+        os.remove(done_path)
+        return written
+
+    @staticmethod
+    def _mark(marker: Any, key: str, content: bytes) -> None:
+        """Record in the done file that a file is about to receive new content."""
+        marker.write(f"{key}\t{_digest(content)}\n")
+        marker.flush()
+
+    @staticmethod
+    def _already_folded(done: Dict[str, Optional[str]], key: str, path: str) -> bool:
+        """Tell whether an interrupted compaction already replaced a file."""
+        if key not in done:
+            return False
+        # Entries without a digest were written once the file had been replaced
+        return done[key] is None or done[key] == _file_digest(path)
+
+    @staticmethod
+    def _read_done(done_path: str) -> Dict[str, Optional[str]]:
+        """Return the digest recorded for each file an interrupted compaction was folding."""
+        done: Dict[str, Optional[str]] = {}
+        try:
+            with open(done_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        key, _, digest = line.rstrip("\n").partition("\t")
+                        done[key] = digest or None
+        except FileNotFoundError:
+            pass
+        return done
+
+    def _folded_scores(self, scores: ScoreDeltas) -> bytes:
+        """Return the content of the scores file with score deltas applied."""
+        try:
+            with open(self.scores_file, 'r', encoding='utf-8') as f:
+                stored: Dict[str, int] = json.load(f)
+        except (OSError, ValueError):
+            stored = {}
+        for game_type, delta in scores.items():
+            stored[game_type] = delta.apply(stored.get(game_type, 0))
+        return json.dumps(stored, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def pending(self) -> Tuple[int, int]:
+        """Return the number of questions and scores with records not folded yet."""
+        with self._lock:
+            return (len(self._pending_questions) + len(self._folding_questions),
+                    len(self._pending_scores) + len(self._folding_scores))
+
+    def _ensure_worker(self) -> None:
+        """Start the background compactor on first use."""
+        if self._worker is not None or self.interval <= 0:
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run, name="answer-journal", daemon=True)
+            self._worker.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Compact the journal every interval, or sooner when the threshold is reached."""
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.compact()
+            except Exception as e:
+                log("Error compacting answer journal: {}", str(e), level="ERROR")
+
+    def close(self) -> None:
+        """Stop the background compactor and fold the remaining records."""
+        self._stop.set()
+        self._wake.set()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=5)
+        self.compact()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
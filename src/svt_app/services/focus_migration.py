@@ -0,0 +1,82 @@
+"""Migration of physical folder-focus layouts to the logical focus."""
+
+import argparse
+import os
+import shutil
+from typing import List, Optional
+
+from svt_app.services.question_scanner import BACKUP_PREFIX
+from svt_app.state.focus import FocusState
+from svt_app.utils.logging_utils import conditional_log
+
+
+def restore_focus_backups(base_dir: str) -> List[str]:
+    """
+    Move the folders hidden in every .focused_backup_<name> directory back into place.
+
+    Older versions focused a folder by moving its sibling folders into such a
+    backup directory. Folders whose name is taken again are left in the backup.
+
+    Args:
+        base_dir: Root directory of the fill-in-the-blank question tree.
+
+    Returns:
+        List[str]: The folders that were focused, relative to base_dir.
+    """
+    focused: List[str] = []
+    for root, dirs, _ in os.walk(base_dir):
+        backups = [d for d in dirs if d.startswith(BACKUP_PREFIX)]
+        dirs[:] = [d for d in dirs if not d.startswith(BACKUP_PREFIX)]
+        for backup in backups:
+            backup_dir = os.path.join(root, backup)
+            for item in sorted(os.listdir(backup_dir)):
+                destination = os.path.join(root, item)
+                if os.path.exists(destination):
+                    conditional_log("Warning: {} already exists, leaving it in {}", item, backup_dir, level="WARNING")
+                    continue
+                shutil.move(os.path.join(backup_dir, item), destination)
+                conditional_log("Restored {} from {}", item, backup_dir)
+                if os.path.isdir(destination):
+                    dirs.append(item)
+            if not os.listdir(backup_dir):
+                os.rmdir(backup_dir)
+            folder = os.path.relpath(os.path.join(root, backup[len(BACKUP_PREFIX):]), base_dir)
+            focused.append(folder.replace(os.sep, "/"))
+    return focused
+
+
+def migrate_focus(base_dir: str) -> Optional[str]:
+    """
+    Restore old backup layouts and keep their focus as the logical focus.
+
+    Args:
+        base_dir: Root directory of the fill-in-the-blank question tree.
+
+    Returns:
+        Optional[str]: The focus after the migration.
+    """
+    focused = [folder for folder in restore_focus_backups(base_dir)
+               if os.path.isdir(os.path.join(base_dir, folder))]
+    if focused and not FocusState.get_focus():
+        FocusState.set_focus(focused[0])
+    return FocusState.get_focus()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line entry point.
+
+    Example:
+        python -m svt_app.services.focus_migration assets/Data
+    """
+    parser = argparse.ArgumentParser(description="Restore folders moved away by the old focus feature")
+    parser.add_argument("data_dir", help="Directory holding fill_the_blanks and focus.json")
+    args = parser.parse_args(argv)
+
+    FocusState.FOCUS_FILE = os.path.join(args.data_dir, "focus.json")
+    focus = migrate_focus(os.path.join(args.data_dir, "fill_the_blanks"))
+    print(f"Focus: {focus or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
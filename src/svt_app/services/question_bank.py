@@ -0,0 +1,268 @@
+"""Incrementally refreshed question bank module for Révijouer application."""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+from svt_app.services.question_index import (IndexedQuestion, IndexKey, QuestionIndex, normalize_folder,
+                                             parse_question_id)
+from svt_app.services.question_loader import load_question_files
+from svt_app.services.question_scanner import Manifest, diff_manifests, in_scope, scan_question_files
+from svt_app.services.question_snapshot import QuestionSnapshot
+from svt_app.utils.logging_utils import module_logger
+
+log = module_logger(__name__)
+
+Q = TypeVar('Q')
+QuestionBuilder = Callable[[int, Dict[str, Any]], Q]
+
+
+class QuestionBank(Generic[Q]):
+    """
+    One directory tree of question files mirrored into a QuestionIndex.
+
+    The bank remembers the signature (mtime, size) of every file it parsed,
+    so a refresh costs one stat pass and only re-parses the files that were
+    added or changed, and drops the ones that were deleted. With a
+    snapshot, a reload starts from the content saved by the previous run
+    and only re-parses the files changed since.
+
+    A bank can also sit on top of read-only base entries (the packed bank
+    of the executable): the files of the directory shadow the base entry
+    with the same key, and materialize() copies a base entry into the
+    directory before it is written to.
+
+    Pages, answers and rescans reach the bank from many request threads:
+    the bank and its index share one lock, held by every change and by
+    the ordered views, so readers never see a half-applied refresh.
+    """
+
+    def __init__(self, build: QuestionBuilder, snapshot: Optional[QuestionSnapshot] = None,
+                 base: Optional[List[IndexedQuestion[Q]]] = None) -> None:
+        """
+        Initialize an empty bank.
+
+        Args:
+            build: Factory turning (question ID, JSON data) into a question model.
+            snapshot: Optional warm-start snapshot read and rewritten by reload.
+            base: Optional read-only entries indexed wherever the directory has no file.
+        """
+        self.build = build
+        self.snapshot = snapshot
+        self.base: Dict[IndexKey, IndexedQuestion[Q]] = {}
+        for entry in base or []:
+            self.base.setdefault(entry.key, entry)
+        self.base_dir: Optional[str] = None
+        # Reentrant: reload() refreshes, and materialize() updates, under the lock
+        self.lock = threading.RLock()
+        self.index: QuestionIndex[Q] = QuestionIndex(self.lock)
+        self.manifest: Manifest = {}
+        self.generation = 0
+        self._questions: Optional[List[Q]] = None
+        self._questions_generation = -1
+
+    def questions(self) -> List[Q]:
+        """Return the indexed questions ordered by (id, folder), built again only after a change."""
+        with self.lock:
+            if self._questions is None or self._questions_generation != self.generation:
+                self._questions = [entry.question for entry in self.index]
+                self._questions_generation = self.generation
+            return self._questions
+
+    def is_base(self, entry: Optional[IndexedQuestion[Q]]) -> bool:
+        """Return whether an entry is a read-only base entry rather than a file of the directory."""
+        return entry is not None and self.base.get(entry.key) is entry
+
+    def reload(self, base_dir: str) -> bool:
+        """
+        Forget everything and re-parse every file below base_dir.
+
+        With a snapshot, the unchanged files are taken from it instead, and
+        the snapshot is rewritten if anything had to be parsed.
+        """
+        with self.lock:
+            self.index.clear()
+            self.manifest = {}
+            self.base_dir = base_dir
+            restored = self.snapshot is not None and self._restore(base_dir)
+            changed = self.refresh(base_dir)
+            self._add_base()
+            if self.snapshot is not None and (changed or not restored):
+                self.snapshot.save(base_dir, [(entry.rel_path, entry.folder, entry.question_id,
+                                               self.manifest[entry.rel_path], entry.data)
+                                              for entry in self.index
+                                              if entry.rel_path in self.manifest and not self.is_base(entry)])
+            return True
+
+    def _restore(self, base_dir: str) -> bool:
+        """Index the content saved in the snapshot, as if its files had just been parsed."""
+        snapshot = self.snapshot.load(base_dir) if self.snapshot is not None else None
+        if snapshot is None:
+            return False
+        restored: Manifest = {}
+        for rel_path, folder, question_id, signature, data in snapshot:
+            entry = IndexedQuestion(folder=folder, question_id=question_id, rel_path=rel_path,
+                                    question=self.build(question_id, data), data=data)
+            if self.index.add(entry):
+                restored[rel_path] = signature
+        # Files without saved content (unreadable, duplicates) are parsed again by the refresh
+        self.manifest = restored
+        self.generation += 1
+        log("Restored {} questions of {} from {}", len(self.index), base_dir, self.snapshot.path)
+        return True
+
+    def refresh(self, base_dir: str, folder: str = "", recursive: bool = True) -> bool:
+        """
+        Bring the index in line with the files currently on disk.
+
+        Args:
+            base_dir: The root directory of the question bank.
+            folder: Optional folder to limit the rescan to ("" for the whole bank).
+            recursive: Whether a folder rescan also covers its subfolders.
+
+        Returns:
+            bool: True if at least one question was added, changed or removed.
+        """
+        with self.lock:
+            if base_dir != self.base_dir:
+                self.index.clear()
+                self.manifest = {}
+                self.base_dir = base_dir
+                self._add_base()
+                folder, recursive = "", True
+            folder = normalize_folder(folder)
+            scanned = scan_question_files(base_dir, folder, recursive)
+            if folder or not recursive:
+                # Merge the targeted scan into the manifest of the rest of the bank
+                current = {path: signature for path, signature in self.manifest.items()
+                           if not in_scope(path, folder, recursive)}
+                current.update(scanned)
+            else:
+                current = scanned
+            diff = diff_manifests(self.manifest, current)
+            if not diff:
+                return False
+
+            log("Refreshing {}: {} added, {} changed, {} removed", base_dir,
+                len(diff.added), len(diff.changed), len(diff.removed))
+            orphans: set = set()
+            for rel_path in diff.removed + diff.changed:
+                if self.index.remove_path(rel_path) is not None:
+                    orphans.add(self._key_of(rel_path))
+            # A removed file may have been shadowing a duplicate (e.g. question01/question001)
+            shadowed: List[str] = []
+            if orphans:
+                pending = set(diff.added) | set(diff.changed)
+                shadowed = [path for path in current if path not in pending
+                            and self._key_of(path) in orphans and self.index.get_by_path(path) is None]
+            for entry in self._parse_many(sorted(diff.changed + diff.added + shadowed)):
+                if self.index.add(entry):
+                    continue
+                if self.is_base(self.index.get(*entry.key)):
+                    # The writable copy of a packed question replaces it
+                    self.index.put(entry)
+                else:
+                    log("Warning: Duplicate question ID {} found in {}. Skipping.",
+                        entry.question_id, entry.rel_path, level="WARNING")
+            self.manifest = current
+            # A deleted copy brings the packed question back
+            self._add_base(orphans)
+            self.generation += 1
+            return True
+
+    def _add_base(self, keys: Optional[set] = None) -> None:
+        """Index the base entries whose key no file of the directory holds."""
+        added = 0
+        for key in (self.base if keys is None else keys):
+            entry = self.base.get(key)
+            if entry is not None and self.index.add(entry):
+                added += 1
+        if added:
+            self.generation += 1
+
+    def materialize(self, rel_path: str) -> bool:
+        """
+        Copy a base question into the directory, so that it can be written to.
+
+        Args:
+            rel_path: Path of the question relative to the bank root.
+
+        Returns:
+            bool: True if the file was written, False if it is not a base entry.
+        """
+        with self.lock:
+            rel_path = normalize_folder(rel_path)
+            entry = self.index.get_by_path(rel_path)
+            if not self.is_base(entry):
+                return False
+            file_path = os.path.join(self.base_dir, *rel_path.split("/"))
+            directory = os.path.dirname(file_path)
+            text = json.dumps(entry.data, ensure_ascii=False, indent=2)
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=".question_", suffix=".json", dir=directory)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(temp_path, file_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+            log("Copied packed question {} to {}", rel_path, file_path)
+            # The copy gets its own data, the base entry keeps the packed content
+            self.update(rel_path, json.loads(text))
+            return True
+
+    def update(self, rel_path: str, data: Dict[str, Any]) -> Optional[IndexedQuestion[Q]]:
+        """
+        Record new content the application just wrote to a question file.
+
+        The entry and its active-ID bookkeeping are updated in place and the
+        file's new signature is stored, so the next refresh does not re-parse it.
+
+        Args:
+            rel_path: Path of the file relative to the bank root.
+            data: The JSON content that was written.
+
+        Returns:
+            Optional[IndexedQuestion[Q]]: The updated entry, or None if the path is not indexed.
+        """
+        with self.lock:
+            rel_path = normalize_folder(rel_path)
+            previous = self.index.get_by_path(rel_path)
+            if previous is None:
+                return None
+            entry = IndexedQuestion(folder=previous.folder, question_id=previous.question_id, rel_path=rel_path,
+                                    question=self.build(previous.question_id, data), data=data)
+            self.index.put(entry)
+            try:
+                stat = os.stat(os.path.join(self.base_dir, *rel_path.split("/")))
+                self.manifest[rel_path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                self.manifest.pop(rel_path, None)
+            self.generation += 1
+            return entry
+
+    @staticmethod
+    def _key_of(rel_path: str) -> tuple:
+        """Return the (folder, id) key a relative path maps to."""
+        folder, _, name = rel_path.rpartition("/")
+        return folder, parse_question_id(name)
+
+    def _parse_many(self, rel_paths: List[str]) -> List[IndexedQuestion[Q]]:
+        """Parse several question files in order, reporting the unreadable ones together."""
+        loaded = load_question_files(self.base_dir, rel_paths)
+        entries = []
+        for rel_path, data in loaded.data.items():
+            folder, question_id = self._key_of(rel_path)
+            try:
+                question = self.build(question_id, data)
+            except Exception as e:
+                loaded.errors[rel_path] = str(e)
+                continue
+            entries.append(IndexedQuestion(folder=folder, question_id=question_id, rel_path=rel_path,
+                                           question=question, data=data))
+        loaded.report(self.base_dir)
+        return entries
@@ -0,0 +1,262 @@
+"""Composite-key question index module for Révijouer application."""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+from svt_app.services.active_question_set import ActiveQuestionSet
+
+# Matches question01.json, question001.json and question1.json alike
+QUESTION_FILE_PATTERN = re.compile(r'^question(\d+)\.json$')
+
+Q = TypeVar('Q')
+IndexKey = Tuple[str, int]
+
+
+def parse_question_id(filename: str) -> Optional[int]:
+    """
+    Extract the question ID from a question file name.
+
+    Args:
+        filename: The bare file name, e.g. "question001.json".
+
+    Returns:
+        Optional[int]: The question ID, or None if the name is not a question file.
+    """
+    match = QUESTION_FILE_PATTERN.match(filename)
+    return int(match.group(1)) if match else None
+
+
+def normalize_folder(folder: Optional[str]) -> str:
+    """
+    Normalize a folder path relative to a question bank root.
+
+    Args:
+        folder: A relative folder path using either separator, or None for the root.
+
+    Returns:
+        str: The folder with forward slashes and no leading/trailing separator.
+    """
+    return (folder or "").replace("\\", "/").strip("/")
+
+
+@dataclass
+class IndexedQuestion(Generic[Q]):
+    """
+    A question together with its location and raw JSON data.
+
+    Attributes:
+        folder (str): Normalized folder of the question file ("" for the root).
+        question_id (int): ID parsed from the file name.
+        rel_path (str): Normalized path of the file relative to the bank root.
+        question (Q): The parsed question model.
+        data (Dict[str, Any]): The raw JSON content (completion, statistics...).
+    """
+    folder: str
+    question_id: int
+    rel_path: str
+    question: Q
+    data: Dict[str, Any]
+
+    @property
+    def key(self) -> IndexKey:
+        """Return the composite (folder, id) key of the question."""
+        return self.folder, self.question_id
+
+    @property
+    def completed(self) -> bool:
+        """Return whether the question is marked as completed."""
+        return bool(self.data.get('completed', False))
+
+
+class QuestionIndex(Generic[Q]):
+    """
+    In-memory index of questions keyed by (folder, id).
+
+    Secondary maps give O(1) access by relative path, by folder and by ID;
+    iteration is ordered by (id, folder) like the historical sorted lists.
+    The IDs of non-completed questions are mirrored in ``active``.
+
+    Request threads read the index while a refresh changes it: the maps
+    are only changed and read under the lock, which the owning bank
+    shares so that a whole refresh is atomic for readers.
+    """
+
+    def __init__(self, lock: Optional[threading.RLock] = None) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            lock: Lock guarding the maps, a new one by default.
+        """
+        self._lock = lock or threading.RLock()
+        self._entries: Dict[IndexKey, IndexedQuestion[Q]] = {}
+        self._by_path: Dict[str, IndexKey] = {}
+        self._by_folder: Dict[str, Dict[int, IndexKey]] = {}
+        self._by_id: Dict[int, Dict[str, IndexKey]] = {}
+        self._ordered: Optional[List[IndexKey]] = None
+        self.active = ActiveQuestionSet(self._lock)
+
+    def add(self, entry: IndexedQuestion[Q]) -> bool:
+        """
+        Add an entry unless its key is already taken.
+
+        Args:
+            entry: The entry to add.
+
+        Returns:
+            bool: True if added, False if the (folder, id) key already exists.
+        """
+        with self._lock:
+            if entry.key in self._entries:
+                return False
+            self.put(entry)
+            return True
+
+    def put(self, entry: IndexedQuestion[Q]) -> None:
+        """Insert or replace the entry stored under the entry's key."""
+        with self._lock:
+            key = entry.key
+            previous = self._entries.get(key)
+            if previous is not None and previous.rel_path != entry.rel_path:
+                self._by_path.pop(previous.rel_path, None)
+            if previous is None:
+                self._ordered = None
+            else:
+                self.active.discard(previous.folder, previous.question_id)
+            if not entry.completed:
+                self.active.add(entry.folder, entry.question_id)
+            self._entries[key] = entry
+            self._by_path[entry.rel_path] = key
+            self._by_folder.setdefault(entry.folder, {})[entry.question_id] = key
+            self._by_id.setdefault(entry.question_id, {})[entry.folder] = key
+
+    def remove(self, folder: str, question_id: int) -> Optional[IndexedQuestion[Q]]:
+        """Remove and return the entry under (folder, id), if any."""
+        with self._lock:
+            entry = self._entries.pop((normalize_folder(folder), question_id), None)
+            if entry is None:
+                return None
+            self._by_path.pop(entry.rel_path, None)
+            self.active.discard(entry.folder, entry.question_id)
+            self._drop_secondary(self._by_folder, entry.folder, entry.question_id)
+            self._drop_secondary(self._by_id, entry.question_id, entry.folder)
+            self._ordered = None
+            return entry
+
+    def remove_path(self, rel_path: str) -> Optional[IndexedQuestion[Q]]:
+        """Remove and return the entry stored for a relative file path, if any."""
+        with self._lock:
+            key = self._by_path.get(normalize_folder(rel_path))
+            return self.remove(*key) if key else None
+
+    def set_completed(self, folder: Optional[str], question_id: int, completed: bool) -> bool:
+        """
+        Update the completion flag of an entry and the active ID sets.
+
+        Returns:
+            bool: False if no entry exists under (folder, id).
+        """
+        with self._lock:
+            entry = self.get(folder, question_id)
+            if entry is None:
+                return False
+            entry.data['completed'] = completed
+            if completed:
+                self.active.discard(entry.folder, question_id)
+            else:
+                self.active.add(entry.folder, question_id)
+            return True
+
+    @staticmethod
+    def _drop_secondary(mapping: Dict[Any, Dict[Any, IndexKey]], outer: Any, inner: Any) -> None:
+        """Remove an entry from a two-level secondary map, pruning empty buckets."""
+        bucket = mapping.get(outer)
+        if bucket is not None:
+            bucket.pop(inner, None)
+            if not bucket:
+                del mapping[outer]
+
+    def get(self, folder: Optional[str], question_id: int) -> Optional[IndexedQuestion[Q]]:
+        """Return the entry for (folder, id) in O(1), or None."""
+        return self._entries.get((normalize_folder(folder), question_id))
+
+    def get_by_path(self, rel_path: str) -> Optional[IndexedQuestion[Q]]:
+        """Return the entry for a path relative to the bank root, or None."""
+        with self._lock:
+            key = self._by_path.get(normalize_folder(rel_path))
+            return self._entries[key] if key else None
+
+    def lookup_id(self, question_id: int) -> List[IndexedQuestion[Q]]:
+        """Return every entry with the given ID, ordered by folder."""
+        with self._lock:
+            keys = self._by_id.get(question_id, {})
+            return [self._entries[keys[folder]] for folder in sorted(keys)]
+
+    def find(self, question_id: int, folder: Optional[str] = None) -> Optional[IndexedQuestion[Q]]:
+        """
+        Find a question by ID, optionally restricted to one folder.
+
+        Args:
+            question_id: The question ID.
+            folder: The folder to look in; None means the first folder holding the ID.
+
+        Returns:
+            Optional[IndexedQuestion[Q]]: The matching entry, or None.
+        """
+        if folder is not None:
+            return self.get(folder, question_id)
+        matches = self.lookup_id(question_id)
+        return matches[0] if matches else None
+
+    def find_active(self, question_id: int, folder: Optional[str] = None) -> Optional[IndexedQuestion[Q]]:
+        """
+        Find the question a game shows for an ID.
+
+        Without a folder, several folders may reuse the ID: the game shows
+        the first one whose question is not completed, and falls back to
+        the first one when they all are.
+
+        Args:
+            question_id: The question ID.
+            folder: The folder to look in; None means every folder.
+
+        Returns:
+            Optional[IndexedQuestion[Q]]: The matching entry, or None.
+        """
+        if folder is not None:
+            return self.get(folder, question_id)
+        matches = self.lookup_id(question_id)
+        return next((entry for entry in matches if not entry.completed), matches[0] if matches else None)
+
+    def in_folder(self, folder: Optional[str]) -> List[IndexedQuestion[Q]]:
+        """Return the entries located directly in a folder, ordered by ID."""
+        with self._lock:
+            keys = self._by_folder.get(normalize_folder(folder), {})
+            return [self._entries[keys[question_id]] for question_id in sorted(keys)]
+
+    def folders(self) -> List[str]:
+        """Return the folders holding at least one question, sorted."""
+        with self._lock:
+            return sorted(self._by_folder)
+
+    def clear(self) -> None:
+        """Remove every entry from the index."""
+        with self._lock:
+            self.__init__(self._lock)
+
+    def __len__(self) -> int:
+        """Return the number of indexed questions."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a (folder, id) key is indexed."""
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[IndexedQuestion[Q]]:
+        """Iterate over the entries ordered by (id, folder)."""
+        with self._lock:
+            if self._ordered is None:
+                self._ordered = sorted(self._entries, key=lambda key: (key[1], key[0]))
+            return iter([self._entries[key] for key in self._ordered])
@@ -0,0 +1,113 @@
+"""Parallel reading of question files for Révijouer application."""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from svt_app.utils.logging_utils import conditional_log
+
+try:
+    import orjson
+except ImportError:  # Optional: the standard decoder is used without it
+    orjson = None
+
+# Below this many files, starting threads costs more than it saves
+PARALLEL_THRESHOLD = 256
+# Files read by a worker per task, so that results come back in few large batches
+CHUNK_SIZE = 128
+# How many failed files are named in the aggregated error report
+REPORTED_ERRORS = 5
+
+JSON_DECODER = "orjson" if orjson is not None else "json"
+
+
+def default_workers() -> int:
+    """Return the number of reader threads, from SVT_LOADER_WORKERS or the number of CPUs."""
+    return int(os.getenv('SVT_LOADER_WORKERS', str(min(8, os.cpu_count() or 1))))
+
+
+def decode_json(raw: bytes) -> Any:
+    """
+    Decode the UTF-8 JSON content of a file.
+
+    orjson is used when installed. Files it rejects are handed to the
+    standard decoder, so both accept exactly the same files (NaN,
+    very large integers...).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode('utf-8'))
+
+
+@dataclass
+class LoadedFiles:
+    """
+    Content of a batch of question files.
+
+    Attributes:
+        data (Dict[str, Any]): JSON content by relative path, in the requested order.
+        errors (Dict[str, str]): Error message by relative path for the files that could not be read.
+    """
+    data: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def report(self, base_dir: str) -> None:
+        """Log the failed files of the batch as a single error."""
+        if not self.errors:
+            return
+        failed = sorted(self.errors)
+        details = "; ".join(f"{rel_path}: {self.errors[rel_path]}" for rel_path in failed[:REPORTED_ERRORS])
+        more = f" (and {len(failed) - REPORTED_ERRORS} more)" if len(failed) > REPORTED_ERRORS else ""
+        conditional_log("Error loading {} question files of {}: {}{}", len(failed), base_dir, details, more,
+                        level="ERROR")
+
+
+def _read_chunk(base_dir: str, rel_paths: List[str]) -> List[Tuple[str, Any, Optional[str]]]:
+    """Read and decode files, returning (relative path, content, error) for each."""
+    results = []
+    for rel_path in rel_paths:
+        try:
+            with open(os.path.join(base_dir, *rel_path.split("/")), 'rb') as f:
+                results.append((rel_path, decode_json(f.read()), None))
+        except Exception as e:
+            results.append((rel_path, None, str(e)))
+    return results
+
+
+def load_question_files(base_dir: str, rel_paths: List[str], workers: Optional[int] = None) -> LoadedFiles:
+    """
+    Read and decode many question files.
+
+    Large batches are split in chunks read by a bounded thread pool:
+    opening and reading the files releases the GIL, and orjson makes the
+    decoding that does not a small part of the total. The result does not
+    depend on the pool: the content comes back in the order of rel_paths.
+
+    Args:
+        base_dir: The root directory of the question bank.
+        rel_paths: Paths of the files relative to base_dir.
+        workers: Number of reader threads, default_workers() by default; 1 reads in this thread.
+
+    Returns:
+        LoadedFiles: The content of the readable files and the errors of the others.
+    """
+    workers = default_workers() if workers is None else workers
+    chunks = [rel_paths[i:i + CHUNK_SIZE] for i in range(0, len(rel_paths), CHUNK_SIZE)]
+    if workers > 1 and len(rel_paths) >= PARALLEL_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks)), thread_name_prefix="question-loader") as pool:
+            results = list(pool.map(lambda chunk: _read_chunk(base_dir, chunk), chunks))
+    else:
+        results = [_read_chunk(base_dir, chunk) for chunk in chunks]
+
+    loaded = LoadedFiles()
+    for rel_path, data, error in (result for chunk in results for result in chunk):
+        if error is None:
+            loaded.data[rel_path] = data
+        else:
+            loaded.errors[rel_path] = error
+    return loaded
@@ -0,0 +1,202 @@
+"""Read-only packed question bank for the bundled executable of Révijouer application.
+
+The packer compiles the question folders of assets/Data into one file at
+build time. The executable maps it in memory and decodes a question only
+when it is used, instead of unpacking and parsing thousands of small JSON
+files at every start.
+
+Usage:
+    python -m svt_app.services.question_pack [assets/Data] [build/questions.pack]
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from svt_app.services.question_index import IndexedQuestion, Q, parse_question_id
+from svt_app.services.question_loader import decode_json, load_question_files
+from svt_app.services.question_scanner import scan_question_files
+
+MAGIC = b"SVTQPACK"
+PACK_FORMAT = 1
+# Magic, format, offset and length of the index; the records follow the header
+HEADER = struct.Struct("<8sIQQ")
+KINDS = ("fill_the_blanks", "image_matching")
+# Where the build puts the pack inside the bundle, relative to sys._MEIPASS
+BUNDLED_PACK = os.path.join("assets", "questions.pack")
+
+# (relative path, offset, length, completed) of a packed question
+PackEntry = Tuple[str, int, int, bool]
+QuestionBuilder = Callable[[int, Dict[str, Any]], Any]
+
+
+def pack_questions(data_dir: str, output: str) -> Dict[str, int]:
+    """
+    Compile the question folders of a data directory into a pack file.
+
+    Each question is stored as compact UTF-8 JSON in the records section;
+    the index lists, per kind, the relative path, position and completion
+    flag of every question, sorted by path. Unreadable files are reported
+    and skipped.
+
+    Args:
+        data_dir: Directory holding the fill_the_blanks and image_matching folders.
+        output: Path of the pack file, replaced atomically.
+
+    Returns:
+        Dict[str, int]: Number of packed questions per kind.
+    """
+    index: Dict[str, List[PackEntry]] = {}
+    temp_path = f"{output}.tmp"
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, PACK_FORMAT, 0, 0))
+        for kind in KINDS:
+            base_dir = os.path.join(data_dir, kind)
+            entries: List[PackEntry] = []
+            loaded = load_question_files(base_dir, sorted(scan_question_files(base_dir)))
+            loaded.report(base_dir)
+            for rel_path, data in loaded.data.items():
+                record = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                entries.append((rel_path, f.tell(), len(record), bool(data.get('completed', False))))
+                f.write(record)
+            index[kind] = entries
+        index_offset = f.tell()
+        encoded = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        f.write(encoded)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, PACK_FORMAT, index_offset, len(encoded)))
+    os.replace(temp_path, output)
+    return {kind: len(entries) for kind, entries in index.items()}
+
+
+class QuestionPack:
+    """
+    A pack file mapped in memory.
+
+    Opening it reads the header and the index only; records are sliced out
+    of the mapping and decoded when a question is used, so the pages of
+    questions nobody opens are never read.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Map a pack file.
+
+        Args:
+            path: Path of the pack file.
+
+        Raises:
+            ValueError: If the file is not a pack of the supported format.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, pack_format, index_offset, index_length = HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC or pack_format != PACK_FORMAT:
+                raise ValueError(f"{path} is not a question pack of format {PACK_FORMAT}")
+            self._index: Dict[str, List[PackEntry]] = json.loads(
+                self._mmap[index_offset:index_offset + index_length].decode('utf-8'))
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def raw(self, offset: int, length: int) -> bytes:
+        """Return the stored JSON of a record."""
+        return self._mmap[offset:offset + length]
+
+    def read(self, offset: int, length: int) -> Dict[str, Any]:
+        """Decode the JSON content of a record."""
+        return decode_json(self.raw(offset, length))
+
+    def questions(self, kind: str, build: QuestionBuilder) -> List["PackedQuestion"]:
+        """
+        Return index entries for the questions of one kind, without decoding them.
+
+        Args:
+            kind: Folder name of the kind of questions.
+            build: Factory turning (question ID, JSON data) into a question model.
+        """
+        questions = []
+        for rel_path, offset, length, completed in self._index.get(kind, []):
+            folder, _, name = rel_path.rpartition("/")
+            question_id = parse_question_id(name)
+            if question_id is not None:
+                questions.append(PackedQuestion(self, folder, question_id, rel_path, offset, length, completed, build))
+        return questions
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+
+
+class PackedQuestion(IndexedQuestion[Q]):
+    """
+    Index entry of a packed question, decoded on first access.
+
+    The completion flag is stored in the pack index, so the active question
+    sets are built without decoding any record.
+    """
+
+    def __init__(self, pack: QuestionPack, folder: str, question_id: int, rel_path: str, offset: int,
+                 length: int, completed: bool, build: QuestionBuilder) -> None:
+        """Initialize the entry from the pack index."""
+        self.folder = folder
+        self.question_id = question_id
+        self.rel_path = rel_path
+        self.pack = pack
+        self.offset = offset
+        self.length = length
+        self._completed = completed
+        self._build = build
+        self._data: Optional[Dict[str, Any]] = None
+        self._question: Optional[Q] = None
+
+    @property  # type: ignore[override]
+    def data(self) -> Dict[str, Any]:
+        """Return the JSON content, decoding the record the first time."""
+        if self._data is None:
+            self._data = self.pack.read(self.offset, self.length)
+        return self._data
+
+    @property  # type: ignore[override]
+    def question(self) -> Q:
+        """Return the question model, building it the first time."""
+        if self._question is None:
+            self._question = self._build(self.question_id, self.data)
+        return self._question
+
+    @property
+    def completed(self) -> bool:
+        """Return whether the question is marked as completed, without decoding it."""
+        return bool(self._data.get('completed', False)) if self._data is not None else self._completed
+
+
+def bundled_pack_path() -> Optional[str]:
+    """Return the pack bundled in the executable, or None when not frozen or not packed."""
+    if not getattr(sys, 'frozen', False):
+        return None
+    path = os.path.join(sys._MEIPASS, BUNDLED_PACK)
+    return path if os.path.exists(path) else None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point of the packer."""
+    parser = argparse.ArgumentParser(description="Pack the question bank into a single file")
+    parser.add_argument("data_dir", nargs="?", default=os.path.join("assets", "Data"),
+                        help="directory holding fill_the_blanks and image_matching")
+    parser.add_argument("output", nargs="?", default=os.path.join("build", "questions.pack"))
+    args = parser.parse_args(argv)
+
+    counts = pack_questions(args.data_dir, args.output)
+    print(f"Packed {', '.join(f'{count} {kind}' for kind, count in counts.items())} into {args.output} "
+          f"({os.path.getsize(args.output) // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Resolution of (focus, question ID) pairs to question files for Révijouer application."""
+
+import os
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+from svt_app.services.question_index import normalize_folder
+from svt_app.services.question_service import QuestionService
+from svt_app.utils.logging_utils import module_logger
+
+log = module_logger(__name__)
+
+ResolverKey = Tuple[Optional[str], int]
+
+
+class QuestionPathResolver:
+    """
+    Map (focused folder, question ID) to the absolute path of a question file.
+
+    Resolved paths are memoized on top of the question index. Routes that
+    create, move, rename or delete files call invalidate() with the folder
+    they touched; the next lookup then rescans only the dirty folders. A miss
+    costs at most one targeted rescan: the focused folder when there is a
+    focus, otherwise a single stat pass over the bank.
+
+    Without a folder, an ID picks the same question as the game page (see
+    QuestionIndex.find_active); since that depends on completion flags,
+    those lookups are not memoized.
+    """
+
+    def __init__(self, question_service: QuestionService) -> None:
+        """
+        Initialize the resolver.
+
+        Args:
+            question_service: The question service whose fill-in-the-blank index backs the map.
+        """
+        self.question_service = question_service
+        self._paths: Dict[ResolverKey, str] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def resolve(self, focused_folder: Optional[str], question_id: int) -> Optional[str]:
+        """
+        Return the file of a question, or None if it does not exist.
+
+        Args:
+            focused_folder: The focused folder, or an empty value to search every folder.
+            question_id: The question ID.
+
+        Returns:
+            Optional[str]: Absolute path of the question file.
+        """
+        return self._resolve((normalize_folder(focused_folder) if focused_folder else None, question_id))
+
+    def resolve_in(self, folder: str, question_id: int) -> Optional[str]:
+        """
+        Return the file of a question of one folder, the root folder included.
+
+        Args:
+            folder: Folder of the question relative to the bank root ("" for the root).
+            question_id: The question ID.
+
+        Returns:
+            Optional[str]: Absolute path of the question file.
+        """
+        return self._resolve((normalize_folder(folder), question_id))
+
+    def _resolve(self, key: ResolverKey) -> Optional[str]:
+        """Return the file of a (folder, ID) key, rescanning once on a miss."""
+        with self._lock:
+            self._rescan_dirty()
+            path = self._paths.get(key)
+            if path is not None and not os.path.exists(path):
+                # The file was removed behind our back
+                path = None
+            if path is None:
+                path = self._lookup(key)
+            if path is None:
+                log("Resolver miss for {}, rescanning", key)
+                if key[0] is None:
+                    self.question_service.refresh()
+                else:
+                    self.question_service.refresh_fill_in_blank_folder(key[0], recursive=False)
+                path = self._lookup(key)
+            if path is not None and key[0] is not None:
+                self._paths[key] = path
+            return path
+
+    def _lookup(self, key: ResolverKey) -> Optional[str]:
+        """Look a key up in the index and build its absolute path."""
+        folder, question_id = key
+        entry = self.question_service.fill_in_blank_index.find_active(question_id, folder)
+        if entry is None:
+            return None
+        # Packed questions are copied to the writable bank, since the caller writes to the file
+        return self.question_service.fill_in_blank_file(entry.rel_path)
+
+    def _rescan_dirty(self) -> None:
+        """Rescan the folders invalidated since the last lookup."""
+        if not self._dirty:
+            return
+        if "" in self._dirty:
+            self.question_service.refresh()
+        else:
+            for folder in sorted(self._dirty):
+                self.question_service.refresh_fill_in_blank_folder(folder)
+        self._dirty.clear()
+
+    def invalidate(self, folder: Optional[str] = "") -> None:
+        """
+        Forget every resolved path at or below a folder.
+
+        Args:
+            folder: Folder relative to the fill-in-the-blank root; "" invalidates everything.
+        """
+        folder = normalize_folder(folder)
+        prefix = os.path.join(self.question_service.fill_blanks_path, *folder.split("/")) if folder else ""
+        with self._lock:
+            if not folder:
+                self._paths.clear()
+            else:
+                self._paths = {key: path for key, path in self._paths.items()
+                               if not (path.startswith(prefix + os.sep) or key[0] is None)}
+            # Keep only the outermost dirty folders
+            if not any(folder == dirty or folder.startswith(f"{dirty}/") for dirty in self._dirty if dirty):
+                self._dirty = {dirty for dirty in self._dirty if not dirty.startswith(f"{folder}/")}
+                self._dirty.add(folder)
+            if "" in self._dirty:
+                self._dirty = {""}
@@ -0,0 +1,109 @@
+"""Change detection for question bank files in Révijouer application."""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from svt_app.services.question_index import parse_question_id
+
+# (modification time in nanoseconds, size in bytes) of a question file
+FileSignature = Tuple[int, int]
+Manifest = Dict[str, FileSignature]
+
+BACKUP_PREFIX = '.focused_backup_'
+
+
+@dataclass
+class ManifestDiff:
+    """
+    Differences between two manifests of a question bank.
+
+    Attributes:
+        added (List[str]): Relative paths that appeared.
+        changed (List[str]): Relative paths whose signature changed.
+        removed (List[str]): Relative paths that disappeared.
+    """
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+def scan_question_files(base_dir: str, folder: str = "", recursive: bool = True) -> Manifest:
+    """
+    Stat every question file below a directory without reading it.
+
+    Backup directories created by the focus feature are skipped.
+
+    Args:
+        base_dir: The root directory of the question bank.
+        folder: Normalized folder to limit the scan to ("" for the whole bank).
+        recursive: Whether to descend into subfolders.
+
+    Returns:
+        Manifest: Mapping of normalized relative path to file signature.
+    """
+    manifest: Manifest = {}
+    start = os.path.join(base_dir, *folder.split("/")) if folder else base_dir
+    pending = [(start, f"{folder}/" if folder else "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    rel_path = f"{prefix}{entry.name}"
+                    if entry.is_dir():
+                        if recursive and not entry.name.startswith(BACKUP_PREFIX):
+                            pending.append((entry.path, f"{rel_path}/"))
+                    elif parse_question_id(entry.name) is not None:
+                        stat = entry.stat()
+                        manifest[rel_path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            # Missing or unreadable directories simply contribute no files
+            continue
+    return manifest
+
+
+def in_scope(rel_path: str, folder: str, recursive: bool = True) -> bool:
+    """
+    Tell whether a relative path lies in the part of the bank covered by a scan.
+
+    Args:
+        rel_path: Normalized path relative to the bank root.
+        folder: Normalized folder the scan was limited to ("" for the root).
+        recursive: Whether the scan covered subfolders.
+
+    Returns:
+        bool: True if a scan of folder would have seen rel_path.
+    """
+    if recursive:
+        return not folder or rel_path.startswith(f"{folder}/")
+    return rel_path.rpartition("/")[0] == folder
+
+
+def diff_manifests(old: Manifest, new: Manifest) -> ManifestDiff:
+    """
+    Compare two manifests.
+
+    Args:
+        old: The manifest the index was built from.
+        new: The manifest from a fresh scan.
+
+    Returns:
+        ManifestDiff: The sorted added, changed and removed paths.
+    """
+    diff = ManifestDiff()
+    for rel_path, signature in new.items():
+        previous = old.get(rel_path)
+        if previous is None:
+            diff.added.append(rel_path)
+        elif previous != signature:
+            diff.changed.append(rel_path)
+    diff.removed = [rel_path for rel_path in old if rel_path not in new]
+    diff.added.sort()
+    diff.changed.sort()
+    diff.removed.sort()
+    return diff
@@ -1,13 +1,37 @@
 """Question service module for Révijouer application."""
 
-import json
+import hashlib
 import os
 import sys
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 from svt_app.models.question import FillInTheBlankQuestion, ImageMatchingQuestion
-from svt_app.utils.logging_utils import conditional_log, log_if_enabled
+from svt_app.services.question_bank import QuestionBank, QuestionBuilder
+from svt_app.services.question_index import IndexedQuestion, QuestionIndex
+from svt_app.services.question_pack import QuestionPack
+from svt_app.services.question_snapshot import QuestionSnapshot
+from svt_app.utils.logging_utils import log_if_enabled, module_logger
+
+log = module_logger(__name__)
+
+
+def get_base_path() -> str:
+    """
+    Return the directory holding assets/Data.
+
+    Handles both the development tree and the PyInstaller executable.
+    """
+    if getattr(sys, 'frozen', False):
+        # Running in PyInstaller bundle
+        return os.path.join(sys._MEIPASS)
+    # Running in normal Python environment
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+
+def fill_blanks_path(base_path: Optional[str] = None) -> str:
+    """Return the root directory of the fill-in-the-blank questions."""
+    return os.path.join(base_path or get_base_path(), "assets", "Data", "fill_the_blanks")
 
 
 class QuestionService:
@@ -19,153 +43,182 @@ class QuestionService:
     """
     
     @log_if_enabled()
-    def __init__(self) -> None:
-        """Initialize the QuestionService."""
-        conditional_log("Initializing QuestionService")
+    def __init__(self, base_path: Optional[str] = None, snapshot_dir: Optional[str] = None,
+                 pack_path: Optional[str] = None) -> None:
+        """
+        Initialize the QuestionService.
+
+        Args:
+            base_path: Directory holding assets/Data, the installation directory by default.
+            snapshot_dir: Directory of the warm-start snapshots of the banks, none by default.
+            pack_path: Optional read-only question pack the files of base_path are layered over.
+        """
+        log("Initializing QuestionService")
         
-        # Get the base path - handles both development and PyInstaller executable
-        if getattr(sys, 'frozen', False):
-            # Running in PyInstaller bundle
-            self.base_path = os.path.join(sys._MEIPASS)
-            conditional_log("Running in PyInstaller bundle, base path: {}", self.base_path)
-        else:
-            # Running in normal Python environment
-            self.base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-            conditional_log("Running in development environment, base path: {}", self.base_path)
+        self.base_path = base_path or get_base_path()
+        log("Question base path: {}", self.base_path)
         
         # Initialize paths relative to base_path
-        self.fill_blanks_path = os.path.join(self.base_path, "assets", "Data", "fill_the_blanks")
+        self.fill_blanks_path = fill_blanks_path(self.base_path)
         self.image_matching_path = os.path.join(self.base_path, "assets", "Data", "image_matching")
         
-        conditional_log("Fill in blanks path: {}", self.fill_blanks_path)
-        conditional_log("Image matching path: {}", self.image_matching_path)
+        log("Fill in blanks path: {}", self.fill_blanks_path)
+        log("Image matching path: {}", self.image_matching_path)
         
-        self.fill_in_blank_questions: List[FillInTheBlankQuestion] = []
-        self.image_matching_questions: List[ImageMatchingQuestion] = []
+        self.pack = QuestionPack(pack_path) if pack_path else None
+        if self.pack is not None:
+            log("Question pack: {}", pack_path)
+        self.fill_in_blank_bank: QuestionBank[FillInTheBlankQuestion] = QuestionBank(
+            self._build_fill_in_blank_question, self._snapshot(snapshot_dir, self.fill_blanks_path, "fill_the_blanks"),
+            self._packed("fill_the_blanks", self._build_fill_in_blank_question))
+        self.image_matching_bank: QuestionBank[ImageMatchingQuestion] = QuestionBank(
+            self._build_image_matching_question, self._snapshot(snapshot_dir, self.image_matching_path, "image_matching"),
+            self._packed("image_matching", self._build_image_matching_question))
+        # Incremented every time a load or refresh actually changes the bank
+        self.generation = 0
         self.load_questions()
+
+    @staticmethod
+    def _snapshot(snapshot_dir: Optional[str], bank_dir: str, kind: str) -> Optional[QuestionSnapshot]:
+        """Return the snapshot of one bank, or None if snapshots are disabled."""
+        if not snapshot_dir:
+            return None
+        # Banks of several installations can share one cache directory
+        digest = hashlib.sha1(os.path.abspath(bank_dir).encode('utf-8')).hexdigest()[:12]
+        return QuestionSnapshot(os.path.join(snapshot_dir, f"{kind}-{digest}.snapshot"))
+
+    def _packed(self, kind: str, build: QuestionBuilder) -> Optional[List[IndexedQuestion]]:
+        """Return the undecoded packed questions of one bank, or None without a pack."""
+        return self.pack.questions(kind, build) if self.pack is not None else None
+
+    @property
+    def fill_in_blank_questions(self) -> List[FillInTheBlankQuestion]:
+        """Return the fill-in-the-blank questions ordered by (id, folder)."""
+        return self.fill_in_blank_bank.questions()
+
+    @property
+    def image_matching_questions(self) -> List[ImageMatchingQuestion]:
+        """Return the image matching questions ordered by (id, folder)."""
+        return self.image_matching_bank.questions()
+
+    @property
+    def fill_in_blank_index(self) -> QuestionIndex[FillInTheBlankQuestion]:
+        """Return the (folder, id) index of fill-in-the-blank questions."""
+        return self.fill_in_blank_bank.index
+
+    @property
+    def image_matching_index(self) -> QuestionIndex[ImageMatchingQuestion]:
+        """Return the (folder, id) index of image matching questions."""
+        return self.image_matching_bank.index
     
     @log_if_enabled()
     def load_questions(self) -> None:
         """
         Load questions from JSON files.
         
-        This method loads both fill-in-the-blank and image matching questions
-        from their respective JSON files.
+        This method fully re-parses both fill-in-the-blank and image matching
+        questions from their respective JSON files, or, with snapshots, only
+        the files changed since the snapshots were taken.
         """
-        conditional_log("Loading all questions")
-        self._load_fill_in_blank_questions()
-        self._load_image_matching_questions()
-    
+        log("Loading all questions")
+        self.fill_in_blank_bank.reload(self.fill_blanks_path)
+        self.image_matching_bank.reload(self.image_matching_path)
+        self._publish()
+
     @log_if_enabled()
-    def _load_fill_in_blank_questions(self) -> None:
-        """Load fill-in-the-blank questions from JSON files."""
-        conditional_log("Loading fill-in-the-blank questions")
-        self.fill_in_blank_questions = []
-
-        try:
-            # Walk through the directory and its subdirectories
-            for root, dirs, files in os.walk(self.fill_blanks_path):
-                # Skip backup directories
-                dirs[:] = [d for d in dirs if not d.startswith('.focused_backup_')]
-
-                for file in files:
-                    if file.startswith("question") and file.endswith(".json"):
-                        file_path = os.path.join(root, file)
-
-                        # Double-check: skip if the file is in a backup directory
-                        if '.focused_backup_' in file_path:
-                            conditional_log("Skipping question in backup directory: {}", file_path)
-                            continue
-
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                conditional_log("Loaded JSON data from {}: {}", file_path, data)
-                                
-                                # Extract question ID from filename (e.g., "question001.json" -> 1)
-                                question_id = int(file[8:11])
-                                
-                                # Check if we already have a question with this ID
-                                existing_question = next(
-                                    (q for q in self.fill_in_blank_questions if q.id == question_id),
-                                    None
-                                )
-                                
-                                if existing_question:
-                                    conditional_log("Warning: Duplicate question ID {} found in {}. Skipping.", 
-                                             question_id, file_path, level="WARNING")
-                                    continue
-                                
-                                question = FillInTheBlankQuestion(
-                                    id=question_id,
-                                    text=data.get('text', ''),
-                                    options=data.get('options', []),
-                                    correct_answer=data.get('correct_answer', '')
-                                )
-                                self.fill_in_blank_questions.append(question)
-                                conditional_log("Loaded fill-in-blank question {}: {}", question.id, question.text)
-                        except Exception as e:
-                            conditional_log("Error loading fill-in-blank question {}: {}", file_path, str(e), level="ERROR")
-                            continue
-        except Exception as e:
-            conditional_log("Error walking fill-in-blank questions directory: {}", str(e), level="ERROR")
-        
-        # Sort questions by ID
-        self.fill_in_blank_questions.sort(key=lambda x: x.id)
-        conditional_log("Loaded {} fill-in-blank questions", len(self.fill_in_blank_questions))
-    
+    def refresh(self) -> bool:
+        """
+        Re-parse only the question files added, changed or deleted since the last load.
+
+        Returns:
+            bool: True if the bank changed, in which case the generation was incremented.
+        """
+        fill_changed = self.fill_in_blank_bank.refresh(self.fill_blanks_path)
+        image_changed = self.image_matching_bank.refresh(self.image_matching_path)
+        if not (fill_changed or image_changed):
+            return False
+        self._publish()
+        return True
+
     @log_if_enabled()
-    def _load_image_matching_questions(self) -> None:
-        """Load image matching questions from JSON files."""
-        conditional_log("Loading image matching questions")
-        self.image_matching_questions = []
-        
-        try:
-            # Walk through the directory and its subdirectories
-            for root, _, files in os.walk(self.image_matching_path):
-                for file in files:
-                    if file.startswith("question") and file.endswith(".json"):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                conditional_log("Loaded JSON data from {}: {}", file_path, data)
-                                
-                                # Extract question ID from filename
-                                question_id = int(file[8:11])
-                                
-                                # Check if we already have a question with this ID
-                                existing_question = next(
-                                    (q for q in self.image_matching_questions if q.id == question_id),
-                                    None
-                                )
-                                
-                                if existing_question:
-                                    conditional_log("Warning: Duplicate question ID {} found in {}. Skipping.", 
-                                             question_id, file_path, level="WARNING")
-                                    continue
-                                
-                                # Get words data
-                                words_data = data.get('words', {})
-                                
-                                question = ImageMatchingQuestion(
-                                    id=question_id,
-                                    image_path=data.get('image', ''),
-                                    correct_word=words_data.get('correct', ''),
-                                    incorrect_words=words_data.get('incorrect', [])
-                                )
-                                self.image_matching_questions.append(question)
-                                conditional_log("Loaded image matching question {}: {}", question.id, question.image_path)
-                        except Exception as e:
-                            conditional_log("Error loading image matching question {}: {}", file_path, str(e), level="ERROR")
-                            continue
-        except Exception as e:
-            conditional_log("Error walking image matching questions directory: {}", str(e), level="ERROR")
-        
-        # Sort questions by ID
-        self.image_matching_questions.sort(key=lambda x: x.id)
-        conditional_log("Loaded {} image matching questions", len(self.image_matching_questions))
-    
+    def refresh_fill_in_blank_folder(self, folder: str, recursive: bool = True) -> bool:
+        """
+        Rescan a single fill-in-the-blank folder instead of the whole bank.
+
+        Args:
+            folder: Folder relative to the fill-in-the-blank root ("" for the root).
+            recursive: Whether to rescan its subfolders too.
+
+        Returns:
+            bool: True if the bank changed, in which case the generation was incremented.
+        """
+        if not self.fill_in_blank_bank.refresh(self.fill_blanks_path, folder, recursive):
+            return False
+        self._publish()
+        return True
+
+    def update_fill_in_blank_question(self, file_path: str, data: Dict[str, Any]) -> bool:
+        """
+        Record content just written to a fill-in-the-blank question file.
+
+        Keeps the index (completion flags included) current without re-parsing
+        the file on the next refresh.
+
+        Args:
+            file_path: Absolute or base-relative path of the question file.
+            data: The JSON content that was written.
+
+        Returns:
+            bool: True if the question was indexed and updated.
+        """
+        rel_path = os.path.relpath(os.path.abspath(file_path), self.fill_blanks_path)
+        if self.fill_in_blank_bank.update(rel_path, data) is None:
+            return False
+        self.generation += 1
+        return True
+
+    def fill_in_blank_file(self, rel_path: str) -> str:
+        """
+        Return the absolute path of a fill-in-the-blank question file.
+
+        A packed question is first copied into the writable bank, so the
+        caller can read and rewrite the returned file like any other.
+
+        Args:
+            rel_path: Path of the question relative to the fill-in-the-blank root.
+        """
+        if self.fill_in_blank_bank.materialize(rel_path):
+            self.generation += 1
+        return os.path.join(self.fill_blanks_path, *rel_path.split("/"))
+
+    def _publish(self) -> None:
+        """Bump the generation counter; the ordered question lists follow the banks."""
+        self.generation += 1
+        log("Question bank generation {}: {} fill-in-blank, {} image matching questions",
+            self.generation, len(self.fill_in_blank_index), len(self.image_matching_index))
+
+    @staticmethod
+    def _build_fill_in_blank_question(question_id: int, data: Dict[str, Any]) -> FillInTheBlankQuestion:
+        """Build a fill-in-the-blank question from its JSON data."""
+        return FillInTheBlankQuestion(
+            id=question_id,
+            text=data.get('text', ''),
+            options=data.get('options', []),
+            correct_answer=data.get('correct_answer', '')
+        )
+
+    @staticmethod
+    def _build_image_matching_question(question_id: int, data: Dict[str, Any]) -> ImageMatchingQuestion:
+        """Build an image matching question from its JSON data."""
+        # Get words data
+        words_data = data.get('words', {})
+        return ImageMatchingQuestion(
+            id=question_id,
+            image_path=data.get('image', ''),
+            correct_word=words_data.get('correct', ''),
+            incorrect_words=words_data.get('incorrect', [])
+        )
+
     @log_if_enabled()
     def get_fill_in_blank_questions(self) -> List[FillInTheBlankQuestion]:
         """
@@ -187,33 +240,31 @@ class QuestionService:
         return self.image_matching_questions
     
     @log_if_enabled()
-    def get_fill_in_blank_question_by_id(self, question_id: int) -> Optional[FillInTheBlankQuestion]:
+    def get_fill_in_blank_question_by_id(self, question_id: int, folder: Optional[str] = None) -> Optional[FillInTheBlankQuestion]:
         """
         Get a fill-in-the-blank question by its ID.
         
         Args:
             question_id: The ID of the question to retrieve.
+            folder: Optional folder to look in; defaults to the first folder holding the ID.
             
         Returns:
             Optional[FillInTheBlankQuestion]: The question if found, None otherwise.
         """
-        for question in self.fill_in_blank_questions:
-            if question.id == question_id:
-                return question
-        return None
+        entry = self.fill_in_blank_index.find(question_id, folder)
+        return entry.question if entry else None
     
     @log_if_enabled()
-    def get_image_matching_question_by_id(self, question_id: int) -> Optional[ImageMatchingQuestion]:
+    def get_image_matching_question_by_id(self, question_id: int, folder: Optional[str] = None) -> Optional[ImageMatchingQuestion]:
         """
         Get an image matching question by its ID.
         
         Args:
             question_id: The ID of the question to retrieve.
+            folder: Optional folder to look in; defaults to the first folder holding the ID.
             
         Returns:
             Optional[ImageMatchingQuestion]: The question if found, None otherwise.
         """
-        for question in self.image_matching_questions:
-            if question.id == question_id:
-                return question
-        return None 
\ No newline at end of file
+        entry = self.image_matching_index.find(question_id, folder)
+        return entry.question if entry else None
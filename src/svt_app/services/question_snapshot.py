@@ -0,0 +1,109 @@
+"""Warm-start snapshot of a parsed question bank for Révijouer application."""
+
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from svt_app.services.question_scanner import FileSignature
+from svt_app.utils.logging_utils import conditional_log
+
+# Bumped whenever the layout of the snapshot changes; older snapshots are ignored
+SNAPSHOT_FORMAT = 1
+APP_DIR_NAME = "Revijouer"
+
+# (relative path, folder, question ID, file signature, JSON content) of a parsed file
+SnapshotEntry = Tuple[str, str, int, FileSignature, Dict[str, Any]]
+
+
+def default_cache_dir() -> str:
+    """
+    Return the per-user cache directory of the snapshots.
+
+    SVT_CACHE_DIR overrides it; otherwise it is Revijouer under
+    %LOCALAPPDATA% on Windows, or under $XDG_CACHE_HOME or ~/.cache. The
+    snapshots are never written next to the questions, which may be a
+    source tree or the bundle of the executable.
+    """
+    configured = os.getenv('SVT_CACHE_DIR')
+    if configured:
+        return configured
+    base = os.getenv('LOCALAPPDATA') or os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, APP_DIR_NAME)
+
+
+class QuestionSnapshot:
+    """
+    Binary copy of the JSON content of a question bank, with its manifest.
+
+    Loading one pickle replaces opening and parsing every question file:
+    the bank takes the content of the files whose signature (mtime, size)
+    still matches and only re-parses the others. Only plain JSON values
+    are stored, so the snapshot does not depend on the question models.
+    A snapshot that cannot be read, or was taken of another directory or
+    by another format, is ignored and rewritten.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the snapshot.
+
+        Args:
+            path: Path of the snapshot file.
+        """
+        self.path = path
+
+    def load(self, base_dir: str) -> Optional[List[SnapshotEntry]]:
+        """
+        Read the snapshot of a bank.
+
+        Args:
+            base_dir: The root directory of the question bank.
+
+        Returns:
+            Optional[List[SnapshotEntry]]: The saved files in the order they were
+            indexed, or None if there is no usable snapshot.
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                snapshot = pickle.load(f)
+            if snapshot.get('format') != SNAPSHOT_FORMAT or snapshot.get('base_dir') != os.path.abspath(base_dir):
+                conditional_log("Ignoring question snapshot {} taken of another bank", self.path)
+                return None
+            return snapshot['entries']
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            conditional_log("Ignoring unreadable question snapshot {}: {}", self.path, str(e), level="WARNING")
+            return None
+
+    def save(self, base_dir: str, entries: List[SnapshotEntry]) -> bool:
+        """
+        Replace the snapshot atomically.
+
+        Args:
+            base_dir: The root directory of the question bank.
+            entries: Every parsed file, in the order they were indexed.
+
+        Returns:
+            bool: True if the snapshot was written.
+        """
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=".snapshot_", dir=directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump({'format': SNAPSHOT_FORMAT, 'base_dir': os.path.abspath(base_dir),
+                                 'entries': entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            conditional_log("Could not write question snapshot {}: {}", self.path, str(e), level="WARNING")
+            return False
+        conditional_log("Wrote question snapshot {} ({} questions)", self.path, len(entries))
+        return True
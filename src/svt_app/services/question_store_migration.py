@@ -0,0 +1,101 @@
+"""Import and export between the JSON question tree and the SQLite store."""
+
+import argparse
+import json
+import os
+from typing import List, Optional
+
+from svt_app.services.question_index import parse_question_id
+from svt_app.services.question_scanner import BACKUP_PREFIX, scan_question_files
+from svt_app.services.sqlite_question_store import FILL_IN_BLANK, IMAGE_MATCHING, SQLiteQuestionStore
+from svt_app.utils.logging_utils import conditional_log
+
+
+def import_tree(store: SQLiteQuestionStore, kind: str, base_dir: str) -> int:
+    """
+    Copy every question file (and every folder) below base_dir into the store.
+
+    Existing rows with the same (kind, folder, id) are replaced, so the import
+    can be re-run safely. The whole import is one transaction: it is committed
+    once, and a failure leaves the store as it was.
+
+    Args:
+        store: The destination store.
+        kind: FILL_IN_BLANK or IMAGE_MATCHING.
+        base_dir: Root directory of the JSON question tree.
+
+    Returns:
+        int: The number of imported questions.
+    """
+    imported = 0
+    with store.transaction():
+        for root, dirs, _ in os.walk(base_dir):
+            dirs[:] = [d for d in dirs if not d.startswith(BACKUP_PREFIX)]
+            for directory in dirs:
+                store.add_folder(kind, os.path.relpath(os.path.join(root, directory), base_dir))
+
+        for rel_path in sorted(scan_question_files(base_dir)):
+            folder, _, file_name = rel_path.rpartition("/")
+            try:
+                with open(os.path.join(base_dir, *rel_path.split("/")), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                conditional_log("Skipping unreadable question {}: {}", rel_path, str(e), level="ERROR")
+                continue
+            store.upsert_question(kind, folder, parse_question_id(file_name), file_name, data)
+            imported += 1
+    conditional_log("Imported {} questions from {}", imported, base_dir)
+    return imported
+
+
+def export_tree(store: SQLiteQuestionStore, kind: str, base_dir: str) -> int:
+    """
+    Write every question of the store back to the JSON tree layout.
+
+    Args:
+        store: The source store.
+        kind: FILL_IN_BLANK or IMAGE_MATCHING.
+        base_dir: Root directory of the JSON question tree.
+
+    Returns:
+        int: The number of exported questions.
+    """
+    exported = 0
+    for folder in [""] + store.list_folders(kind):
+        target_dir = os.path.join(base_dir, *folder.split("/")) if folder else base_dir
+        os.makedirs(target_dir, exist_ok=True)
+        for item in store.list_folder(kind, folder):
+            file_name = item.pop("file_name")
+            item.pop("question_id")
+            with open(os.path.join(target_dir, file_name), 'w', encoding='utf-8') as f:
+                json.dump(item, f, indent=4, ensure_ascii=False)
+            exported += 1
+    conditional_log("Exported {} questions to {}", exported, base_dir)
+    return exported
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line entry point.
+
+    Example:
+        python -m svt_app.services.question_store_migration import assets/Data questions.db
+    """
+    parser = argparse.ArgumentParser(description="Migrate questions between the JSON tree and SQLite")
+    parser.add_argument("direction", choices=["import", "export"])
+    parser.add_argument("data_dir", help="Directory holding fill_the_blanks and image_matching")
+    parser.add_argument("database", help="SQLite database file")
+    args = parser.parse_args(argv)
+
+    store = SQLiteQuestionStore(args.database)
+    for kind in (FILL_IN_BLANK, IMAGE_MATCHING):
+        base_dir = os.path.join(args.data_dir, kind)
+        if args.direction == "import":
+            count = import_tree(store, kind, base_dir) if os.path.isdir(base_dir) else 0
+        else:
+            count = export_tree(store, kind, base_dir)
+        print(f"{kind}: {count} question(s) {args.direction}ed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Traversal of question folders into the tree model shown by the questions tree page."""
+
+import json
+import os
+from typing import Any, Callable, Dict, List
+
+from svt_app.utils.logging_utils import module_logger
+
+log = module_logger(__name__)
+
+QuestionReader = Callable[[str], Dict[str, Any]]
+
+
+def read_question_file(path: str) -> Dict[str, Any]:
+    """Read a question file as is."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _question_item(item: str, rel_path: str, question_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the tree node of a question file."""
+    return {
+        'type': 'question',
+        'id': item[8:11],  # Extract number from filename
+        'text': question_data.get('text', 'No text available'),
+        'file': rel_path,
+        'completed': question_data.get('completed', False),
+        'statistics': question_data.get('statistics', {
+            'correct_answers': 0,
+            'wrong_answers': 0
+        })
+    }
+
+
+def get_questions_in_directory(directory: str, relative_path: str = "",
+                               read_question: QuestionReader = read_question_file) -> List[Dict[str, Any]]:
+    """
+    Recursively get all questions in a directory and its subdirectories.
+
+    Args:
+        directory: The absolute directory path
+        relative_path: The relative path from the base questions directory
+        read_question: Function reading the data of a question file
+
+    Returns:
+        List[Dict[str, Any]]: List of questions and folders
+    """
+    items: List[Dict[str, Any]] = []
+
+    try:
+        # Make sure directory exists
+        if not os.path.exists(directory):
+            log("Directory does not exist: {}", directory)
+            return items
+
+        # Get all items in the directory
+        dir_contents = os.listdir(directory)
+        log("Found {} items in directory {}", len(dir_contents), directory)
+
+        for item in sorted(dir_contents):
+            full_path = os.path.join(directory, item)
+            rel_path = os.path.join(relative_path, item) if relative_path else item
+
+            # Skip backup directories (hidden folders used for focus)
+            if item.startswith('.focused_backup_'):
+                log("Skipping backup directory: {}", item)
+                continue
+
+            if os.path.isdir(full_path):
+                # If it's a directory, recursively get its contents
+                log("Found directory: {}", full_path)
+                subfolder_items = get_questions_in_directory(full_path, rel_path, read_question)
+
+                # Add folder even if empty
+                folder_data = {
+                    'type': 'folder',
+                    'name': item,
+                    'path': rel_path,
+                    'children': subfolder_items
+                }
+                items.append(folder_data)
+                log("Added folder: {} with {} children", item, len(subfolder_items))
+
+            elif item.startswith("question") and item.endswith(".json"):
+                # If it's a question file, add it to the list
+                try:
+                    items.append(_question_item(item, rel_path, read_question(full_path)))
+                    log("Added question: {}", item)
+                except Exception as e:
+                    log("Error reading question file {}: {}", full_path, str(e))
+                    continue
+    except Exception as e:
+        log("Error reading directory {}: {}", directory, str(e))
+        return []
+
+    return items
+
+
+def get_questions_in_focused_folder(directory: str, focused_folder: str,
+                                    read_question: QuestionReader = read_question_file) -> List[Dict[str, Any]]:
+    """
+    Get questions only from a specific focused folder (no subfolders).
+
+    Args:
+        directory: The absolute base directory path
+        focused_folder: The relative path of the folder to focus on
+        read_question: Function reading the data of a question file
+
+    Returns:
+        List[Dict[str, Any]]: List of questions from the focused folder only
+    """
+    items: List[Dict[str, Any]] = []
+    # Build the full path to the focused folder
+    focused_path = os.path.join(directory, focused_folder) if focused_folder else directory
+
+    try:
+        # Make sure the focused directory exists
+        if not os.path.exists(focused_path):
+            log("Focused directory does not exist: {}", focused_path)
+            return items
+
+        # Get all items in the focused directory only
+        dir_contents = os.listdir(focused_path)
+        log("Found {} items in focused directory {}", len(dir_contents), focused_path)
+
+        for item in sorted(dir_contents):
+            full_path = os.path.join(focused_path, item)
+            rel_path = os.path.join(focused_folder, item) if focused_folder else item
+
+            if item.startswith("question") and item.endswith(".json"):
+                # If it's a question file, add it to the list
+                try:
+                    items.append(_question_item(item, rel_path, read_question(full_path)))
+                    log("Added focused question: {}", item)
+                except Exception as e:
+                    log("Error reading question file {}: {}", full_path, str(e))
+                    continue
+
+    except Exception as e:
+        log("Error reading focused directory {}: {}", focused_path, str(e))
+        return []
+
+    return items
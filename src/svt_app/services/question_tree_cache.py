@@ -0,0 +1,171 @@
+"""Cached snapshots of the questions tree for Révijouer application."""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from svt_app.services.question_service import QuestionService
+from svt_app.services.question_tree import (QuestionReader, get_questions_in_directory,
+                                            get_questions_in_focused_folder, read_question_file)
+from svt_app.utils.logging_utils import conditional_log
+
+SnapshotKey = Tuple[str, str, str]
+FolderChildren = Dict[str, List[Dict[str, Any]]]
+FolderAggregates = Dict[str, Dict[str, int]]
+
+
+@dataclass(frozen=True)
+class TreeSnapshot:
+    """
+    A built questions tree with its serialized form.
+
+    Snapshots are shared between request threads: everything is computed
+    when the snapshot is built and nothing is modified afterwards.
+
+    Attributes:
+        tree (List[Dict[str, Any]]): The tree nodes passed to the template.
+        body (bytes): The JSON document served by the tree endpoint.
+        etag (str): Strong validator derived from the body.
+        token (Tuple[int, int]): Bank generation and cache version the tree was built at.
+        folders (FolderChildren): Children of each folder, by normalized path ("" for the root).
+        aggregates (FolderAggregates): Question counts of each folder and its subfolders, by normalized path.
+    """
+    tree: List[Dict[str, Any]]
+    body: bytes
+    etag: str
+    token: Tuple[int, int]
+    folders: FolderChildren
+    aggregates: FolderAggregates
+
+
+def index_tree(tree: List[Dict[str, Any]]) -> Tuple[FolderChildren, FolderAggregates]:
+    """
+    Index the folders of a tree and count the questions below each of them.
+
+    Args:
+        tree: The tree nodes.
+
+    Returns:
+        Tuple[FolderChildren, FolderAggregates]: The children of every folder and its
+        total and completed questions, and correct and wrong answers.
+    """
+    folders: FolderChildren = {}
+    pending = [("", tree)]
+    while pending:
+        path, children = pending.pop()
+        folders[path] = children
+        for node in children:
+            if node['type'] == 'folder':
+                pending.append((node['path'].replace("\\", "/").strip("/"), node['children']))
+    aggregates: FolderAggregates = {}
+    # Parents are indexed before their subfolders, so the reverse order sees subfolders first
+    for path in reversed(list(folders)):
+        totals = {'total': 0, 'completed': 0, 'correct_answers': 0, 'wrong_answers': 0}
+        for node in folders[path]:
+            if node['type'] == 'folder':
+                for name, value in aggregates[node['path'].replace("\\", "/").strip("/")].items():
+                    totals[name] += value
+            else:
+                statistics = node.get('statistics') or {}
+                totals['total'] += 1
+                totals['completed'] += 1 if node.get('completed') else 0
+                totals['correct_answers'] += statistics.get('correct_answers', 0)
+                totals['wrong_answers'] += statistics.get('wrong_answers', 0)
+        aggregates[path] = totals
+    return folders, aggregates
+
+
+class QuestionTreeCache:
+    """
+    Build each questions tree once and reuse it until the questions change.
+
+    A snapshot is valid while the question service generation and the
+    cache version are unchanged. The generation moves whenever the bank
+    picks up a new, edited or deleted file (answers included); routes that
+    change folders call invalidate(). The bank itself is re-checked on disk
+    at most once per revalidate interval, so a burst of requests for an
+    unchanged tree costs neither file reads nor serialization.
+    """
+
+    def __init__(self, question_service: QuestionService, read_question: QuestionReader = read_question_file,
+                 revalidate_interval: float = 1.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            question_service: The service whose generation counter tracks question changes.
+            read_question: Function reading the data of a question file.
+            revalidate_interval: Minimum seconds between two stat passes over the bank.
+        """
+        self.question_service = question_service
+        self.read_question = read_question
+        self.revalidate_interval = revalidate_interval
+        self._snapshots: Dict[SnapshotKey, TreeSnapshot] = {}
+        self._version = 0
+        self._checked_at: Optional[float] = None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def snapshot(self, game_type: str, base_dir: str, focused_folder: str = "") -> TreeSnapshot:
+        """
+        Return the tree of a question directory, building it only if it changed.
+
+        Args:
+            game_type: The game the questions belong to.
+            base_dir: The question directory.
+            focused_folder: Folder to restrict the tree to, or "" for the whole tree.
+
+        Returns:
+            TreeSnapshot: The current tree.
+        """
+        key: SnapshotKey = (game_type, base_dir, focused_folder)
+        with self._lock:
+            now = time.monotonic()
+            if self._checked_at is None or now - self._checked_at >= self.revalidate_interval:
+                # Pick up files changed outside the application with a stat pass
+                self.question_service.refresh()
+                self._checked_at = now
+            token = (self.question_service.generation, self._version)
+            cached = self._snapshots.get(key)
+            if cached is not None and cached.token == token:
+                self.hits += 1
+                return cached
+            self.misses += 1
+            if focused_folder:
+                tree = get_questions_in_focused_folder(base_dir, focused_folder, self.read_question)
+            else:
+                tree = get_questions_in_directory(base_dir, read_question=self.read_question)
+            body = json.dumps({'game_type': game_type, 'focused_folder': focused_folder, 'tree': tree},
+                              ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            folders, aggregates = index_tree(tree)
+            snapshot = TreeSnapshot(tree=tree, body=body, etag=hashlib.blake2b(body, digest_size=16).hexdigest(),
+                                    token=token, folders=folders, aggregates=aggregates)
+            self._snapshots[key] = snapshot
+            conditional_log("Built questions tree for {} ({} bytes, etag {})", key, len(body), snapshot.etag)
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Drop every snapshot after a folder or file change made by the application."""
+        with self._lock:
+            self._version += 1
+            self._checked_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, hit rate and the number of cached trees.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'snapshots': len(self._snapshots)
+            }
@@ -0,0 +1,108 @@
+"""Paginated access to one folder of a questions tree snapshot."""
+
+import base64
+import binascii
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional
+
+from svt_app.services.question_tree_cache import TreeSnapshot
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(name: str) -> str:
+    """Return the opaque cursor pointing after a child name."""
+    return base64.urlsafe_b64encode(name.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Return the child name a cursor points after.
+
+    Raises:
+        ValueError: If the cursor was not produced by encode_cursor.
+    """
+    try:
+        return base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def _child_name(node: Dict[str, Any]) -> str:
+    """Return the name children are ordered by, as listed in the directory."""
+    return node['name'] if node['type'] == 'folder' else node['file'].replace("\\", "/").rpartition("/")[2]
+
+
+def folder_children(snapshot: TreeSnapshot, path: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return the direct children of a folder of a snapshot.
+
+    Args:
+        snapshot: The tree snapshot.
+        path: Folder path relative to the snapshot root ("" for the root).
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: The children, or None if the folder is not in the tree.
+    """
+    return snapshot.folders.get(path.replace("\\", "/").strip("/"))
+
+
+def folder_aggregates(snapshot: TreeSnapshot, path: str) -> Dict[str, int]:
+    """
+    Return the question counts of a folder and all its subfolders.
+
+    Args:
+        snapshot: The tree snapshot.
+        path: Folder path relative to the snapshot root ("" for the root).
+
+    Returns:
+        Dict[str, int]: Total and completed questions, and correct and wrong answers.
+    """
+    aggregates = snapshot.aggregates.get(path.replace("\\", "/").strip("/"))
+    return dict(aggregates) if aggregates is not None else {'total': 0, 'completed': 0, 'correct_answers': 0,
+                                                             'wrong_answers': 0}
+
+
+def page_children(snapshot: TreeSnapshot, path: str, cursor: Optional[str] = None,
+                  limit: int = DEFAULT_PAGE_SIZE) -> Optional[Dict[str, Any]]:
+    """
+    Return one page of the direct children of a folder.
+
+    Folders are returned without their children but with their aggregate
+    counts, so a client can expand them on demand.
+
+    Args:
+        snapshot: The tree snapshot.
+        path: Folder path relative to the snapshot root ("" for the root).
+        cursor: Cursor returned by the previous page, or None for the first page.
+        limit: Maximum number of children to return.
+
+    Returns:
+        Optional[Dict[str, Any]]: The page, or None if the folder is not in the tree.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    children = folder_children(snapshot, path)
+    if children is None:
+        return None
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    start = 0
+    if cursor:
+        # Children are sorted by name, so the page resumes after the last name seen
+        names = [_child_name(node) for node in children]
+        start = bisect_right(names, decode_cursor(cursor))
+    page = children[start:start + limit]
+    items = [{key: value for key, value in node.items() if key != 'children'} for node in page]
+    for item in items:
+        if item['type'] == 'folder':
+            item['aggregates'] = folder_aggregates(snapshot, item['path'])
+    has_more = start + limit < len(children)
+    return {
+        'path': path.replace("\\", "/").strip("/"),
+        'aggregates': folder_aggregates(snapshot, path),
+        'total_children': len(children),
+        'items': items,
+        'next_cursor': encode_cursor(_child_name(page[-1])) if has_more and page else None
+    }
@@ -0,0 +1,224 @@
+"""Lazily built services shared by the blueprints of one application."""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from flask import current_app, has_app_context
+
+from svt_app.utils.logging_utils import conditional_log
+
+if TYPE_CHECKING:
+    from svt_app.services.anki_outbox import AnkiOutbox
+    from svt_app.services.anki_service import AnkiService
+    from svt_app.services.anki_training_service import AnkiTrainingService
+    from svt_app.services.answer_journal import AnswerJournal
+    from svt_app.services.question_path_resolver import QuestionPathResolver
+    from svt_app.services.question_service import QuestionService
+    from svt_app.services.question_tree_cache import QuestionTreeCache
+    from svt_app.services.texte_a_trous_service import TexteATrousService
+
+T = TypeVar("T")
+
+EXTENSION_KEY = "svt_services"
+DATA_DIR = os.path.join("assets", "Data")
+
+
+class ServiceContainer:
+    """
+    Build each service once, on first use, and share it across blueprints.
+
+    Nothing is constructed when the blueprints are imported or when the
+    application is created: the question bank is parsed by the first
+    request that needs a question, and the Anki services are created by
+    the first Anki request, or in the background at startup when a
+    previous run left answers in the outbox. Services depending on other services ask the
+    container for them, so every blueprint sees the same QuestionService.
+    """
+
+    def __init__(self, base_path: Optional[str] = None, data_dir: str = DATA_DIR,
+                 cache_dir: Optional[str] = None) -> None:
+        """
+        Initialize an empty container.
+
+        Args:
+            base_path: Root holding assets/Data/<question folders>, the
+                installation directory by default.
+            data_dir: Directory of the answer journal, the scores and
+                focus files, and the fill-in-the-blank questions whose
+                focus is migrated.
+            cache_dir: Directory of the question bank snapshots, the
+                per-user cache directory by default.
+        """
+        self.base_path = base_path
+        self.data_dir = data_dir
+        self.cache_dir = cache_dir
+        self._services: Dict[str, Any] = {}
+        # Reentrant: building a service builds the services it depends on
+        self._lock = threading.RLock()
+
+    def get(self, name: str, factory: Callable[[], T]) -> T:
+        """
+        Return a service, building it with factory the first time.
+
+        Args:
+            name: Name of the service.
+            factory: Function building the service.
+
+        Returns:
+            The shared instance.
+        """
+        service = self._services.get(name)
+        if service is not None:
+            return service
+        with self._lock:
+            if name not in self._services:
+                conditional_log("Building service {}", name)
+                self._services[name] = factory()
+            return self._services[name]
+
+    def built(self) -> List[str]:
+        """Return the names of the services built so far."""
+        return list(self._services)
+
+    @property
+    def scores_file(self) -> str:
+        """Return the file holding the game scores."""
+        return os.path.join(self.data_dir, "scores.json")
+
+    @property
+    def focus_file(self) -> str:
+        """Return the file holding the focused folder."""
+        return os.path.join(self.data_dir, "focus.json")
+
+    # Questions
+
+    @property
+    def question_service(self) -> "QuestionService":
+        """Return the question service, parsing the bank the first time."""
+        return self.get("question_service", self._build_question_service)
+
+    @property
+    def texte_a_trous_service(self) -> "TexteATrousService":
+        """Return the fill-in-the-blank game service."""
+        return self.get("texte_a_trous_service", self._build_texte_a_trous_service)
+
+    @property
+    def question_path_resolver(self) -> "QuestionPathResolver":
+        """Return the resolver of question IDs to files."""
+        return self.get("question_path_resolver", self._build_question_path_resolver)
+
+    @property
+    def answer_journal(self) -> "AnswerJournal":
+        """Return the journal of answers, which does not need the question bank."""
+        return self.get("answer_journal", self._build_answer_journal)
+
+    @property
+    def question_tree_cache(self) -> "QuestionTreeCache":
+        """Return the cache of the question trees."""
+        return self.get("question_tree_cache", self._build_question_tree_cache)
+
+    def _build_question_service(self) -> "QuestionService":
+        """Migrate the old focus layout, then parse the question bank."""
+        from svt_app.services.focus_migration import migrate_focus
+        from svt_app.services.question_service import QuestionService
+        from svt_app.services.question_snapshot import default_cache_dir
+        # Bring back folders hidden by the old physical focus before they are indexed
+        migrate_focus(os.path.join(self.data_dir, "fill_the_blanks"))
+        base_path, pack_path = self._question_layers()
+        # The next start reads the parsed bank back from the cache instead of every question file
+        return QuestionService(base_path, snapshot_dir=self.cache_dir or default_cache_dir(), pack_path=pack_path)
+
+    def _question_layers(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Return the root of the writable question files and the read-only pack under them.
+
+        The executable bundles its questions as a pack; the questions that
+        are edited or answered are then written to assets/Data next to it.
+        """
+        from svt_app.services.question_pack import bundled_pack_path
+        pack_path = bundled_pack_path() if self.base_path is None else None
+        return (os.getcwd() if pack_path else self.base_path), pack_path
+
+    def _build_texte_a_trous_service(self) -> "TexteATrousService":
+        """Build the fill-in-the-blank game service on the shared question service."""
+        from svt_app.services.texte_a_trous_service import TexteATrousService
+        return TexteATrousService(self.question_service)
+
+    def _build_question_path_resolver(self) -> "QuestionPathResolver":
+        """Build the resolver on the shared question service."""
+        from svt_app.services.question_path_resolver import QuestionPathResolver
+        return QuestionPathResolver(self.question_service)
+
+    def _build_answer_journal(self) -> "AnswerJournal":
+        """Open the answer journal, replaying the records left by a previous run."""
+        from svt_app.services.answer_journal import AnswerJournal
+        from svt_app.services.question_service import fill_blanks_path
+        return AnswerJournal(os.path.join(self.data_dir, "answer_journal.jsonl"),
+                             fill_blanks_path(self._question_layers()[0]), self.scores_file)
+
+    def _build_question_tree_cache(self) -> "QuestionTreeCache":
+        """Build the tree cache, reading questions through the journal."""
+        from svt_app.services.question_tree_cache import QuestionTreeCache
+        return QuestionTreeCache(self.question_service, self.answer_journal.read_question)
+
+    # Anki
+
+    @property
+    def anki_service(self) -> "AnkiService":
+        """Return the AnkiConnect client."""
+        return self.get("anki_service", self._build_anki_service)
+
+    @property
+    def answer_outbox(self) -> "AnkiOutbox":
+        """Return the outbox of Anki answers, which resumes delivering those left by a previous run."""
+        return self.get("answer_outbox", self._build_answer_outbox)
+
+    @property
+    def training_service(self) -> "AnkiTrainingService":
+        """Return the Anki training service."""
+        return self.get("training_service", self._build_training_service)
+
+    def resume_answer_outbox(self) -> None:
+        """
+        Open the outbox in the background if a previous run left its database.
+
+        The answers waiting in it are then delivered at startup rather than
+        on the first Anki request. Without a database nothing is built.
+        """
+        from svt_app.config.anki_config import AnkiConfig
+        if not os.path.exists(AnkiConfig.peek_outbox_path()):
+            return
+
+        def resume() -> None:
+            try:
+                self.answer_outbox
+            except Exception as e:
+                conditional_log("Error opening the Anki outbox: {}", str(e), level="ERROR")
+
+        threading.Thread(target=resume, name="anki-outbox-resume", daemon=True).start()
+
+    def _build_anki_service(self) -> "AnkiService":
+        """Build the AnkiConnect client."""
+        from svt_app.services.anki_service import AnkiService
+        return AnkiService()
+
+    def _build_answer_outbox(self) -> "AnkiOutbox":
+        """Open the outbox of Anki answers."""
+        from svt_app.config.anki_config import AnkiConfig
+        from svt_app.services.anki_outbox import AnkiOutbox
+        return AnkiOutbox(self.anki_service, AnkiConfig.get_outbox_path())
+
+    def _build_training_service(self) -> "AnkiTrainingService":
+        """Build the training service on the shared client and outbox."""
+        from svt_app.services.anki_training_service import AnkiTrainingService
+        return AnkiTrainingService(self.anki_service, self.answer_outbox)
+
+def get_services() -> ServiceContainer:
+    """Return the service container of the current application."""
+    return current_app.extensions[EXTENSION_KEY]
+
+
+def current_services() -> Optional[ServiceContainer]:
+    """Return the service container of the current application, or None outside one."""
+    return current_app.extensions.get(EXTENSION_KEY) if has_app_context() else None
@@ -0,0 +1,264 @@
+"""SQLite question store for Révijouer application, filled and exported by question_store_migration."""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from svt_app.services.question_index import normalize_folder
+from svt_app.utils.logging_utils import conditional_log
+
+# Question kinds, matching the folders of assets/Data
+FILL_IN_BLANK = "fill_the_blanks"
+IMAGE_MATCHING = "image_matching"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    kind TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    question_id INTEGER NOT NULL,
+    file_name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    correct_answers INTEGER NOT NULL DEFAULT 0,
+    wrong_answers INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (kind, folder, question_id)
+);
+CREATE INDEX IF NOT EXISTS questions_by_folder ON questions (kind, folder, completed, question_id);
+CREATE TABLE IF NOT EXISTS folders (
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (kind, path)
+);
+"""
+
+
+class SQLiteQuestionStore:
+    """
+    Question store backed by a single SQLite database.
+
+    Completion flags and answer statistics live in their own indexed columns,
+    so they can be read and updated without rewriting the question JSON.
+    Each thread gets its own connection; writes run in IMMEDIATE transactions
+    so concurrent waitress threads never lose an update.
+
+    The application itself still reads and writes the JSON tree: the store
+    is an export and import format, used through question_store_migration.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            db_path: Path of the SQLite database file.
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+        conditional_log("SQLite question store opened: {}", db_path)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block inside an IMMEDIATE transaction, rolling back on error.
+
+        A block nested in another one joins the outer transaction, so a batch
+        of writes can be committed once.
+        """
+        connection = self._connection()
+        if connection.in_transaction:
+            yield connection
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the connection of the calling thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    @staticmethod
+    def _row_to_question(row: sqlite3.Row) -> Dict[str, Any]:
+        """Rebuild the question JSON from a row, with columns taking precedence."""
+        data = json.loads(row["data"])
+        data["completed"] = bool(row["completed"])
+        data["statistics"] = {
+            "correct_answers": row["correct_answers"],
+            "wrong_answers": row["wrong_answers"]
+        }
+        return data
+
+    def upsert_question(self, kind: str, folder: str, question_id: int, file_name: str,
+                        data: Dict[str, Any]) -> None:
+        """
+        Insert or replace a question.
+
+        Args:
+            kind: FILL_IN_BLANK or IMAGE_MATCHING.
+            folder: Folder of the question relative to the bank root.
+            question_id: The question ID.
+            file_name: Original file name, kept for exporting.
+            data: The question JSON, including completion and statistics.
+        """
+        folder = normalize_folder(folder)
+        statistics = data.get("statistics") or {}
+        payload = {key: value for key, value in data.items() if key not in ("completed", "statistics")}
+        with self.transaction() as connection:
+            self._ensure_folder(connection, kind, folder)
+            connection.execute(
+                "INSERT OR REPLACE INTO questions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, folder, question_id, file_name, json.dumps(payload, ensure_ascii=False),
+                 int(bool(data.get("completed", False))),
+                 int(statistics.get("correct_answers", 0)), int(statistics.get("wrong_answers", 0)))
+            )
+
+    @staticmethod
+    def _ensure_folder(connection: sqlite3.Connection, kind: str, folder: str) -> None:
+        """Register a folder and all of its ancestors."""
+        parts = folder.split("/") if folder else []
+        for depth in range(1, len(parts) + 1):
+            connection.execute("INSERT OR IGNORE INTO folders VALUES (?, ?)", (kind, "/".join(parts[:depth])))
+
+    def add_folder(self, kind: str, folder: str) -> None:
+        """Register a (possibly empty) folder."""
+        with self.transaction() as connection:
+            self._ensure_folder(connection, kind, normalize_folder(folder))
+
+    def get_question(self, kind: str, folder: str, question_id: int) -> Optional[Dict[str, Any]]:
+        """Return the JSON of one question, or None."""
+        row = self._connection().execute(
+            "SELECT * FROM questions WHERE kind = ? AND folder = ? AND question_id = ?",
+            (kind, normalize_folder(folder), question_id)
+        ).fetchone()
+        return self._row_to_question(row) if row else None
+
+    def list_folder(self, kind: str, folder: str) -> List[Dict[str, Any]]:
+        """
+        Return the questions located directly in a folder, ordered by ID.
+
+        Each item has the question JSON plus "question_id" and "file_name" keys.
+        """
+        rows = self._connection().execute(
+            "SELECT * FROM questions WHERE kind = ? AND folder = ? ORDER BY question_id",
+            (kind, normalize_folder(folder))
+        ).fetchall()
+        return [dict(self._row_to_question(row), question_id=row["question_id"], file_name=row["file_name"])
+                for row in rows]
+
+    def list_folders(self, kind: str) -> List[str]:
+        """Return every registered folder of a kind, sorted."""
+        rows = self._connection().execute("SELECT path FROM folders WHERE kind = ? ORDER BY path", (kind,))
+        return [row["path"] for row in rows]
+
+    def active_ids(self, kind: str, folder: str) -> List[int]:
+        """Return the sorted IDs of the non-completed questions of a folder."""
+        rows = self._connection().execute(
+            "SELECT question_id FROM questions WHERE kind = ? AND folder = ? AND completed = 0 ORDER BY question_id",
+            (kind, normalize_folder(folder))
+        )
+        return [row["question_id"] for row in rows]
+
+    def record_answer(self, kind: str, folder: str, question_id: int, correct: bool,
+                      mark_completed: bool = False) -> Optional[Dict[str, int]]:
+        """
+        Atomically count an answer and optionally mark the question completed.
+
+        Returns:
+            Optional[Dict[str, int]]: The updated statistics, or None if the question is unknown.
+        """
+        column = "correct_answers" if correct else "wrong_answers"
+        key = (kind, normalize_folder(folder), question_id)
+        with self.transaction() as connection:
+            updated = connection.execute(
+                f"UPDATE questions SET {column} = {column} + 1, completed = MAX(completed, ?) "
+                "WHERE kind = ? AND folder = ? AND question_id = ?",
+                (int(mark_completed),) + key
+            ).rowcount
+            if not updated:
+                return None
+            row = connection.execute(
+                "SELECT correct_answers, wrong_answers FROM questions WHERE kind = ? AND folder = ? AND question_id = ?",
+                key
+            ).fetchone()
+        return {"correct_answers": row["correct_answers"], "wrong_answers": row["wrong_answers"]}
+
+    def set_completed(self, kind: str, folder: str, question_id: int, completed: bool) -> bool:
+        """Set the completion flag of a question; return False if it does not exist."""
+        with self.transaction() as connection:
+            return connection.execute(
+                "UPDATE questions SET completed = ? WHERE kind = ? AND folder = ? AND question_id = ?",
+                (int(completed), kind, normalize_folder(folder), question_id)
+            ).rowcount > 0
+
+    def delete_question(self, kind: str, folder: str, question_id: int) -> bool:
+        """Delete a question; return False if it did not exist."""
+        with self.transaction() as connection:
+            return connection.execute(
+                "DELETE FROM questions WHERE kind = ? AND folder = ? AND question_id = ?",
+                (kind, normalize_folder(folder), question_id)
+            ).rowcount > 0
+
+    def move_folder(self, kind: str, old_folder: str, new_folder: str) -> None:
+        """Move a folder and everything below it to a new path in one transaction."""
+        old_folder, new_folder = normalize_folder(old_folder), normalize_folder(new_folder)
+        with self.transaction() as connection:
+            for table, column in (("questions", "folder"), ("folders", "path")):
+                connection.execute(
+                    f"UPDATE {table} SET {column} = ? || substr({column}, ?) "
+                    f"WHERE kind = ? AND ({column} = ? OR {column} LIKE ? ESCAPE '\\')",
+                    (new_folder, len(old_folder) + 1, kind, old_folder, _like_prefix(old_folder))
+                )
+            self._ensure_folder(connection, kind, new_folder)
+
+    def delete_folder(self, kind: str, folder: str) -> None:
+        """Delete a folder, its subfolders and their questions."""
+        folder = normalize_folder(folder)
+        with self.transaction() as connection:
+            for table, column in (("questions", "folder"), ("folders", "path")):
+                connection.execute(
+                    f"DELETE FROM {table} WHERE kind = ? AND ({column} = ? OR {column} LIKE ? ESCAPE '\\')",
+                    (kind, folder, _like_prefix(folder))
+                )
+
+    def folder_statistics(self, kind: str, folder: str = "") -> Dict[str, int]:
+        """Return total, completed, correct and wrong counts for a folder and its subfolders."""
+        folder = normalize_folder(folder)
+        condition = "1" if not folder else "(folder = ? OR folder LIKE ? ESCAPE '\\')"
+        params = (kind,) if not folder else (kind, folder, _like_prefix(folder))
+        row = self._connection().execute(
+            "SELECT COUNT(*) AS total, COALESCE(SUM(completed), 0) AS completed, "
+            "COALESCE(SUM(correct_answers), 0) AS correct_answers, COALESCE(SUM(wrong_answers), 0) AS wrong_answers "
+            f"FROM questions WHERE kind = ? AND {condition}",
+            params
+        ).fetchone()
+        return dict(row)
+
+
+def _like_prefix(folder: str) -> str:
+    """Return a LIKE pattern matching every path strictly below a folder."""
+    escaped = folder.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}/%"
@@ -1,5 +1,6 @@
 """State management package for the application."""
 
+from svt_app.state.focus import FocusState
 from svt_app.state.scores import GameScores
 
-__all__ = ['GameScores'] 
\ No newline at end of file
+__all__ = ['FocusState', 'GameScores'] 
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""State management module for the focused question folder."""
+
+from typing import ClassVar, Optional
+import os
+import json
+from dataclasses import dataclass
+from svt_app.services.service_container import current_services
+from svt_app.utils.logging_utils import conditional_log, log_if_enabled
+
+
+@dataclass
+class FocusState:
+    """
+    Class to manage the persisted folder focus of the question bank.
+
+    The focus is a logical filter: focusing or unfocusing a folder only
+    rewrites a small metadata file, and the loaders, check_answer and the
+    questions tree restrict themselves to the focused folder. The value is
+    cached in memory so detecting the focus is a single lookup. Within an
+    application, the file is the one of its service container's data
+    directory.
+    """
+
+    FOCUS_FILE = "assets/Data/focus.json"
+    _focus: ClassVar[Optional[str]] = None
+    _loaded: ClassVar[bool] = False
+    # File the cached value was read from or written to
+    _loaded_file: ClassVar[Optional[str]] = None
+
+    @staticmethod
+    def focus_file() -> str:
+        """Return the focus file of the current application, FOCUS_FILE outside one."""
+        services = current_services()
+        return services.focus_file if services is not None else FocusState.FOCUS_FILE
+
+    @staticmethod
+    @log_if_enabled()
+    def get_focus() -> Optional[str]:
+        """
+        Get the focused folder.
+
+        Returns:
+            Optional[str]: The focused folder relative to the question root, or None.
+        """
+        focus_file = FocusState.focus_file()
+        if not FocusState._loaded or FocusState._loaded_file != focus_file:
+            try:
+                with open(focus_file, 'r', encoding='utf-8') as f:
+                    FocusState._focus = json.load(f).get('folder') or None
+            except FileNotFoundError:
+                FocusState._focus = None
+            except Exception as e:
+                conditional_log("Error loading focus: {}", str(e), level="ERROR")
+                FocusState._focus = None
+            FocusState._loaded = True
+            FocusState._loaded_file = focus_file
+        return FocusState._focus
+
+    @staticmethod
+    @log_if_enabled()
+    def set_focus(folder: Optional[str]) -> None:
+        """
+        Persist the focused folder.
+
+        Args:
+            folder: The folder to focus relative to the question root, or None to clear the focus.
+        """
+        folder = (folder or "").replace("\\", "/").strip("/") or None
+        focus_file = FocusState.focus_file()
+        os.makedirs(os.path.dirname(focus_file) or ".", exist_ok=True)
+        temp_file = f"{focus_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'folder': folder}, f, indent=2, ensure_ascii=False)
+        os.replace(temp_file, focus_file)
+        FocusState._focus = folder
+        FocusState._loaded = True
+        FocusState._loaded_file = focus_file
+        conditional_log("Focus set to: '{}'", folder)
+
+    @staticmethod
+    @log_if_enabled()
+    def clear_focus() -> None:
+        """Remove the focus."""
+        FocusState.set_focus(None)
+
+    @staticmethod
+    @log_if_enabled()
+    def follow_move(old_path: str, new_path: Optional[str]) -> None:
+        """
+        Keep the focus pointing at its folder when the folder or a parent moves.
+
+        Args:
+            old_path: The folder that was renamed, moved or deleted.
+            new_path: Its new relative path, or None if it was deleted.
+        """
+        focus = FocusState.get_focus()
+        old_path = old_path.replace("\\", "/").strip("/")
+        if not focus or not old_path or not (focus == old_path or focus.startswith(f"{old_path}/")):
+            return
+        if new_path is None:
+            FocusState.clear_focus()
+        else:
+            FocusState.set_focus(new_path.replace("\\", "/").strip("/") + focus[len(old_path):])
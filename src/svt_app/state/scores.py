@@ -1,11 +1,17 @@
 """State management module for game scores."""
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 import os
 import json
 from dataclasses import dataclass
 from flask import session
-from svt_app.utils.logging_utils import conditional_log, log_if_enabled
+from svt_app.services.service_container import current_services
+from svt_app.utils.logging_utils import log_if_enabled, module_logger
+
+if TYPE_CHECKING:
+    from svt_app.services.answer_journal import AnswerJournal
+
+log = module_logger(__name__)
 
 @dataclass
 class GameScores:
@@ -13,23 +19,39 @@ class GameScores:
     Class to manage game scores across the application.
     
     This class provides a centralized way to manage and access game scores
-    using both Flask's session and persistent storage.
+    using both Flask's session and persistent storage. When the application
+    has a service container, the scores file is the one of its data
+    directory, and score changes are appended to its answer journal
+    instead of rewriting the file.
     """
     
     SCORES_FILE = "assets/Data/scores.json"
+
+    @staticmethod
+    def scores_file() -> str:
+        """Return the scores file of the current application, SCORES_FILE outside one."""
+        services = current_services()
+        return services.scores_file if services is not None else GameScores.SCORES_FILE
+
+    @staticmethod
+    def _journal() -> Optional["AnswerJournal"]:
+        """Return the answer journal of the current application, opened on first use."""
+        services = current_services()
+        return services.answer_journal if services is not None else None
     
     @staticmethod
     @log_if_enabled()
     def _ensure_scores_file() -> None:
         """Ensure the scores file exists with default values."""
-        os.makedirs(os.path.dirname(GameScores.SCORES_FILE), exist_ok=True)
-        if not os.path.exists(GameScores.SCORES_FILE):
-            conditional_log("Creating new scores file")
+        scores_file = GameScores.scores_file()
+        os.makedirs(os.path.dirname(scores_file) or ".", exist_ok=True)
+        if not os.path.exists(scores_file):
+            log("Creating new scores file")
             default_scores = {
                 "texte_a_trous": 0,
                 "relier_images": 0
             }
-            with open(GameScores.SCORES_FILE, 'w', encoding='utf-8') as f:
+            with open(scores_file, 'w', encoding='utf-8') as f:
                 json.dump(default_scores, f, indent=2)
     
     @staticmethod
@@ -38,12 +60,18 @@ class GameScores:
         """Load scores from persistent storage."""
         GameScores._ensure_scores_file()
         try:
-            with open(GameScores.SCORES_FILE, 'r', encoding='utf-8') as f:
+            journal = GameScores._journal()
+            if journal is not None:
+                # Merge the score changes not compacted into the file yet
+                scores = journal.read_scores({"texte_a_trous": 0, "relier_images": 0})
+                log("Loaded scores from file and journal: {}", scores)
+                return scores
+            with open(GameScores.scores_file(), 'r', encoding='utf-8') as f:
                 scores = json.load(f)
-                conditional_log("Loaded scores from file: {}", scores)
+                log("Loaded scores from file: {}", scores)
                 return scores
         except Exception as e:
-            conditional_log("Error loading scores: {}", str(e), level="ERROR")
+            log("Error loading scores: {}", str(e), level="ERROR")
             return {"texte_a_trous": 0, "relier_images": 0}
     
     @staticmethod
@@ -52,11 +80,11 @@ class GameScores:
         """Save scores to persistent storage."""
         try:
             GameScores._ensure_scores_file()
-            with open(GameScores.SCORES_FILE, 'w', encoding='utf-8') as f:
+            with open(GameScores.scores_file(), 'w', encoding='utf-8') as f:
                 json.dump(scores, f, indent=2)
-            conditional_log("Saved scores to file: {}", scores)
+            log("Saved scores to file: {}", scores)
         except Exception as e:
-            conditional_log("Error saving scores: {}", str(e), level="ERROR")
+            log("Error saving scores: {}", str(e), level="ERROR")
     
     @staticmethod
     @log_if_enabled()
@@ -68,10 +96,10 @@ class GameScores:
             Dict[str, int]: Dictionary containing game scores.
         """
         if 'scores' not in session:
-            conditional_log("Loading scores from persistent storage")
+            log("Loading scores from persistent storage")
             session['scores'] = GameScores._load_scores()
         else:
-            conditional_log("Retrieved existing scores from session: {}", session['scores'])
+            log("Retrieved existing scores from session: {}", session['scores'])
         return session['scores']
     
     @staticmethod
@@ -88,8 +116,12 @@ class GameScores:
         old_score = scores.get(game_type, 0)
         scores[game_type] = score
         session['scores'] = scores
-        GameScores._save_scores(scores)  # Save to persistent storage
-        conditional_log("Updated score for {}: {} -> {}", game_type, old_score, score)
+        journal = GameScores._journal()
+        if journal is not None:
+            journal.record_score(game_type, value=score)
+        else:
+            GameScores._save_scores(scores)  # Save to persistent storage
+        log("Updated score for {}: {} -> {}", game_type, old_score, score)
     
     @staticmethod
     @log_if_enabled()
@@ -106,8 +138,12 @@ class GameScores:
         new_score = current_score + increment
         scores[game_type] = new_score
         session['scores'] = scores
-        GameScores._save_scores(scores)  # Save to persistent storage
-        conditional_log("Incremented score for {}: {} -> {}", game_type, current_score, new_score)
+        journal = GameScores._journal()
+        if journal is not None:
+            journal.record_score(game_type, delta=increment)
+        else:
+            GameScores._save_scores(scores)  # Save to persistent storage
+        log("Incremented score for {}: {} -> {}", game_type, current_score, new_score)
     
     @staticmethod
     @log_if_enabled()
@@ -123,18 +159,23 @@ class GameScores:
         """
         scores = GameScores.get_scores()
         score = scores.get(game_type)
-        conditional_log("Retrieved score for {}: {}", game_type, score)
+        log("Retrieved score for {}: {}", game_type, score)
         return score
     
     @staticmethod
     @log_if_enabled()
     def reset_scores() -> None:
         """Reset all game scores to zero."""
-        conditional_log("Resetting all scores to zero")
+        log("Resetting all scores to zero")
         scores = {
             "texte_a_trous": 0,
             "relier_images": 0
         }
         session['scores'] = scores
-        GameScores._save_scores(scores)  # Save to persistent storage
-        conditional_log("Scores after reset: {}", scores) 
\ No newline at end of file
+        journal = GameScores._journal()
+        if journal is not None:
+            for game_type, score in scores.items():
+                journal.record_score(game_type, value=score)
+        else:
+            GameScores._save_scores(scores)  # Save to persistent storage
+        log("Scores after reset: {}", scores) 
\ No newline at end of file
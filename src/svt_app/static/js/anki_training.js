@@ -23,10 +23,31 @@ wooshAudio.preload = 'auto';
 const deckCompletedAudio = new Audio('/static/audio/deck-completed.mp3');
 deckCompletedAudio.preload = 'auto';
 
+// Cards fetched per request; the next page is fetched when the loaded cards run low
+const PAGE_SIZE = 20;
+// Incremented on every reload, so pages of a previous load are ignored
+let loadGeneration = 0;
+// Cursor of the page after the loaded cards, null once the last page is loaded
+let nextCursor = null;
+// Request of the next page in flight, so it is only fetched once
+let pageRequest = null;
+
+async function fetchCardsPage(cursor) {
+    const params = new URLSearchParams({ limit: PAGE_SIZE });
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
+    const response = await fetch(`/api/anki/cards/${encodeURIComponent(deckName)}/page?${params}`);
+    return response.json();
+}
+
 async function loadCards() {
+    const generation = ++loadGeneration;
+    nextCursor = null;
+    pageRequest = null;
     try {
-        const response = await fetch(`/api/anki/cards/${deckName}`);
-        const data = await response.json();
+        const data = await fetchCardsPage(null);
+        if (generation !== loadGeneration) return;
         console.log("this is the data tarzan", data);
         
         if (data.success && data.cards.length > 0) {
@@ -36,8 +57,9 @@ async function loadCards() {
                 data.cards.push(data.cards.shift());
             }
             currentCards = data.cards;
-            totalCards = data.cards.length;
+            totalCards = data.total;
             currentCardIndex = 0;
+            nextCursor = data.next_cursor;
             updateProgress();
             showNextCard();
         } else {
@@ -50,10 +72,43 @@ async function loadCards() {
     }
 }
 
+function loadNextPage() {
+    if (pageRequest || !nextCursor) return pageRequest;
+    const generation = loadGeneration;
+    const request = fetchCardsPage(nextCursor)
+        .then(data => {
+            if (generation !== loadGeneration || !data.success) return;
+            currentCards.push(...data.cards);
+            nextCursor = data.next_cursor;
+        })
+        .catch(error => console.error('Error loading more cards:', error))
+        .finally(() => {
+            if (pageRequest === request) pageRequest = null;
+        });
+    pageRequest = request;
+    return request;
+}
+
+async function advanceAfterAnswer() {
+    // The answered card is left behind: the server skips it until Anki has recorded the answer
+    currentCardIndex++;
+    updateProgress();
+    if (currentCardIndex >= currentCards.length - PAGE_SIZE / 2) {
+        const request = loadNextPage();
+        if (request && currentCardIndex >= currentCards.length) await request;
+    }
+    if (currentCardIndex < currentCards.length) {
+        showNextCard();
+    } else {
+        // Loaded cards ran out: the first page brings back the cards that are due again
+        await loadCards();
+    }
+}
+
 function showNextCard() {
     console.log("this is the show next card function", currentCardIndex, currentCards.length);
     if (currentCardIndex >= currentCards.length) {
-        showMessage('Tu as fini de révijouer ce paquet!');
+        showMessage(currentCards.length < totalCards ? 'Chargement des cartes...' : 'Tu as fini de révijouer ce paquet!');
         return;
     }
 
@@ -62,7 +117,7 @@ function showNextCard() {
     
     elements.question.innerHTML = card.question;
     elements.answer.innerHTML = card.answer;
-    elements.remainingCount.textContent = currentCards.length - currentCardIndex;
+    elements.remainingCount.textContent = Math.max(totalCards, currentCards.length) - currentCardIndex;
     
     // Reset card state
     isShowingAnswer = false;
@@ -96,7 +151,9 @@ async function submitAnswer(ease) {
     console.log('Making request with cardId:', currentCardId, 'and ease:', ease);
     const requestData = {
         cardId: currentCardId,
-        ease: ease
+        ease: ease,
+        // Lets the server record this answer once even if the request is sent again
+        idempotencyKey: `${currentCardId}-${Date.now()}-${Math.random().toString(36).slice(2)}`
     };
 
     try {
@@ -115,7 +172,7 @@ async function submitAnswer(ease) {
         if (data.success) {
             console.log("Answer submission successful");
             lastAnsweredCardId = currentCardId;
-            await loadCards();
+            await advanceAfterAnswer();
         } else {
             console.error("Answer submission failed:", data.error);
         }
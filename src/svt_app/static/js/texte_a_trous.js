@@ -14,6 +14,8 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // Get the question ID from the data attribute
     const questionId = questionContainer ? parseInt(questionContainer.dataset.questionId) : 1;
+    // Several folders may reuse an ID: the folder tells the server which file is on screen
+    const questionFolder = questionContainer ? questionContainer.dataset.questionFolder : undefined;
 
     // Get the focused folder from URL parameters
     const urlParams = new URLSearchParams(window.location.search);
@@ -175,6 +177,7 @@ document.addEventListener('DOMContentLoaded', function() {
             body: JSON.stringify({
                 game_type: 'texte_a_trous',
                 question_id: questionId,
+                question_folder: questionFolder,
                 answer: answer,
                 focused_folder: focusedFolder
             })
@@ -199,6 +202,10 @@ document.addEventListener('DOMContentLoaded', function() {
                             const urlParams = new URLSearchParams(window.location.search);
                             const focusParam = urlParams.get('focus');
                             let nextUrl = window.location.pathname + '?question_id=' + data.next_question_id;
+                            // The folder tells apart the folders reusing the ID
+                            if (data.next_question_folder !== null && data.next_question_folder !== undefined) {
+                                nextUrl += '&folder=' + encodeURIComponent(data.next_question_folder);
+                            }
                             if (focusParam) {
                                 nextUrl += '&focus=' + encodeURIComponent(focusParam);
                             }
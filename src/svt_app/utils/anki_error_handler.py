@@ -1,7 +1,5 @@
 """Error handling utilities for Anki integration."""
 from typing import Optional, Dict, Any
-import requests
-from urllib3.exceptions import NewConnectionError
 from ..utils.logging_utils import conditional_log
 
 class AnkiConnectionError(Exception):
@@ -34,6 +32,10 @@ def diagnose_connection_error(error: Exception) -> Dict[str, Any]:
     
     conditional_log("Diagnosing Anki connection error: {}", str(error))
     
+    # Loaded with the Anki client that raised the error, not with this module
+    import requests
+    from urllib3.exceptions import NewConnectionError
+    
     if isinstance(error, requests.exceptions.ConnectionError):
         if isinstance(error.args[0], NewConnectionError):
             diagnosis['possible_causes'].extend([
@@ -1,6 +1,7 @@
 """Logging utilities for the SVT application."""
 
 import os
+import sys
 import json
 import logging
 from functools import wraps
@@ -68,6 +69,12 @@ def get_logger(module_name: str) -> logging.Logger:
     
     return logger
 
+# Modules with logging enabled, resolved once from the configuration
+_ENABLED_MODULES = frozenset(name for name, enabled in _CONFIG.get('enabled_loggers', {}).items() if enabled)
+
+# Frame access used to find the calling module without going through inspect
+_getframe = getattr(sys, '_getframe', None)
+
 def is_logging_enabled(module_name: str) -> bool:
     """
     Check if logging is enabled for the specified module.
@@ -78,12 +85,109 @@ def is_logging_enabled(module_name: str) -> bool:
     Returns:
         bool: True if logging is enabled, False otherwise.
     """
-    enabled_loggers = _CONFIG.get('enabled_loggers', {})
-    return enabled_loggers.get(module_name, False)
+    return module_name in _ENABLED_MODULES
+
+class LazyArg:
+    """
+    Log argument computed only when the message is actually emitted.
+
+    Example:
+        conditional_log("Session: {}", lazy(lambda: dict(session)))
+    """
+
+    __slots__ = ('func',)
+
+    def __init__(self, func: Callable[[], Any]) -> None:
+        """
+        Initialize the lazy argument.
+
+        Args:
+            func: Function returning the value to log.
+        """
+        self.func = func
+
+    def __format__(self, format_spec: str) -> str:
+        """Compute the value and format it."""
+        return format(self.func(), format_spec)
+
+    def __str__(self) -> str:
+        """Compute the value and convert it to a string."""
+        return str(self.func())
+
+    def __repr__(self) -> str:
+        """Compute the value and return its representation."""
+        return repr(self.func())
+
+def lazy(func: Callable[[], Any]) -> LazyArg:
+    """
+    Wrap an expensive log argument so it is only computed for emitted messages.
+    
+    Args:
+        func: Function returning the value to log.
+        
+    Returns:
+        LazyArg: The deferred argument.
+    """
+    return LazyArg(func)
+
+def _emit(module_name: str, message: str, args: tuple, level: str) -> None:
+    """Format and write a message for a module whose logging is enabled."""
+    log_method = getattr(get_logger(module_name), level.lower())
+    if args:
+        try:
+            formatted_message = message.format(*args)
+        except Exception:
+            formatted_message = f"{message} (args={args})"
+        log_method(formatted_message)
+    else:
+        log_method(message)
+
+class ModuleLogger:
+    """
+    Logger of one module with its enablement resolved at import time.
+
+    Hot code can guard expensive calls with a single attribute check:
+
+        log = module_logger(__name__)
+        if log.enabled:
+            log("Question data: {}", question_data)
+    """
+
+    __slots__ = ('name', 'enabled')
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the module logger.
+
+        Args:
+            name: The module name.
+        """
+        self.name = name
+        self.enabled = is_logging_enabled(name)
+
+    def __call__(self, message: str, *args: Any, level: str = 'DEBUG') -> None:
+        """Log a message if logging is enabled for the module."""
+        if self.enabled:
+            _emit(self.name, message, args, level)
+
+def module_logger(module_name: str) -> ModuleLogger:
+    """
+    Get the logger of a module, to be created once at import time.
+    
+    Args:
+        module_name: The name of the module, usually __name__.
+        
+    Returns:
+        ModuleLogger: The module logger.
+    """
+    return ModuleLogger(module_name)
 
 def log_if_enabled(level: str = 'DEBUG') -> Callable:
     """
     Decorator that logs function calls if logging is enabled for the module.
+
+    Enablement is resolved when the function is decorated: functions of
+    disabled modules are returned undecorated and cost nothing per call.
     
     Args:
         level: The logging level to use. Defaults to 'DEBUG'.
@@ -92,27 +196,33 @@ def log_if_enabled(level: str = 'DEBUG') -> Callable:
         Callable: The decorator function.
     """
     def decorator(func: Callable) -> Callable:
+        module_name = func.__module__
+        if not is_logging_enabled(module_name):
+            return func
+        logger = get_logger(module_name)
+        log_method = getattr(logger, level.lower())
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            module_name = func.__module__
-            if is_logging_enabled(module_name):
-                logger = get_logger(module_name)
-                log_method = getattr(logger, level.lower())
-                log_method(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
-                try:
-                    result = func(*args, **kwargs)
-                    log_method(f"{func.__name__} returned: {result}")
-                    return result
-                except Exception as e:
-                    logger.error(f"Error in {func.__name__}: {e}")
-                    raise
-            return func(*args, **kwargs)
+            log_method(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+            try:
+                result = func(*args, **kwargs)
+                log_method(f"{func.__name__} returned: {result}")
+                return result
+            except Exception as e:
+                logger.error(f"Error in {func.__name__}: {e}")
+                raise
         return wrapper
     return decorator
 
 def conditional_log(message: str, *args: Any, level: str = 'DEBUG', module_name: Optional[str] = None) -> None:
     """
     Log a message if logging is enabled for the module.
+
+    For a disabled module this is a frame lookup and a set membership test;
+    the message is only formatted, and lazy() arguments only computed, when
+    it is emitted. Modules logging on the request path use module_logger
+    instead, which skips the frame lookup.
     
     Args:
         message: The message to log.
@@ -121,21 +231,13 @@ def conditional_log(message: str, *args: Any, level: str = 'DEBUG', module_name:
         module_name: Optional module name. If not provided, will try to determine from caller.
     """
     if module_name is None:
-        import inspect
-        frame = inspect.currentframe()
-        if frame is not None:
-            frame = frame.f_back
-            if frame is not None:
-                module_name = frame.f_globals['__name__']
-    
-    if module_name and is_logging_enabled(module_name):
-        logger = get_logger(module_name)
-        log_method = getattr(logger, level.lower())
-        if args:
-            try:
-                formatted_message = message.format(*args)
-            except Exception:
-                formatted_message = f"{message} (args={args})"
-            log_method(formatted_message)
+        if _getframe is not None:
+            module_name = _getframe(1).f_globals.get('__name__')
         else:
-            log_method(message) 
\ No newline at end of file
+            import inspect
+            frame = inspect.currentframe()
+            if frame is not None and frame.f_back is not None:
+                module_name = frame.f_back.f_globals.get('__name__')
+    
+    if module_name in _ENABLED_MODULES:
+        _emit(module_name, message, args, level)
@@ -0,0 +1,219 @@
+"""Per-route request latency and throughput metrics for the SVT application."""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import Flask, Response, g, jsonify, request
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS: Tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                                      0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES: Tuple[float, ...] = (0.5, 0.95, 0.99)
+
+RouteKey = Tuple[str, str, str]
+
+
+class RouteStats:
+    """
+    Latency histogram and counters of one route.
+
+    Attributes:
+        buckets (List[int]): Request count per latency bucket, the last one being +Inf.
+        count (int): Number of requests.
+        errors (int): Number of requests answered with a 5xx status.
+        total (float): Sum of the latencies in seconds.
+        maximum (float): Slowest latency seen in seconds.
+    """
+
+    __slots__ = ('buckets', 'count', 'errors', 'total', 'maximum')
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.buckets: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a latency quantile by interpolating inside the histogram buckets.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated latency in seconds.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for index, in_bucket in enumerate(self.buckets):
+            upper = LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.maximum
+            if in_bucket and cumulative + in_bucket >= rank:
+                upper = min(upper, self.maximum)
+                return lower + (upper - lower) * (rank - cumulative) / in_bucket
+            cumulative += in_bucket
+            lower = upper
+        return self.maximum
+
+
+class RequestMetrics:
+    """
+    Request counts, error counts and latency histograms per route.
+
+    Routes are identified by blueprint, endpoint and HTTP method. Recording
+    a request is a bisection and a few increments under a lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._routes: Dict[RouteKey, RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, blueprint: str, endpoint: str, method: str, status: int, duration: float) -> None:
+        """
+        Record one request.
+
+        Args:
+            blueprint: Name of the blueprint, "app" for routes of the application itself.
+            endpoint: Flask endpoint name.
+            method: HTTP method.
+            status: Response status code.
+            duration: Latency in seconds.
+        """
+        bucket = bisect_left(LATENCY_BUCKETS, duration)
+        key = (blueprint, endpoint, method)
+        with self._lock:
+            stats = self._routes.get(key)
+            if stats is None:
+                stats = self._routes[key] = RouteStats()
+            stats.buckets[bucket] += 1
+            stats.count += 1
+            stats.total += duration
+            if duration > stats.maximum:
+                stats.maximum = duration
+            if status >= 500:
+                stats.errors += 1
+
+    def _snapshot(self) -> List[Tuple[RouteKey, RouteStats]]:
+        """Return a consistent copy of the route statistics, sorted by route."""
+        with self._lock:
+            copies = []
+            for key, stats in sorted(self._routes.items()):
+                copy = RouteStats()
+                copy.buckets = list(stats.buckets)
+                copy.count, copy.errors, copy.total, copy.maximum = stats.count, stats.errors, stats.total, stats.maximum
+                copies.append((key, copy))
+            return copies
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Summarize every route.
+
+        Returns:
+            List[Dict[str, Any]]: Counts and p50/p95/p99/mean/max latencies in milliseconds per route.
+        """
+        routes = []
+        for (blueprint, endpoint, method), stats in self._snapshot():
+            route: Dict[str, Any] = {
+                'blueprint': blueprint,
+                'endpoint': endpoint,
+                'method': method,
+                'count': stats.count,
+                'errors': stats.errors,
+                'mean_ms': round(stats.total / stats.count * 1000, 3) if stats.count else 0.0,
+                'max_ms': round(stats.maximum * 1000, 3),
+            }
+            for q in QUANTILES:
+                route[f"p{int(q * 100)}_ms"] = round(stats.quantile(q) * 1000, 3)
+            routes.append(route)
+        return routes
+
+    def prometheus_text(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics document.
+        """
+        lines = [
+            "# HELP revijouer_http_request_duration_seconds Request latency per route.",
+            "# TYPE revijouer_http_request_duration_seconds histogram",
+        ]
+        snapshot = self._snapshot()
+        for key, stats in snapshot:
+            labels = _labels(key)
+            cumulative = 0
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                cumulative += stats.buckets[index]
+                lines.append(f'revijouer_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'revijouer_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+            lines.append(f"revijouer_http_request_duration_seconds_sum{{{labels}}} {stats.total}")
+            lines.append(f"revijouer_http_request_duration_seconds_count{{{labels}}} {stats.count}")
+        lines += ["# HELP revijouer_http_requests_total Requests per route.",
+                  "# TYPE revijouer_http_requests_total counter"]
+        lines += [f"revijouer_http_requests_total{{{_labels(key)}}} {stats.count}" for key, stats in snapshot]
+        lines += ["# HELP revijouer_http_request_errors_total Requests answered with a 5xx status per route.",
+                  "# TYPE revijouer_http_request_errors_total counter"]
+        lines += [f"revijouer_http_request_errors_total{{{_labels(key)}}} {stats.errors}" for key, stats in snapshot]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(key: RouteKey) -> str:
+    """Render the labels of a route."""
+    blueprint, endpoint, method = key
+    return f'blueprint="{_escape(blueprint)}",endpoint="{_escape(endpoint)}",method="{_escape(method)}"'
+
+
+def init_request_metrics(app: Flask, metrics: Optional[RequestMetrics] = None) -> RequestMetrics:
+    """
+    Time every request of an application and expose the results.
+
+    Registers GET /metrics (Prometheus text format) and GET /metrics/summary
+    (JSON percentiles per route).
+
+    Args:
+        app: The Flask application.
+        metrics: The metrics to record into, a new instance by default.
+
+    Returns:
+        RequestMetrics: The metrics of the application.
+    """
+    metrics = metrics or RequestMetrics()
+    app.extensions['request_metrics'] = metrics
+
+    @app.before_request
+    def start_request_timer() -> None:
+        """Remember when the request started."""
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response: Response) -> Response:
+        """Record the latency and status of the request."""
+        started = g.get('request_started')
+        if started is not None:
+            metrics.record(request.blueprint or "app", request.endpoint or "unknown", request.method,
+                           response.status_code, time.perf_counter() - started)
+        return response
+
+    @app.route("/metrics")
+    def prometheus_metrics() -> Response:
+        """Return the metrics in the Prometheus text format."""
+        return Response(metrics.prometheus_text(), mimetype="text/plain; version=0.0.4")
+
+    @app.route("/metrics/summary")
+    def metrics_summary() -> Response:
+        """Return the latency percentiles of every route as JSON."""
+        return jsonify({'routes': metrics.summary()})
+
+    return metrics
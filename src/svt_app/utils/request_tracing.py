@@ -0,0 +1,173 @@
+"""Sampled structured request tracing for the SVT application."""
+
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from flask import Flask, Response, g, jsonify, request, session
+
+
+@dataclass
+class RequestSpan:
+    """
+    Structured record of one request.
+
+    Attributes:
+        started_at (float): Wall-clock time the request started, as a UNIX timestamp.
+        method (str): HTTP method.
+        path (str): Request path.
+        endpoint (str): Flask endpoint name.
+        status (int): Response status code.
+        duration_ms (float): Latency in milliseconds.
+        response_bytes (Optional[int]): Response body size, None when streamed.
+        session_bytes (int): Size of the session cookie sent by the client.
+        reason (str): Why the span was kept: "sampled" or "slow".
+        session (Optional[Dict[str, Any]]): Session content, only when session dumps are enabled.
+    """
+    started_at: float
+    method: str
+    path: str
+    endpoint: str
+    status: int
+    duration_ms: float
+    response_bytes: Optional[int]
+    session_bytes: int
+    reason: str
+    session: Optional[Dict[str, Any]] = None
+
+
+class RequestTracer:
+    """
+    Keep a bounded ring buffer of request spans.
+
+    A request is kept when it is randomly sampled or slower than the slow
+    threshold. Static files are only kept when slow. The session content
+    is only copied into spans when explicitly enabled.
+    """
+
+    def __init__(self, sample_rate: float = 0.01, slow_threshold_ms: Optional[float] = 500.0,
+                 capacity: int = 256, include_session: bool = False) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            sample_rate: Probability of keeping any request, between 0 and 1.
+            slow_threshold_ms: Requests at least this slow are always kept; None disables it.
+            capacity: Number of spans kept in the ring buffer.
+            include_session: Whether spans carry a copy of the session.
+        """
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self.include_session = include_session
+        self._spans: Deque[RequestSpan] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> "RequestTracer":
+        """
+        Create a tracer configured from environment variables.
+
+        SVT_TRACE_SAMPLE_RATE (default 0.01), SVT_TRACE_SLOW_MS (default 500,
+        empty to disable), SVT_TRACE_BUFFER_SIZE (default 256) and
+        SVT_TRACE_SESSION (1/true/yes to include session dumps).
+
+        Returns:
+            RequestTracer: The configured tracer.
+        """
+        slow = os.environ.get('SVT_TRACE_SLOW_MS', '500')
+        return cls(
+            sample_rate=float(os.environ.get('SVT_TRACE_SAMPLE_RATE', '0.01')),
+            slow_threshold_ms=float(slow) if slow else None,
+            capacity=int(os.environ.get('SVT_TRACE_BUFFER_SIZE', '256')),
+            include_session=os.environ.get('SVT_TRACE_SESSION', '0').lower() in ('1', 'true', 'yes'),
+        )
+
+    def keep_reason(self, endpoint: str, duration_ms: float) -> Optional[str]:
+        """
+        Decide whether a request is traced.
+
+        Args:
+            endpoint: Flask endpoint name.
+            duration_ms: Latency in milliseconds.
+
+        Returns:
+            Optional[str]: "slow" or "sampled" if the request is kept, None otherwise.
+        """
+        if self.slow_threshold_ms is not None and duration_ms >= self.slow_threshold_ms:
+            return "slow"
+        if endpoint != "static" and self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+    def add(self, span: RequestSpan) -> None:
+        """Append a span, dropping the oldest one when the buffer is full."""
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self, limit: Optional[int] = None) -> List[RequestSpan]:
+        """Return the kept spans, newest first."""
+        with self._lock:
+            spans = list(reversed(self._spans))
+        return spans[:limit] if limit else spans
+
+
+def init_request_tracing(app: Flask, tracer: Optional[RequestTracer] = None) -> RequestTracer:
+    """
+    Trace the requests of an application and expose the ring buffer.
+
+    Registers GET /debug/traces, returning the kept spans as JSON (newest
+    first, optional limit parameter).
+
+    Args:
+        app: The Flask application.
+        tracer: The tracer to record into, configured from the environment by default.
+
+    Returns:
+        RequestTracer: The tracer of the application.
+    """
+    tracer = tracer or RequestTracer.from_environment()
+    app.extensions['request_tracer'] = tracer
+
+    @app.before_request
+    def start_request_trace() -> None:
+        """Remember when the request started, unless the metrics already did."""
+        if 'request_started' not in g:
+            g.request_started = time.perf_counter()
+        g.request_started_at = time.time()
+
+    @app.after_request
+    def record_request_trace(response: Response) -> Response:
+        """Keep a span of the request if it is sampled or slow."""
+        started = g.get('request_started')
+        if started is None:
+            return response
+        duration_ms = (time.perf_counter() - started) * 1000
+        endpoint = request.endpoint or "unknown"
+        reason = tracer.keep_reason(endpoint, duration_ms)
+        if reason is None:
+            return response
+        tracer.add(RequestSpan(
+            started_at=g.get('request_started_at', 0.0),
+            method=request.method,
+            path=request.path,
+            endpoint=endpoint,
+            status=response.status_code,
+            duration_ms=round(duration_ms, 3),
+            response_bytes=None if response.is_streamed else response.calculate_content_length(),
+            session_bytes=len(request.cookies.get(app.config.get('SESSION_COOKIE_NAME', 'session'), '')),
+            reason=reason,
+            session=dict(session) if tracer.include_session else None,
+        ))
+        return response
+
+    @app.route("/debug/traces")
+    def debug_traces() -> Response:
+        """Return the traced requests, newest first."""
+        limit = request.args.get('limit', None, type=int)
+        return jsonify({'spans': [asdict(span) for span in tracer.spans(limit)]})
+
+    return tracer
@@ -5,6 +5,10 @@ import sys
 # Add the src directory to the Python path
 sys.path.append(os.path.abspath('src'))
 
+# Compile the question bank into one file, mapped by the executable instead of unpacking every question
+from svt_app.services.question_pack import pack_questions
+pack_questions(os.path.join('assets', 'Data'), os.path.join('build', 'questions.pack'))
+
 block_cipher = None
 
 a = Analysis(
@@ -12,8 +16,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[
-        ('assets/Data/fill_the_blanks', 'assets/Data/fill_the_blanks'),
-        ('assets/Data/image_matching', 'assets/Data/image_matching'),
+        ('build/questions.pack', 'assets'),
         ('src/svt_app/templates', 'svt_app/templates'),
         ('src/svt_app/static', 'svt_app/static'),
     ],
@@ -24,7 +27,12 @@ a = Analysis(
         'werkzeug',
         'svt_app.controllers.game_controller',
         'svt_app.services.question_service',
-        'svt_app.models.question'
+        'svt_app.models.question',
+        # Imported on first use of an Anki route
+        'svt_app.services.anki_training_service',
+        'bs4',
+        'requests',
+        'dotenv'
     ],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,25 @@
+"""Shared fixtures of the test suite."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def question_cache_dir(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> "Path":
+    """Write the question bank snapshots of every test to its temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("SVT_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def anki_outbox_path(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> "Path":
+    """Keep the Anki outbox of every test in its temporary directory."""
+    outbox_path = tmp_path / "anki_outbox.sqlite3"
+    monkeypatch.setenv("ANKI_OUTBOX_PATH", str(outbox_path))
+    return outbox_path
@@ -0,0 +1,29 @@
+"""Test the JSON questions tree endpoint of the game controller."""
+
+from typing import TYPE_CHECKING
+
+from svt_app.app import create_app
+
+if TYPE_CHECKING:
+    from flask.testing import FlaskClient
+
+
+def test_questions_tree_json_honours_if_none_match() -> None:
+    """Test that a matching If-None-Match gets an empty 304 response.
+
+    Verifies:
+    1. The tree is served as JSON with a strong ETag
+    2. Sending the ETag back returns 304 without a body
+    """
+    client: "FlaskClient" = create_app().test_client()
+
+    response = client.get("/game/questions_tree.json?type=relier_images")
+    assert response.status_code == 200
+    assert response.get_json()["game_type"] == "relier_images"
+    etag = response.headers["ETag"]
+    assert not etag.startswith("W/")
+
+    cached = client.get("/game/questions_tree.json?type=relier_images", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert client.get("/game/questions_tree/cache_stats").get_json()["hits"] >= 1
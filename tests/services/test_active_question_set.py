@@ -0,0 +1,87 @@
+"""Tests for the sorted active question ID sets."""
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+from svt_app.services.active_question_set import ActiveQuestionSet
+from svt_app.services.question_service import QuestionService
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+def test_next_after_moves_forward_and_wraps() -> None:
+    """Test that the next ID is the following active one, looping back at the end."""
+    active = ActiveQuestionSet()
+    for question_id in (5, 1, 3):
+        active.add("", question_id)
+
+    assert active.ids("") == [1, 3, 5]
+    assert active.next_after("", 1) == 3
+    assert active.next_after("", 2) == 3
+    assert active.next_after("", 5) == 1
+    active.discard("", 1)
+    active.discard("", 3)
+    assert active.next_after("", 5) is None
+    assert active.next_after("", 4) == 5
+
+
+def test_folders_are_independent_and_bank_wide_keeps_duplicates() -> None:
+    """Test per-folder navigation and counting of IDs shared between folders."""
+    active = ActiveQuestionSet()
+    active.add("a", 1)
+    active.add("a", 2)
+    active.add("b", 1)
+    active.add("b", 1)
+
+    assert active.count("a") == 2
+    assert active.count("b") == 1
+    assert active.count() == 3
+    assert active.next_after("b", 1) is None
+    assert active.next_after(None, 1) == 2
+    active.discard("a", 1)
+    assert active.contains(None, 1)
+    assert not active.contains("a", 1)
+    assert active.first("missing") is None
+
+
+def test_written_answers_update_active_ids(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test that recording a written file keeps the active IDs in sync without a rescan."""
+    service = QuestionService()
+    monkeypatch.setattr(service, "fill_blanks_path", str(tmp_path))
+    for question_id in (1, 2):
+        with open(tmp_path / f"question{question_id:03d}.json", "w", encoding="utf-8") as f:
+            json.dump({"text": "t", "options": [], "correct_answer": "x"}, f)
+    service.load_questions()
+    assert service.fill_in_blank_index.active.ids("") == [1, 2]
+
+    data = {"text": "t", "options": [], "correct_answer": "x", "completed": True}
+    path = os.path.join(str(tmp_path), "question001.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    assert service.update_fill_in_blank_question(path, data)
+
+    assert service.fill_in_blank_index.active.ids("") == [2]
+    assert service.fill_in_blank_index.active.next_after(None, 2) is None
+    assert not service.refresh()
+
+
+def test_bank_wide_navigation_tells_folders_apart(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test that the next question is picked by (folder, id) when folders reuse an ID and one is completed."""
+    service = QuestionService()
+    monkeypatch.setattr(service, "fill_blanks_path", str(tmp_path))
+    for folder, question_id, completed in (("a", 1, True), ("b", 1, False), ("b", 2, False), ("c", 1, False)):
+        os.makedirs(tmp_path / folder, exist_ok=True)
+        with open(tmp_path / folder / f"question{question_id:03d}.json", "w", encoding="utf-8") as f:
+            json.dump({"text": "t", "options": [], "correct_answer": "x", "completed": completed}, f)
+    service.load_questions()
+    active = service.fill_in_blank_index.active
+
+    assert active.first_key() == ("b", 1)
+    assert active.next_key(None, "b", 1) == ("c", 1)
+    assert active.next_key(None, "c", 1) == ("b", 2)
+    assert active.next_key(None, "b", 2) == ("b", 1)
+    assert active.next_key("b", "b", 2) == ("b", 1)
+    assert active.next_key("a", "a", 1) is None
@@ -0,0 +1,67 @@
+"""Tests for the batching of AnkiConnect answers and actions."""
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from svt_app.services.anki_batching import AnswerCoalescer
+from svt_app.services.anki_service import AnkiService
+from svt_app.services.anki_training_service import AnkiTrainingService
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+def test_answers_within_window_are_sent_together() -> None:
+    """Test that concurrent answers share one call and each gets its own result."""
+    sent: List[List[Dict[str, Any]]] = []
+
+    def send(answers: List[Dict[str, Any]]) -> List[bool]:
+        sent.append(list(answers))
+        return [answer["cardId"] != 2 for answer in answers]
+
+    coalescer = AnswerCoalescer(send, window=0.5)
+    results: Dict[int, bool] = {}
+    threads = [threading.Thread(target=lambda card_id=card_id: results.update({card_id: coalescer.submit(card_id, 3)}))
+               for card_id in (1, 2, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(sent) == 1
+    assert sorted(answer["cardId"] for answer in sent[0]) == [1, 2, 3]
+    assert results == {1: True, 2: False, 3: True}
+
+
+def test_failed_batch_reports_every_answer_as_failed() -> None:
+    """Test that a failing call does not leave submitters waiting."""
+    def send(answers: List[Dict[str, Any]]) -> List[bool]:
+        raise RuntimeError("boom")
+
+    assert AnswerCoalescer(send, window=0).submit(1, 3) is False
+
+
+def test_pending_answers_travel_with_the_card_query(monkeypatch: "MonkeyPatch") -> None:
+    """Test that fetching the cards sends the waiting answers in the same multi action."""
+    service = AnkiService()
+    service.answers.window = 5
+    calls: List[str] = []
+
+    def post(action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(action)
+        if action == "multi":
+            assert [sub["action"] for sub in params["actions"]] == ["answerCards", "findCards"]
+            return {"result": [{"result": [True], "error": None}, {"result": [], "error": None}], "error": None}
+        return {"result": [], "error": None}
+
+    monkeypatch.setattr(service.client, "post", post)
+    results: List[bool] = []
+    answering = threading.Thread(target=lambda: results.append(service.submit_answer(42, 4)))
+    answering.start()
+    while service.answers._open is None:
+        pass
+    assert AnkiTrainingService(service).get_cards_for_review("Biologie") == []
+    answering.join()
+
+    assert calls == ["multi"]
+    assert results == [True]
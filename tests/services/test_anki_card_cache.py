@@ -0,0 +1,67 @@
+"""Tests for the per-deck Anki card cache."""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from svt_app.services.anki_service import AnkiService
+from svt_app.services.anki_training_service import AnkiTrainingService
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+def _training(monkeypatch: "MonkeyPatch", mods: Dict[int, int]) -> Tuple[AnkiTrainingService, List[Tuple[str, Any]]]:
+    """Create a training service talking to a fake AnkiConnect holding cards with the given mod times."""
+    service = AnkiService()
+    calls: List[Tuple[str, Any]] = []
+
+    def request(action: str, params: Dict[str, Any] = {}) -> Tuple[Dict[str, Any], None]:
+        calls.append((action, params.get("cards")))
+        if action == "findCards":
+            result: Any = list(mods)
+        elif action == "cardsModTime":
+            result = [{"cardId": card_id, "mod": mods[card_id]} for card_id in params["cards"]]
+        else:
+            result = [{"cardId": card_id, "mod": mods[card_id], "question": f"Q{card_id}.{mods[card_id]}",
+                       "answer": "A"} for card_id in params["cards"]]
+        return {"result": result, "error": None}, None
+
+    monkeypatch.setattr(service, "_make_request", request)
+    return AnkiTrainingService(service), calls
+
+
+def test_fresh_deck_is_served_from_memory(monkeypatch: "MonkeyPatch") -> None:
+    """Test that a deck is only fetched once while its entry is fresh."""
+    training, calls = _training(monkeypatch, {1: 10, 2: 20})
+    first = training.get_cards_for_review("Biologie")
+    assert [card["question"] for card in first] == ["Q1.10", "Q2.20"]
+    assert [action for action, _ in calls] == ["findCards", "cardsInfo"]
+
+    calls.clear()
+    assert training.get_cards_for_review("Biologie") == first
+    assert calls == []
+
+
+def test_refresh_only_fetches_changed_cards(monkeypatch: "MonkeyPatch") -> None:
+    """Test that an answer forces a refresh limited to the modified and new cards."""
+    mods = {1: 10, 2: 20}
+    training, calls = _training(monkeypatch, mods)
+    training.get_cards_for_review("Biologie")
+    training.cache.invalidate_card(2)
+    mods[2] = 21
+    mods[3] = 30
+
+    calls.clear()
+    cards = training.get_cards_for_review("Biologie")
+    assert [card["question"] for card in cards] == ["Q1.10", "Q2.21", "Q3.30"]
+    assert calls == [("findCards", None), ("cardsModTime", [1, 2, 3]), ("cardsInfo", [2, 3])]
+
+
+def test_expired_deck_is_refreshed(monkeypatch: "MonkeyPatch") -> None:
+    """Test that an entry older than the TTL is checked again."""
+    training, calls = _training(monkeypatch, {1: 10})
+    training.cache.ttl = 0
+    training.get_cards_for_review("Biologie")
+
+    calls.clear()
+    training.get_cards_for_review("Biologie")
+    assert [action for action, _ in calls] == ["findCards", "cardsModTime"]
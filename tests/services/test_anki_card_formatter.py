@@ -0,0 +1,38 @@
+"""Tests for the Anki card formatter."""
+
+from svt_app.services.anki_card_formatter import AnkiCardFormatter, FormattedContentCache
+
+STYLE = "<style>.card { color: black; }</style>"
+
+
+def test_cloze_and_style_markup_is_rewritten() -> None:
+    """Test that cloze deletions are highlighted and style blocks dropped."""
+    content = (f'{STYLE}<div class="card">La <span class="cloze" data-cloze="mitose">[...]</span> '
+               '<span class="cloze-inactive">méiose</span></div>')
+    assert AnkiCardFormatter.format_card_content(content) == \
+        '<div class="card">La <span class="cloze-highlight">mitose</span> méiose</div>'
+
+
+def test_plain_markup_takes_the_fast_path() -> None:
+    """Test that markup without cloze deletions only loses its style blocks."""
+    assert AnkiCardFormatter.format_card_content(f"{STYLE}<b>ADN</b><br>") == "<b>ADN</b><br>"
+
+
+def test_batch_formatting_keeps_card_order() -> None:
+    """Test that the batch formatter returns the fields of each card in order."""
+    cards = [{'question': f"<b>Q{i}</b>", 'answer': f"A{i}"} for i in range(5)]
+    assert AnkiCardFormatter.extract_cards_fields(cards) == [
+        {'question': f"<b>Q{i}</b>", 'answer': f"A{i}"} for i in range(5)
+    ]
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test that the content cache keeps the most recently used entries."""
+    cache = FormattedContentCache(maxsize=2)
+    first, second, third = (cache.key(content) for content in ("a", "b", "c"))
+    cache.put(first, "A")
+    cache.put(second, "B")
+    assert cache.get(first) == "A"
+    cache.put(third, "C")
+    assert cache.get(second) is None
+    assert cache.get(first) == "A"
@@ -0,0 +1,90 @@
+"""Tests for the circuit breaker guarding the Anki connection."""
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import requests
+
+from svt_app.services.anki_connection_state import CLOSED, HALF_OPEN, OPEN, AnkiConnectionState
+from svt_app.services.anki_service import AnkiService
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+def _service(monkeypatch: "MonkeyPatch", reset: str = "10") -> AnkiService:
+    """Create an AnkiService with a breaker opening after two failures."""
+    monkeypatch.setenv("ANKI_BREAKER_THRESHOLD", "2")
+    monkeypatch.setenv("ANKI_BREAKER_RESET", reset)
+    monkeypatch.setenv("ANKI_PROBE_INTERVAL", "60")
+    return AnkiService()
+
+
+def test_open_circuit_fails_fast(monkeypatch: "MonkeyPatch") -> None:
+    """Test that requests stop reaching Anki once the failure threshold is reached."""
+    service = _service(monkeypatch)
+    sent: List[str] = []
+
+    def post(action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        sent.append(action)
+        raise requests.exceptions.ConnectionError("refused")
+
+    monkeypatch.setattr(service.client, "post", post)
+    assert service._make_request("deckNames")[1]["error_type"] == "ConnectionError"
+    assert service._make_request("deckNames")[1]["error_type"] == "ConnectionError"
+    assert service.connection.state == OPEN
+
+    response, diagnosis = service._make_request("deckNames")
+    assert response is None
+    assert diagnosis["error_type"] == "AnkiUnavailable"
+    assert sent == ["deckNames", "deckNames"]
+    assert service.test_connection()[0] is False
+    assert sent == ["deckNames", "deckNames"]
+    service.connection.close()
+
+
+def test_half_open_trial_closes_the_circuit(monkeypatch: "MonkeyPatch") -> None:
+    """Test that a single trial request goes through after the reset timeout."""
+    service = _service(monkeypatch, reset="0")
+    monkeypatch.setattr(service.client, "post", lambda action, params: {"result": 6, "error": None})
+    service.connection.record_failure()
+    service.connection.record_failure()
+
+    assert service.connection.allow_request()
+    assert service.connection.state == HALF_OPEN
+    assert not service.connection.allow_request()
+    service.connection.record_success()
+    assert service.connection.state == CLOSED
+    assert service._make_request("version") == ({"result": 6, "error": None}, None)
+    service.connection.close()
+
+
+def test_prober_closes_the_circuit_when_anki_is_back() -> None:
+    """Test that the background prober closes the circuit without any request."""
+    answers = [False, True]
+    state = AnkiConnectionState(lambda: answers.pop(0) if answers else True, failure_threshold=1,
+                                reset_timeout=60, probe_interval=0.01)
+    state.record_failure()
+    assert state.status()["state"] == OPEN
+
+    deadline = time.monotonic() + 2
+    while state.state != CLOSED and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert state.state == CLOSED
+    assert state.cached_health() == (True, None)
+    state.close()
+
+
+def test_connection_test_is_cached(monkeypatch: "MonkeyPatch") -> None:
+    """Test that a recent connection test is reused instead of reaching Anki."""
+    service = AnkiService()
+    sent: List[str] = []
+
+    def post(action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        sent.append(action)
+        return {"result": 6, "error": None}
+
+    monkeypatch.setattr(service.client, "post", post)
+    assert service.test_connection() == (True, None)
+    assert service.test_connection() == (True, None)
+    assert sent == ["version"]
@@ -0,0 +1,90 @@
+"""Tests for the pooled AnkiConnect HTTP client."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import pytest
+import requests
+
+from svt_app.services.anki_http_client import AnkiHttpClient
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """AnkiConnect stub answering every action with its name, over keep-alive connections."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, do not let Nagle hold the body back
+    disable_nagle_algorithm = True
+    connections: List[int] = []
+
+    def setup(self) -> None:
+        """Count the TCP connections opened by the client."""
+        super().setup()
+        self.connections.append(1)
+
+    def do_POST(self) -> None:
+        """Answer an action."""
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps({"result": payload["action"], "error": None}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        """Keep the test output quiet."""
+
+
+def test_consecutive_actions_reuse_one_connection() -> None:
+    """Test that several actions are sent over a single keep-alive connection."""
+    _StubHandler.connections = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = AnkiHttpClient(f"http://127.0.0.1:{server.server_address[1]}")
+    try:
+        for action in ("version", "deckNames", "findCards", "answerCards"):
+            assert client.post(action, {}) == {"result": action, "error": None}
+        assert len(_StubHandler.connections) == 1
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+def _failing_post(calls: List[str], failures: int) -> Any:
+    """Return a session post replacement failing a given number of times."""
+    def post(url: str, json: Dict[str, Any], timeout: Any) -> Any:
+        calls.append(json["action"])
+        if len(calls) <= failures:
+            raise requests.exceptions.ConnectionError("refused")
+        response = requests.Response()
+        response._content = b'{"result": [], "error": null}'
+        return response
+    return post
+
+
+def test_idempotent_actions_are_retried(monkeypatch: "MonkeyPatch") -> None:
+    """Test that read actions are retried with backoff while answers are sent once."""
+    client = AnkiHttpClient("http://anki.invalid", max_retries=2, backoff=0)
+    calls: List[str] = []
+    monkeypatch.setattr(client.session, "post", _failing_post(calls, 2))
+    assert client.post("findCards", {"query": "deck:x"}) == {"result": [], "error": None}
+    assert calls == ["findCards"] * 3
+
+    calls.clear()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.post("answerCards", {"answers": []})
+    assert calls == ["answerCards"]
+
+
+def test_action_timeouts() -> None:
+    """Test that slow actions get their own timeout and others the default one."""
+    client = AnkiHttpClient("http://anki.invalid", timeout=3, action_timeouts={"cardsInfo": 20})
+    assert client.timeout_for("cardsInfo") == 20
+    assert client.timeout_for("answerCards") == 3
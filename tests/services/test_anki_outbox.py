@@ -0,0 +1,111 @@
+"""Tests for the durable outbox of Anki answers."""
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import pytest
+import requests
+
+from svt_app.services.anki_outbox import AnkiOutbox
+from svt_app.services.anki_service import AnkiService
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+class AnkiStandIn:
+    """In-process stand-in for AnkiConnect recording answers and their review log."""
+
+    def __init__(self) -> None:
+        """Start with Anki running and replying."""
+        self.online = True
+        self.drop_replies = False
+        self.calls: List[str] = []
+        self.reviews: Dict[int, List[Dict[str, Any]]] = {}
+
+    def post(self, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle one action like AnkiConnect would."""
+        self.calls.append(action)
+        if not self.online:
+            raise requests.exceptions.ConnectionError("Anki is not running")
+        if action == "answerCards":
+            for answer in params["answers"]:
+                self.reviews.setdefault(answer["cardId"], []).append({"id": int(time.time() * 1000) + 1})
+            if self.drop_replies:
+                raise requests.exceptions.ReadTimeout("reply lost")
+            return {"result": [True] * len(params["answers"]), "error": None}
+        if action == "getReviewsOfCards":
+            return {"result": {str(card): self.reviews.get(card, []) for card in params["cards"]}, "error": None}
+        return {"result": None, "error": f"unsupported action {action}"}
+
+
+@pytest.fixture
+def anki() -> AnkiStandIn:
+    """Return the AnkiConnect stand-in."""
+    return AnkiStandIn()
+
+
+def _outbox(tmp_path: "Path", monkeypatch: "MonkeyPatch", anki: AnkiStandIn) -> AnkiOutbox:
+    """Create an outbox sending through the stand-in, without its background worker."""
+    service = AnkiService()
+    monkeypatch.setattr(service.client, "post", anki.post)
+    outbox = AnkiOutbox(service, str(tmp_path / "outbox.sqlite3"), base_backoff=10)
+    monkeypatch.setattr(outbox, "_ensure_worker", lambda: None)
+    return outbox
+
+
+def test_answers_wait_while_anki_is_down(tmp_path: "Path", monkeypatch: "MonkeyPatch", anki: AnkiStandIn) -> None:
+    """Test that answers are kept with backoff until Anki is back, and resubmissions are recorded once."""
+    outbox = _outbox(tmp_path, monkeypatch, anki)
+    anki.online = False
+    outbox.enqueue(1, 3, "key-1")
+    outbox.enqueue(1, 3, "key-1")
+    outbox.enqueue(2, 1)
+    assert outbox.depth() == 2
+    assert outbox.pending_card_ids() == {1, 2}
+
+    assert outbox.sync_once() == 0
+    status = outbox.status()
+    assert status["depth"] == 2
+    assert status["consecutive_failures"] == 1
+    assert status["next_attempt_in"] > 5
+
+    anki.online = True
+    anki.calls.clear()
+    assert outbox.sync_once() == 2
+    assert anki.calls == ["getReviewsOfCards", "answerCards"]
+    assert outbox.status()["depth"] == 0
+    assert outbox.status()["last_sync_at"] is not None
+
+
+def test_lost_reply_is_not_sent_twice(tmp_path: "Path", monkeypatch: "MonkeyPatch", anki: AnkiStandIn) -> None:
+    """Test that an answer Anki recorded without replying is found in the review log."""
+    outbox = _outbox(tmp_path, monkeypatch, anki)
+    outbox.enqueue(7, 4)
+    anki.drop_replies = True
+    assert outbox.sync_once() == 0
+    assert outbox.depth() == 1
+
+    anki.drop_replies = False
+    anki.calls.clear()
+    assert outbox.sync_once() == 1
+    assert anki.calls == ["getReviewsOfCards"]
+    assert len(anki.reviews[7]) == 1
+
+
+def test_answers_left_by_a_previous_run_are_sent_at_startup(tmp_path: "Path", monkeypatch: "MonkeyPatch",
+                                                            anki: AnkiStandIn) -> None:
+    """Test that reopening an outbox with pending answers delivers them before the first poll."""
+    _outbox(tmp_path, monkeypatch, anki).enqueue(3, 3)
+    service = AnkiService()
+    monkeypatch.setattr(service.client, "post", anki.post)
+    outbox = AnkiOutbox(service, str(tmp_path / "outbox.sqlite3"), poll_interval=5)
+    try:
+        deadline = time.monotonic() + 2
+        while outbox.depth() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert outbox.depth() == 0
+        assert len(anki.reviews[3]) == 1
+    finally:
+        outbox.close()
@@ -0,0 +1,82 @@
+"""Tests for the paginated delivery of Anki review cards."""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+import pytest
+
+from svt_app.services.anki_service import AnkiService
+from svt_app.services.anki_training_service import AnkiTrainingService
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+# Card ID: (queue, due)
+DECK: Dict[int, Tuple[int, int]] = {
+    1: (0, 3),           # new, third in the new queue
+    2: (2, 400),         # review, due on day 400
+    3: (1, 1700000000),  # learning, due at a timestamp
+    4: (0, 1),           # new, first in the new queue
+    5: (2, 380),         # review, due on day 380
+}
+
+
+def _training(monkeypatch: "MonkeyPatch") -> Tuple[AnkiTrainingService, List[str]]:
+    """Create a training service talking to a fake AnkiConnect, recording the formatted contents."""
+    service = AnkiService()
+
+    def request(action: str, params: Dict[str, Any] = {}) -> Tuple[Dict[str, Any], None]:
+        if action == "findCards":
+            result: Any = list(DECK)
+        else:
+            result = [{"cardId": card_id, "mod": 1, "queue": DECK[card_id][0], "due": DECK[card_id][1],
+                       "question": f"Q{card_id}", "answer": f"A{card_id}"} for card_id in params["cards"]]
+        return {"result": result, "error": None}, None
+
+    monkeypatch.setattr(service, "_make_request", request)
+    training = AnkiTrainingService(service)
+    formatted: List[str] = []
+    original = training.formatter.extract_cards_fields
+
+    def extract(cards: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        formatted.extend(card["question"] for card in cards)
+        return original(cards)
+
+    monkeypatch.setattr(training.formatter, "extract_cards_fields", extract)
+    return training, formatted
+
+
+def test_pages_follow_review_order(monkeypatch: "MonkeyPatch") -> None:
+    """Test that pages list learning, review then new cards, each by due value."""
+    training, formatted = _training(monkeypatch)
+    first = training.get_review_page("Biologie", limit=2)
+    assert [card["cardId"] for card in first["cards"]] == [3, 5]
+    assert first["total"] == 5
+    assert formatted == ["Q3", "Q5"]
+
+    second = training.get_review_page("Biologie", first["next_cursor"], limit=2)
+    third = training.get_review_page("Biologie", second["next_cursor"], limit=2)
+    assert [card["cardId"] for card in second["cards"] + third["cards"]] == [2, 4, 1]
+    assert third["next_cursor"] is None
+    assert [card["cardId"] for card in training.get_cards_for_review("Biologie")] == [3, 5, 2, 4, 1]
+    assert sorted(formatted) == ["Q1", "Q2", "Q3", "Q4", "Q5"]
+
+
+def test_invalid_cursor_is_rejected(monkeypatch: "MonkeyPatch") -> None:
+    """Test that a cursor not produced by a previous page raises ValueError."""
+    training, _ = _training(monkeypatch)
+    with pytest.raises(ValueError):
+        training.get_review_page("Biologie", "not-a-cursor")
+
+
+def test_answered_cards_are_skipped_and_not_counted(monkeypatch: "MonkeyPatch") -> None:
+    """Test that cards waiting in the outbox leave the pages, the total and the last cursor."""
+    training, _ = _training(monkeypatch)
+    monkeypatch.setattr(training, "_answered_card_ids", lambda: {4, 1, 99})
+    first = training.get_review_page("Biologie", limit=2)
+    assert [card["cardId"] for card in first["cards"]] == [3, 5]
+    assert first["total"] == 3
+
+    # Only answered cards follow the second page, so it is the last one
+    second = training.get_review_page("Biologie", first["next_cursor"], limit=1)
+    assert [card["cardId"] for card in second["cards"]] == [2]
+    assert second["next_cursor"] is None
@@ -0,0 +1,68 @@
+"""Tests of the Anki training flow against the local AnkiConnect simulator."""
+
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+
+from svt_app.services.anki_outbox import AnkiOutbox
+from svt_app.services.anki_service import AnkiService
+from svt_app.services.anki_simulator import AnkiSimulator
+from svt_app.services.anki_training_service import AnkiTrainingService
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+@pytest.fixture
+def simulator() -> Iterator[AnkiSimulator]:
+    """Serve a simulated collection with two decks."""
+    with AnkiSimulator({"Biologie": 5, "Chimie": 3}) as running:
+        yield running
+
+
+@pytest.fixture
+def anki(simulator: AnkiSimulator, monkeypatch: "MonkeyPatch") -> AnkiService:
+    """Return an AnkiService configured to talk to the simulator."""
+    host, _, port = simulator.endpoint.rpartition(":")
+    monkeypatch.setenv("ANKI_HOST", host.replace("http://", ""))
+    monkeypatch.setenv("ANKI_PORT", port)
+    monkeypatch.setenv("ANKI_MAX_RETRIES", "0")
+    return AnkiService()
+
+
+def test_answered_card_leaves_the_review_list(anki: AnkiService, simulator: AnkiSimulator,
+                                              tmp_path: "Path") -> None:
+    """Test a training round trip: list the cards, answer one, deliver it and list again."""
+    outbox = AnkiOutbox(anki, str(tmp_path / "outbox.sqlite3"))
+    training = AnkiTrainingService(anki, outbox)
+    assert anki.test_connection() == (True, None)
+
+    page = training.get_review_page("Biologie", limit=2)
+    assert len(page["cards"]) == 2
+    assert page["total"] == 5
+    answered = page["cards"][0]["cardId"]
+
+    training.answer_card(answered, 3)
+    assert answered not in [card["cardId"] for card in training.get_cards_for_review("Biologie")]
+    # Stop the background worker and deliver whatever it has not sent yet
+    outbox.close()
+    outbox.sync_once()
+    assert outbox.depth() == 0
+    assert simulator.cards[answered].queue == 2
+
+    cards = training.get_cards_for_review("Biologie")
+    assert len(cards) == 4
+    assert answered not in [card["cardId"] for card in cards]
+
+
+def test_unreachable_anki_is_diagnosed(anki: AnkiService, simulator: AnkiSimulator) -> None:
+    """Test that dropped connections and injected errors surface as failures."""
+    simulator.down = True
+    connected, diagnosis = anki.test_connection()
+    assert not connected
+    assert diagnosis["error_type"] == "ConnectionError"
+
+    simulator.down = False
+    simulator.failure_rate = 1.0
+    assert anki.test_connection()[0] is False
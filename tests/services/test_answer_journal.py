@@ -0,0 +1,132 @@
+"""Tests for the append-only answer journal."""
+
+import json
+import os
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+from svt_app.services import answer_journal
+from svt_app.services.answer_journal import AnswerJournal
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+def _write_question(directory: "Path", name: str) -> str:
+    """
+    Write a question file without statistics.
+
+    Args:
+        directory: The folder to write into.
+        name: The file name.
+
+    Returns:
+        str: The path of the file.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(json.dumps({"text": "t", "options": ["a"], "correct_answer": "a"}), encoding="utf-8")
+    return str(path)
+
+
+def _journal(tmp_path: "Path") -> AnswerJournal:
+    """Create a journal without background worker."""
+    return AnswerJournal(str(tmp_path / "journal.jsonl"), str(tmp_path / "questions"),
+                         str(tmp_path / "scores.json"), interval=0)
+
+
+def test_answers_are_merged_until_compacted(tmp_path: "Path") -> None:
+    """Test that appends leave the file untouched while reads see the pending answers."""
+    path = _write_question(tmp_path / "questions" / "sub", "question001.json")
+    journal = _journal(tmp_path)
+
+    journal.record_answer(path, True, completed=True)
+    journal.record_answer(path, False)
+    journal.record_score("texte_a_trous", delta=1)
+
+    with open(path, encoding="utf-8") as f:
+        assert "statistics" not in json.load(f)
+    merged = journal.read_question(path)
+    assert merged["statistics"] == {"correct_answers": 1, "wrong_answers": 1}
+    assert merged["completed"] is True
+    assert journal.read_scores({"texte_a_trous": 0})["texte_a_trous"] == 1
+
+    assert journal.compact() == 2
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["statistics"] == {"correct_answers": 1, "wrong_answers": 1}
+    assert journal.read_question(path)["statistics"] == {"correct_answers": 1, "wrong_answers": 1}
+    assert journal.pending() == (0, 0)
+    assert not os.path.exists(tmp_path / "journal.jsonl")
+
+
+def test_score_reset_overrides_stored_score(tmp_path: "Path") -> None:
+    """Test that a set followed by increments replaces the stored score."""
+    (tmp_path / "scores.json").write_text(json.dumps({"texte_a_trous": 7}), encoding="utf-8")
+    journal = _journal(tmp_path)
+
+    journal.record_score("texte_a_trous", value=0)
+    journal.record_score("texte_a_trous", delta=2)
+    journal.compact()
+
+    with open(tmp_path / "scores.json", encoding="utf-8") as f:
+        assert json.load(f) == {"texte_a_trous": 2}
+
+
+def test_leftover_journal_is_replayed_once(tmp_path: "Path") -> None:
+    """Test crash recovery, including a compaction interrupted after one file."""
+    first = _write_question(tmp_path / "questions", "question001.json")
+    second = _write_question(tmp_path / "questions", "question002.json")
+    records = [{"type": "answer", "path": "question001.json", "correct": True},
+               {"type": "answer", "path": "question002.json", "correct": False}]
+    # An interrupted compaction had already folded question001.json
+    with open(first, "w", encoding="utf-8") as f:
+        json.dump({"text": "t", "statistics": {"correct_answers": 1, "wrong_answers": 0}}, f)
+    (tmp_path / "journal.jsonl.compacting").write_text(
+        "".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    (tmp_path / "journal.jsonl.compacting.done").write_text("question001.json\n", encoding="utf-8")
+    # A torn line at the end of the live journal is ignored
+    (tmp_path / "journal.jsonl").write_text(json.dumps(records[1]) + "\n{\"type\": \"ans", encoding="utf-8")
+
+    _journal(tmp_path)
+
+    with open(first, encoding="utf-8") as f:
+        assert json.load(f)["statistics"] == {"correct_answers": 1, "wrong_answers": 0}
+    with open(second, encoding="utf-8") as f:
+        assert json.load(f)["statistics"] == {"correct_answers": 0, "wrong_answers": 2}
+    assert sorted(os.listdir(tmp_path)) == ["questions"]
+
+
+def test_interrupted_fold_is_neither_lost_nor_repeated(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test a fold failing between two replacements, then finished by the next compaction."""
+    first = _write_question(tmp_path / "questions", "question001.json")
+    second = _write_question(tmp_path / "questions", "question002.json")
+    journal = _journal(tmp_path)
+    journal.record_answer(first, True)
+    journal.record_answer(second, True)
+    journal.record_score("texte_a_trous", delta=1)
+
+    original = answer_journal._write_bytes_atomic
+    calls: List[str] = []
+
+    def crash_on_second_file(path: str, content: bytes) -> None:
+        calls.append(path)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        original(path, content)
+
+    monkeypatch.setattr(answer_journal, "_write_bytes_atomic", crash_on_second_file)
+    with pytest.raises(OSError):
+        journal.compact()
+    # The first file was replaced, the second one only announced in the done file
+    assert journal.read_question(first)["statistics"] == {"correct_answers": 1, "wrong_answers": 0}
+    assert "statistics" not in journal.read_question(second)
+    assert journal.pending() == (0, 0)
+
+    monkeypatch.setattr(answer_journal, "_write_bytes_atomic", original)
+    assert journal.compact() == 2
+    assert journal.read_question(first)["statistics"] == {"correct_answers": 1, "wrong_answers": 0}
+    assert journal.read_question(second)["statistics"] == {"correct_answers": 1, "wrong_answers": 0}
+    assert journal.read_scores({})["texte_a_trous"] == 1
+    assert sorted(os.listdir(tmp_path)) == ["questions", "scores.json"]
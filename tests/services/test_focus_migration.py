@@ -0,0 +1,53 @@
+"""Tests for the logical folder focus and the migration of old backup layouts."""
+
+from typing import TYPE_CHECKING
+import pytest
+
+from svt_app.services.focus_migration import migrate_focus
+from svt_app.state import FocusState
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+@pytest.fixture
+def focus_file(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> "Path":
+    """Point FocusState at a temporary file with an empty cache."""
+    path = tmp_path / "focus.json"
+    monkeypatch.setattr(FocusState, "FOCUS_FILE", str(path))
+    monkeypatch.setattr(FocusState, "_focus", None)
+    monkeypatch.setattr(FocusState, "_loaded", False)
+    return path
+
+
+def test_focus_is_persisted_and_follows_moves(focus_file: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test that the focus survives a reload and tracks renamed or deleted parents."""
+    FocusState.set_focus("a\\b")
+    monkeypatch.setattr(FocusState, "_loaded", False)
+    assert FocusState.get_focus() == "a/b"
+
+    FocusState.follow_move("a", "c")
+    assert FocusState.get_focus() == "c/b"
+    FocusState.follow_move("c/bb", None)
+    assert FocusState.get_focus() == "c/b"
+    FocusState.follow_move("c/b", None)
+    assert FocusState.get_focus() is None
+
+
+def test_migration_restores_siblings_and_keeps_focus(tmp_path: "Path", focus_file: "Path") -> None:
+    """Test that folders hidden by the old focus come back and the focus becomes logical."""
+    base = tmp_path / "fill_the_blanks"
+    (base / "parent" / "kept").mkdir(parents=True)
+    backup = base / "parent" / ".focused_backup_kept"
+    (backup / "hidden" / "nested").mkdir(parents=True)
+    (backup / "hidden" / "question001.json").write_text("{}", encoding="utf-8")
+    (backup / "kept").mkdir()
+
+    assert migrate_focus(str(base)) == "parent/kept"
+
+    assert (base / "parent" / "hidden" / "question001.json").exists()
+    assert (base / "parent" / "hidden" / "nested").is_dir()
+    # A name clash leaves the folder in the backup rather than overwriting
+    assert (backup / "kept").is_dir()
+    assert migrate_focus(str(base)) == "parent/kept"
@@ -0,0 +1,141 @@
+"""Tests for the incrementally refreshed question bank."""
+
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+from svt_app.services.question_bank import QuestionBank
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+def _write(path: "Path", text: str) -> None:
+    """
+    Write a minimal question file.
+
+    Args:
+        path: Destination file.
+        text: Question text.
+    """
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"text": text}, f)
+
+
+def _build(question_id: int, data: Dict[str, Any]) -> str:
+    """
+    Build a question model as plain text.
+
+    Args:
+        question_id: The question ID.
+        data: The JSON data.
+
+    Returns:
+        str: The question text.
+    """
+    return data["text"]
+
+
+def test_refresh_only_parses_changes(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """
+    Test that a refresh re-parses only added or modified files.
+
+    Args:
+        tmp_path: Temporary directory holding the bank.
+        monkeypatch: Fixture used to count parsed files.
+    """
+    _write(tmp_path / "a" / "question001.json", "a1")
+    _write(tmp_path / "b" / "question001.json", "b1")
+    bank: QuestionBank = QuestionBank(_build)
+    bank.reload(str(tmp_path))
+    assert bank.questions() == ["a1", "b1"]
+    generation = bank.generation
+
+    parsed = []
+    original = bank._parse_many
+    monkeypatch.setattr(bank, "_parse_many", lambda rel_paths: parsed.extend(rel_paths) or original(rel_paths))
+
+    assert bank.refresh(str(tmp_path)) is False
+    assert bank.generation == generation and parsed == []
+
+    _write(tmp_path / "b" / "question002.json", "b2")
+    os.remove(tmp_path / "a" / "question001.json")
+    assert bank.refresh(str(tmp_path)) is True
+    assert parsed == ["b/question002.json"]
+    assert bank.questions() == ["b1", "b2"]
+    assert bank.generation == generation + 1
+
+
+def test_removed_duplicate_uncovers_shadowed_file(tmp_path: "Path") -> None:
+    """
+    Test that deleting the winning file of a duplicated ID exposes the other one.
+
+    Args:
+        tmp_path: Temporary directory holding the bank.
+    """
+    _write(tmp_path / "question001.json", "long")
+    _write(tmp_path / "question01.json", "short")
+    bank: QuestionBank = QuestionBank(_build)
+    bank.reload(str(tmp_path))
+    assert bank.questions() == ["long"]
+
+    os.remove(tmp_path / "question001.json")
+    bank.refresh(str(tmp_path))
+    assert bank.questions() == ["short"]
+
+
+def test_concurrent_refreshes_and_reads(tmp_path: "Path") -> None:
+    """
+    Test that readers never see a half-applied refresh while files come and go.
+
+    Args:
+        tmp_path: Temporary directory holding the bank.
+    """
+    for question_id in range(1, 41):
+        _write(tmp_path / f"f{question_id % 4}" / f"question{question_id:03d}.json", str(question_id))
+    bank: QuestionBank[str] = QuestionBank(_build)
+    bank.reload(str(tmp_path))
+    errors: List[BaseException] = []
+    deadline = time.monotonic() + 1.0
+
+    def churn() -> None:
+        """Add and delete files under the refreshing threads."""
+        question_id = 9000
+        while time.monotonic() < deadline:
+            path = tmp_path / f"f{question_id % 4}" / f"question{question_id}.json"
+            _write(path, str(question_id))
+            os.remove(path)
+            question_id += 1
+
+    def run(step: Callable[[], object]) -> None:
+        """Repeat a bank operation until the deadline, keeping its errors."""
+        try:
+            while time.monotonic() < deadline:
+                step()
+        except BaseException as e:
+            errors.append(e)
+
+    def read() -> None:
+        """Walk every view of the bank."""
+        for entry in bank.index:
+            bank.index.lookup_id(entry.question_id)
+        for folder in bank.index.folders():
+            bank.index.in_folder(folder)
+            bank.index.active.next_key(None, folder, 9000)
+        bank.questions()
+
+    threads = [threading.Thread(target=churn)]
+    threads += [threading.Thread(target=run, args=(lambda: bank.refresh(str(tmp_path)),)) for _ in range(3)]
+    threads += [threading.Thread(target=run, args=(read,)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    bank.refresh(str(tmp_path))
+    assert len(bank.index) == 40
@@ -0,0 +1,87 @@
+"""Tests for the composite-key question index."""
+
+import json
+import os
+from typing import TYPE_CHECKING
+import pytest
+
+from svt_app.models.question import FillInTheBlankQuestion
+from svt_app.services.question_index import IndexedQuestion, QuestionIndex, parse_question_id
+from svt_app.services.question_service import QuestionService
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+def _entry(folder: str, question_id: int) -> IndexedQuestion:
+    """
+    Build an index entry for tests.
+
+    Args:
+        folder: The folder of the question.
+        question_id: The question ID.
+
+    Returns:
+        IndexedQuestion: The entry.
+    """
+    name = f"question{question_id:03d}.json"
+    question = FillInTheBlankQuestion(id=question_id, text=f"{folder} {question_id}", options=[], correct_answer="")
+    return IndexedQuestion(folder=folder, question_id=question_id,
+                           rel_path=f"{folder}/{name}" if folder else name, question=question, data={})
+
+
+def test_parse_question_id_formats() -> None:
+    """Test that every historical file name format is recognised."""
+    assert parse_question_id("question01.json") == 1
+    assert parse_question_id("question001.json") == 1
+    assert parse_question_id("question1.json") == 1
+    assert parse_question_id("notes.json") is None
+
+
+def test_same_id_in_different_folders_is_kept() -> None:
+    """Test that the (folder, id) key keeps identically numbered questions apart."""
+    index: QuestionIndex = QuestionIndex()
+    assert index.add(_entry("b", 1))
+    assert index.add(_entry("a", 1))
+    assert not index.add(_entry("a", 1))
+
+    assert len(index) == 2
+    assert index.get("a", 1).question.text == "a 1"
+    assert index.find(1).folder == "a"
+    assert index.get_by_path("b\\question001.json").folder == "b"
+
+
+def test_ordering_and_removal() -> None:
+    """Test ordered iteration, folder listing and removal."""
+    index: QuestionIndex = QuestionIndex()
+    for folder, question_id in [("x", 3), ("x", 1), ("y", 2)]:
+        index.add(_entry(folder, question_id))
+
+    assert [entry.key for entry in index] == [("x", 1), ("y", 2), ("x", 3)]
+    assert [entry.question_id for entry in index.in_folder("x")] == [1, 3]
+
+    index.remove_path("x/question001.json")
+    assert index.get("x", 1) is None
+    assert [entry.key for entry in index] == [("y", 2), ("x", 3)]
+
+
+def test_service_loads_every_folder(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """
+    Test that the service no longer drops question001.json in later folders.
+
+    Args:
+        tmp_path: Temporary directory holding the question bank.
+        monkeypatch: Fixture used to point the service at the temporary bank.
+    """
+    for folder in ("alpha", "beta"):
+        os.makedirs(tmp_path / folder)
+        with open(tmp_path / folder / "question001.json", "w", encoding="utf-8") as f:
+            json.dump({"text": folder, "options": [], "correct_answer": ""}, f)
+
+    service = QuestionService()
+    monkeypatch.setattr(service, "fill_blanks_path", str(tmp_path))
+    service.load_questions()
+
+    assert [q.text for q in service.get_fill_in_blank_questions()] == ["alpha", "beta"]
+    assert service.get_fill_in_blank_question_by_id(1, "beta").text == "beta"
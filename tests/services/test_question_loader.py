@@ -0,0 +1,46 @@
+"""Tests for the parallel reading of question files."""
+
+import json
+import os
+from typing import TYPE_CHECKING, List
+
+from svt_app.services import question_loader
+from svt_app.services.question_loader import load_question_files
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+def _write_bank(base_dir: "Path", size: int) -> List[str]:
+    """Write size question files over a few folders and return their sorted relative paths."""
+    rel_paths = []
+    for index in range(size):
+        rel_path = f"chapitre_{index % 7}/question{index + 1:04d}.json"
+        os.makedirs(base_dir / os.path.dirname(rel_path), exist_ok=True)
+        with open(base_dir / rel_path, "w", encoding="utf-8") as f:
+            json.dump({"text": f"Question {index} é", "completed": index % 3 == 0}, f, ensure_ascii=False)
+        rel_paths.append(rel_path)
+    return sorted(rel_paths)
+
+
+def test_parallel_load_matches_serial_load(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test that the thread pool returns the same content, in the same order, with errors aggregated."""
+    monkeypatch.setattr(question_loader, "CHUNK_SIZE", 16)
+    rel_paths = _write_bank(tmp_path, 300)
+    (tmp_path / "chapitre_0" / "question0001.json").write_text("{not json", encoding="utf-8")
+    (tmp_path / "chapitre_1" / "question0002.json").unlink()
+
+    serial = load_question_files(str(tmp_path), rel_paths, workers=1)
+    parallel = load_question_files(str(tmp_path), rel_paths, workers=4)
+
+    assert list(parallel.data.items()) == list(serial.data.items())
+    assert list(parallel.data) == [path for path in rel_paths if path not in parallel.errors]
+    assert sorted(parallel.errors) == ["chapitre_0/question0001.json", "chapitre_1/question0002.json"]
+    assert parallel.data["chapitre_2/question0003.json"] == {"text": "Question 2 é", "completed": False}
+
+
+def test_fallback_decoder_accepts_the_same_files() -> None:
+    """Test that files the fast decoder rejects are decoded by the standard one."""
+    decoded = question_loader.decode_json(b'{"big": 123456789012345678901234567890, "value": NaN}')
+    assert decoded["big"] == 123456789012345678901234567890
@@ -0,0 +1,71 @@
+"""Tests for the read-only packed question bank and its writable overlay."""
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict
+
+from svt_app.services.question_bank import QuestionBank
+from svt_app.services.question_pack import PackedQuestion, QuestionPack, pack_questions
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(path: "Path", data: Dict[str, Any]) -> None:
+    """Write a question file."""
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _build(question_id: int, data: Dict[str, Any]) -> str:
+    """Build a question model as plain text."""
+    return data["text"]
+
+
+def _pack(tmp_path: "Path") -> QuestionPack:
+    """Pack a small bank and map it."""
+    source = tmp_path / "source" / "fill_the_blanks"
+    _write(source / "a" / "question001.json", {"text": "a1"})
+    _write(source / "a" / "question002.json", {"text": "a2", "completed": True})
+    _write(source / "b" / "question001.json", {"text": "b1 é"})
+    counts = pack_questions(str(tmp_path / "source"), str(tmp_path / "questions.pack"))
+    assert counts == {"fill_the_blanks": 3, "image_matching": 0}
+    return QuestionPack(str(tmp_path / "questions.pack"))
+
+
+def test_packed_questions_are_decoded_on_use(tmp_path: "Path") -> None:
+    """Test that indexing a pack decodes no record until a question is read."""
+    pack = _pack(tmp_path)
+    entries = pack.questions("fill_the_blanks", _build)
+    bank: QuestionBank[str] = QuestionBank(_build, base=entries)
+    bank.reload(str(tmp_path / "overlay"))
+
+    assert all(isinstance(entry, PackedQuestion) and entry._data is None for entry in entries)
+    assert bank.index.active.ids("a") == [1]
+    assert bank.questions() == ["a1", "b1 é", "a2"]
+    pack.close()
+
+
+def test_overlay_files_shadow_the_pack(tmp_path: "Path") -> None:
+    """Test that a writable copy replaces its packed question until it is deleted."""
+    pack = _pack(tmp_path)
+    overlay = tmp_path / "overlay"
+    bank: QuestionBank[str] = QuestionBank(_build, base=pack.questions("fill_the_blanks", _build))
+    _write(overlay / "a" / "question001.json", {"text": "a1 modifiée"})
+    _write(overlay / "c" / "question003.json", {"text": "c3"})
+    bank.reload(str(overlay))
+    assert bank.questions() == ["a1 modifiée", "b1 é", "a2", "c3"]
+
+    assert bank.materialize("b/question001.json")
+    assert not bank.materialize("b/question001.json")
+    with open(overlay / "b" / "question001.json", encoding="utf-8") as f:
+        assert json.load(f) == {"text": "b1 é"}
+    assert not bank.is_base(bank.index.get("b", 1))
+    assert not bank.refresh(str(overlay))
+
+    os.remove(overlay / "a" / "question001.json")
+    assert bank.refresh(str(overlay))
+    assert bank.questions() == ["a1", "b1 é", "a2", "c3"]
+    assert bank.is_base(bank.index.get("a", 1))
+    pack.close()
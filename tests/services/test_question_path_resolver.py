@@ -0,0 +1,121 @@
+"""Tests for the question path resolver."""
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+from svt_app.services.question_path_resolver import QuestionPathResolver
+from svt_app.services.question_service import QuestionService
+from svt_app.services.texte_a_trous_service import TexteATrousService
+from svt_app.state import FocusState
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+def _write(path: "Path") -> None:
+    """
+    Write a minimal question file.
+
+    Args:
+        path: Destination file.
+    """
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"text": path.name}, f)
+
+
+def _resolver(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> QuestionPathResolver:
+    """
+    Build a resolver over a temporary bank.
+
+    Args:
+        tmp_path: Root of the temporary bank.
+        monkeypatch: Fixture used to point the service at the bank.
+
+    Returns:
+        QuestionPathResolver: The resolver.
+    """
+    service = QuestionService()
+    monkeypatch.setattr(service, "fill_blanks_path", str(tmp_path))
+    service.load_questions()
+    return QuestionPathResolver(service)
+
+
+def test_resolves_every_file_name_format(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """
+    Test lookups with and without focus across filename formats.
+
+    Args:
+        tmp_path: Root of the temporary bank.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    _write(tmp_path / "a" / "question01.json")
+    _write(tmp_path / "b" / "question1.json")
+    _write(tmp_path / "b" / "question002.json")
+    resolver = _resolver(tmp_path, monkeypatch)
+
+    assert resolver.resolve("", 1) == os.path.join(str(tmp_path), "a", "question01.json")
+    assert resolver.resolve("b", 1) == os.path.join(str(tmp_path), "b", "question1.json")
+    assert resolver.resolve("a", 2) is None
+
+
+def test_miss_triggers_single_targeted_rescan(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """
+    Test that a file created after loading is found with one folder rescan.
+
+    Args:
+        tmp_path: Root of the temporary bank.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    _write(tmp_path / "a" / "question001.json")
+    resolver = _resolver(tmp_path, monkeypatch)
+    calls = []
+    original = resolver.question_service.refresh_fill_in_blank_folder
+    monkeypatch.setattr(resolver.question_service, "refresh_fill_in_blank_folder",
+                        lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+
+    _write(tmp_path / "a" / "question002.json")
+    assert resolver.resolve("a", 2) == os.path.join(str(tmp_path), "a", "question002.json")
+    assert calls == [("a",)]
+
+
+def test_invalidate_after_move(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """
+    Test that invalidating a folder drops paths that were moved away.
+
+    Args:
+        tmp_path: Root of the temporary bank.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    _write(tmp_path / "a" / "question003.json")
+    resolver = _resolver(tmp_path, monkeypatch)
+    assert resolver.resolve("", 3).endswith(os.path.join("a", "question003.json"))
+
+    os.rename(tmp_path / "a", tmp_path / "c")
+    resolver.invalidate("")
+    assert resolver.resolve("", 3) == os.path.join(str(tmp_path), "c", "question003.json")
+    assert resolver.resolve("a", 3) is None
+
+
+def test_unfocused_lookup_matches_the_question_on_screen(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """
+    Test that the page and the resolver pick the same file when folders reuse an ID.
+
+    Args:
+        tmp_path: Root of the temporary bank.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    _write(tmp_path / "a" / "question001.json")
+    _write(tmp_path / "b" / "question001.json")
+    with open(tmp_path / "a" / "question001.json", "w", encoding="utf-8") as f:
+        json.dump({"text": "a", "completed": True}, f)
+    resolver = _resolver(tmp_path, monkeypatch)
+    monkeypatch.setattr(FocusState, "get_focus", staticmethod(lambda: None))
+    game = TexteATrousService(resolver.question_service)
+    question, question_id, folder = game.get_current_question(1, game.get_active_questions())
+
+    assert (question.text, question_id, folder) == ("question001.json", 1, "b")
+    assert resolver.resolve("", 1) == os.path.join(str(tmp_path), "b", "question001.json")
+    assert resolver.resolve_in("a", 1) == os.path.join(str(tmp_path), "a", "question001.json")
@@ -0,0 +1,80 @@
+"""Tests for the warm-start snapshot of the question bank."""
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from svt_app.services.question_bank import QuestionBank
+from svt_app.services.question_snapshot import QuestionSnapshot
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+def _write(path: "Path", text: str) -> None:
+    """Write a minimal question file."""
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"text": text}, f)
+
+
+def _build(question_id: int, data: Dict[str, Any]) -> str:
+    """Build a question model as plain text."""
+    return data["text"]
+
+
+def _start(bank_dir: "Path", snapshot_path: "Path", monkeypatch: "MonkeyPatch") -> Tuple[QuestionBank, List[str]]:
+    """Load the bank as a new process would, recording the files it parses."""
+    bank: QuestionBank = QuestionBank(_build, QuestionSnapshot(str(snapshot_path)))
+    parsed: List[str] = []
+    original = bank._parse_many
+    monkeypatch.setattr(bank, "_parse_many", lambda rel_paths: parsed.extend(rel_paths) or original(rel_paths))
+    bank.reload(str(bank_dir))
+    return bank, parsed
+
+
+def test_warm_start_only_parses_stale_files(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test that a restart reads the snapshot and re-parses only added and changed files."""
+    bank_dir = tmp_path / "fill_the_blanks"
+    snapshot_path = tmp_path / "fill_the_blanks.snapshot"
+    _write(bank_dir / "a" / "question001.json", "a1")
+    _write(bank_dir / "a" / "question002.json", "a2")
+    _write(bank_dir / "b" / "question001.json", "b1")
+
+    bank, parsed = _start(bank_dir, snapshot_path, monkeypatch)
+    assert len(parsed) == 3
+    assert snapshot_path.exists()
+
+    bank, parsed = _start(bank_dir, snapshot_path, monkeypatch)
+    assert parsed == []
+    assert bank.questions() == ["a1", "b1", "a2"]
+    written = os.stat(snapshot_path).st_mtime_ns
+
+    _write(bank_dir / "a" / "question002.json", "a2 modifiée")
+    _write(bank_dir / "c" / "question001.json", "c1")
+    os.remove(bank_dir / "b" / "question001.json")
+    bank, parsed = _start(bank_dir, snapshot_path, monkeypatch)
+    assert sorted(parsed) == ["a/question002.json", "c/question001.json"]
+    assert bank.questions() == ["a1", "c1", "a2 modifiée"]
+    assert os.stat(snapshot_path).st_mtime_ns != written
+
+    assert _start(bank_dir, snapshot_path, monkeypatch)[1] == []
+
+
+def test_unusable_snapshot_falls_back_to_parsing(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test that a corrupt snapshot, or one of another directory, is ignored and rewritten."""
+    bank_dir = tmp_path / "bank"
+    snapshot_path = tmp_path / "bank.snapshot"
+    _write(bank_dir / "question001.json", "q1")
+    snapshot_path.write_bytes(b"not a snapshot")
+
+    bank, parsed = _start(bank_dir, snapshot_path, monkeypatch)
+    assert parsed == ["question001.json"]
+    assert bank.questions() == ["q1"]
+
+    other_dir = tmp_path / "other"
+    _write(other_dir / "question001.json", "o1")
+    bank, parsed = _start(other_dir, snapshot_path, monkeypatch)
+    assert parsed == ["question001.json"]
+    assert bank.questions() == ["o1"]
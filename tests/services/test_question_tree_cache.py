@@ -0,0 +1,80 @@
+"""Tests for the cached questions tree snapshots."""
+
+import json
+from typing import TYPE_CHECKING
+
+from svt_app.services.question_service import QuestionService
+from svt_app.services.question_tree_cache import QuestionTreeCache
+from svt_app.services.question_tree_pages import page_children
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+def _service(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> QuestionService:
+    """Create a question service rooted in a temporary directory."""
+    service = QuestionService()
+    monkeypatch.setattr(service, "fill_blanks_path", str(tmp_path))
+    monkeypatch.setattr(service, "image_matching_path", str(tmp_path / "none"))
+    service.load_questions()
+    return service
+
+
+def test_unchanged_tree_is_served_from_cache(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test that a snapshot is reused until a file or folder change is seen."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "question001.json").write_text(json.dumps({"text": "a"}), encoding="utf-8")
+    cache = QuestionTreeCache(_service(tmp_path, monkeypatch), revalidate_interval=0)
+
+    first = cache.snapshot("texte_a_trous", str(tmp_path))
+    assert cache.snapshot("texte_a_trous", str(tmp_path)) is first
+    assert first.tree[0]["children"][0]["text"] == "a"
+    assert json.loads(first.body)["tree"] == first.tree
+
+    (tmp_path / "sub" / "question002.json").write_text(json.dumps({"text": "b"}), encoding="utf-8")
+    second = cache.snapshot("texte_a_trous", str(tmp_path))
+    assert second.etag != first.etag
+    assert len(second.tree[0]["children"]) == 2
+
+    (tmp_path / "empty").mkdir()
+    cache.invalidate()
+    third = cache.snapshot("texte_a_trous", str(tmp_path))
+    assert [node["name"] for node in third.tree] == ["empty", "sub"]
+    assert cache.stats() == {"hits": 1, "misses": 3, "hit_rate": 0.25, "snapshots": 1}
+
+
+def test_rebuilt_identical_tree_keeps_its_etag(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test that the ETag only depends on the tree content."""
+    (tmp_path / "question001.json").write_text(json.dumps({"text": "a"}), encoding="utf-8")
+    cache = QuestionTreeCache(_service(tmp_path, monkeypatch), revalidate_interval=3600)
+
+    first = cache.snapshot("texte_a_trous", str(tmp_path))
+    cache.invalidate()
+    assert cache.snapshot("texte_a_trous", str(tmp_path)).etag == first.etag
+
+
+def test_children_are_paginated_with_aggregates(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """Test cursor pagination of one folder and the recursive folder counts."""
+    folder = tmp_path / "sub"
+    (folder / "deep").mkdir(parents=True)
+    for question_id in range(1, 6):
+        data = {"text": str(question_id), "completed": question_id % 2 == 0,
+                "statistics": {"correct_answers": 1, "wrong_answers": question_id}}
+        (folder / f"question{question_id:03d}.json").write_text(json.dumps(data), encoding="utf-8")
+    (folder / "deep" / "question001.json").write_text(json.dumps({"text": "d"}), encoding="utf-8")
+    snapshot = QuestionTreeCache(_service(tmp_path, monkeypatch)).snapshot("texte_a_trous", str(tmp_path))
+    # The maps are complete when the snapshot is handed out, pages only read them
+    assert set(snapshot.folders) == set(snapshot.aggregates) == {"", "sub", "sub/deep"}
+
+    first = page_children(snapshot, "sub", limit=4)
+    assert [item.get("name", item.get("text")) for item in first["items"]] == ["deep", "1", "2", "3"]
+    assert first["items"][0]["aggregates"]["total"] == 1
+    assert "children" not in first["items"][0]
+    assert first["aggregates"] == {"total": 6, "completed": 2, "correct_answers": 5, "wrong_answers": 15}
+    second = page_children(snapshot, "sub", first["next_cursor"], limit=4)
+    assert [item["text"] for item in second["items"]] == ["4", "5"]
+    assert second["next_cursor"] is None
+    assert page_children(snapshot, "missing") is None
+    assert page_children(snapshot, "")["aggregates"]["total"] == 6
+    assert set(snapshot.folders) == {"", "sub", "sub/deep"}
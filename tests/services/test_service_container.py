@@ -0,0 +1,53 @@
+"""Tests for the lazily built services shared by the blueprints."""
+
+import time
+from typing import TYPE_CHECKING
+
+from svt_app.app import create_app
+from svt_app.services.service_container import ServiceContainer
+from svt_app.state import FocusState
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_services_are_built_on_first_use_and_shared(tmp_path: "Path") -> None:
+    """Test that create_app parses no question and every blueprint sees one QuestionService."""
+    services = ServiceContainer(data_dir=str(tmp_path), cache_dir=str(tmp_path / "snapshots"))
+    app = create_app(services)
+    client = app.test_client()
+    assert "question_service" not in services.built()
+    assert "anki_service" not in services.built()
+    assert "answer_journal" not in services.built()
+
+    # The scores reach the journal through the container of the application, and stay in its directory
+    assert client.get("/").status_code == 200
+    assert "answer_journal" in services.built()
+    assert (tmp_path / "scores.json").is_file()
+    with app.app_context():
+        assert FocusState.focus_file() == str(tmp_path / "focus.json")
+
+    assert client.get("/game/questions_tree.json?type=relier_images").status_code == 200
+    question_service = services.question_service
+    assert client.get("/game/relier_images").status_code in (200, 302)
+    assert services.question_service is question_service
+    assert services.texte_a_trous_service.question_service is question_service
+    assert services.question_path_resolver.question_service is question_service
+    # The snapshots go to the cache directory, not next to the questions
+    assert sorted(path.suffix for path in (tmp_path / "snapshots").iterdir()) == [".snapshot", ".snapshot"]
+    assert "anki_service" not in services.built()
+
+
+def test_outbox_left_by_a_previous_run_is_resumed(anki_outbox_path: "Path") -> None:
+    """Test that an outbox database on disk is reopened in the background, and nothing is built without one."""
+    services = ServiceContainer()
+    services.resume_answer_outbox()
+    assert "answer_outbox" not in services.built()
+
+    anki_outbox_path.touch()
+    services.resume_answer_outbox()
+    deadline = time.monotonic() + 2
+    while "answer_outbox" not in services.built() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert "answer_outbox" in services.built()
+    assert "question_service" not in services.built()
@@ -0,0 +1,129 @@
+"""Tests for the SQLite question store and its migration helpers."""
+
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from svt_app.services.question_store_migration import export_tree, import_tree
+from svt_app.services.sqlite_question_store import FILL_IN_BLANK, SQLiteQuestionStore
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pathlib import Path
+
+
+def _make_tree(base: "Path") -> None:
+    """
+    Create a small JSON question tree.
+
+    Args:
+        base: Root directory of the tree.
+    """
+    os.makedirs(base / "svt" / "cellule")
+    os.makedirs(base / "vide")
+    questions = {
+        "svt/question001.json": {"text": "a", "completed": True,
+                                 "statistics": {"correct_answers": 2, "wrong_answers": 1}},
+        "svt/cellule/question001.json": {"text": "b"},
+        "svt/cellule/question002.json": {"text": "c"},
+    }
+    for rel_path, data in questions.items():
+        with open(base / rel_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+
+def test_import_export_round_trip(tmp_path: "Path") -> None:
+    """
+    Test that importing then exporting reproduces the tree, empty folders included.
+
+    Args:
+        tmp_path: Temporary directory.
+    """
+    _make_tree(tmp_path / "src")
+    store = SQLiteQuestionStore(str(tmp_path / "questions.db"))
+    assert import_tree(store, FILL_IN_BLANK, str(tmp_path / "src")) == 3
+    assert store.list_folders(FILL_IN_BLANK) == ["svt", "svt/cellule", "vide"]
+    assert store.active_ids(FILL_IN_BLANK, "svt/cellule") == [1, 2]
+
+    assert export_tree(store, FILL_IN_BLANK, str(tmp_path / "out")) == 3
+    assert os.path.isdir(tmp_path / "out" / "vide")
+    with open(tmp_path / "out" / "svt" / "question001.json", encoding="utf-8") as f:
+        exported = json.load(f)
+    assert exported == {"text": "a", "completed": True,
+                        "statistics": {"correct_answers": 2, "wrong_answers": 1}}
+
+
+def test_import_is_one_transaction(tmp_path: "Path", monkeypatch: "MonkeyPatch") -> None:
+    """
+    Test that an import commits once, so a failure part way leaves the store untouched.
+
+    Args:
+        tmp_path: Temporary directory.
+        monkeypatch: Fixture used to make the second question fail.
+    """
+    _make_tree(tmp_path / "src")
+    store = SQLiteQuestionStore(str(tmp_path / "questions.db"))
+    original = store.upsert_question
+    calls = []
+
+    def upsert(*args: Any) -> None:
+        calls.append(args)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        original(*args)
+
+    monkeypatch.setattr(store, "upsert_question", upsert)
+    with pytest.raises(OSError):
+        import_tree(store, FILL_IN_BLANK, str(tmp_path / "src"))
+    assert store.list_folders(FILL_IN_BLANK) == []
+    assert store.folder_statistics(FILL_IN_BLANK)["total"] == 0
+
+
+def test_concurrent_answers_are_not_lost(tmp_path: "Path") -> None:
+    """
+    Test that answers recorded from several threads are all counted.
+
+    Args:
+        tmp_path: Temporary directory.
+    """
+    store = SQLiteQuestionStore(str(tmp_path / "questions.db"))
+    store.upsert_question(FILL_IN_BLANK, "svt", 1, "question001.json", {"text": "a"})
+
+    def answer() -> None:
+        """Record a batch of answers."""
+        for index in range(25):
+            store.record_answer(FILL_IN_BLANK, "svt", 1, correct=index % 2 == 0)
+
+    threads = [threading.Thread(target=answer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    statistics = store.get_question(FILL_IN_BLANK, "svt", 1)["statistics"]
+    assert statistics == {"correct_answers": 52, "wrong_answers": 48}
+
+
+def test_move_and_statistics(tmp_path: "Path") -> None:
+    """
+    Test folder moves and aggregate statistics.
+
+    Args:
+        tmp_path: Temporary directory.
+    """
+    _make_tree(tmp_path / "src")
+    store = SQLiteQuestionStore(str(tmp_path / "questions.db"))
+    import_tree(store, FILL_IN_BLANK, str(tmp_path / "src"))
+
+    store.move_folder(FILL_IN_BLANK, "svt", "biologie")
+    assert store.list_folders(FILL_IN_BLANK) == ["biologie", "biologie/cellule", "vide"]
+    assert store.record_answer(FILL_IN_BLANK, "biologie/cellule", 2, correct=True, mark_completed=True)
+
+    assert store.folder_statistics(FILL_IN_BLANK, "biologie") == {
+        "total": 3, "completed": 2, "correct_answers": 3, "wrong_answers": 1
+    }
+    store.delete_folder(FILL_IN_BLANK, "biologie/cellule")
+    assert store.folder_statistics(FILL_IN_BLANK)["total"] == 1
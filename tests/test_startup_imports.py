@@ -0,0 +1,38 @@
+"""Test that the Anki dependencies are only imported when Anki is used."""
+
+import json
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+SCRIPT = """
+import json, sys
+from svt_app.app import create_app
+client = create_app().test_client()
+client.get("/")
+client.get("/game/questions_tree.json?type=relier_images")
+at_startup = sorted(name for name in ("bs4", "requests", "urllib3", "dotenv") if name in sys.modules)
+client.get("/anki/authenticate")
+after_anki = sorted(name for name in ("bs4", "requests", "urllib3", "dotenv") if name in sys.modules)
+print(json.dumps([at_startup, after_anki]))
+"""
+
+
+def test_anki_dependencies_load_on_first_anki_request(tmp_path: "Path") -> None:
+    """Test that the menu and the games do not import bs4, requests, urllib3 or dotenv.
+
+    Runs in a fresh interpreter, from an empty data directory, since the other
+    tests import the Anki services in this one.
+    """
+    env = dict(os.environ, PYTHONPATH=SRC, ANKI_HOST="127.0.0.1", ANKI_PORT="9", ANKI_MAX_RETRIES="0")
+    output = subprocess.run([sys.executable, "-c", SCRIPT], cwd=tmp_path, env=env, check=True,
+                            capture_output=True, text=True).stdout
+    at_startup, after_anki = json.loads(output.strip().splitlines()[-1])
+    assert at_startup == []
+    assert after_anki == ["dotenv", "requests", "urllib3"]
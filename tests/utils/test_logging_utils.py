@@ -0,0 +1,42 @@
+"""Tests for the logging facade."""
+
+from typing import TYPE_CHECKING, List
+
+from svt_app.utils import logging_utils
+from svt_app.utils.logging_utils import conditional_log, lazy, log_if_enabled, module_logger
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+def test_disabled_module_skips_decoration_and_lazy_arguments() -> None:
+    """Test that a disabled module neither wraps functions nor computes lazy arguments."""
+    calls: List[int] = []
+
+    def expensive() -> int:
+        calls.append(1)
+        return 1
+
+    def plain() -> int:
+        return 2
+
+    assert log_if_enabled()(plain) is plain
+    conditional_log("value {}", lazy(expensive))
+    log = module_logger(__name__)
+    assert not log.enabled
+    log("value {}", lazy(expensive))
+    assert calls == []
+
+
+def test_enabled_module_formats_lazy_arguments(monkeypatch: "MonkeyPatch") -> None:
+    """Test that lazy arguments are computed when the message is emitted."""
+    monkeypatch.setattr(logging_utils, "_ENABLED_MODULES", frozenset({"tests.enabled"}))
+    calls: List[int] = []
+
+    def expensive() -> dict:
+        calls.append(1)
+        return {"a": 1}
+
+    conditional_log("value {} {!r}", lazy(expensive), lazy(expensive),
+                    module_name="tests.enabled")
+    assert calls == [1, 1]
@@ -0,0 +1,40 @@
+"""Tests for the per-route request metrics."""
+
+from svt_app.app import create_app
+from svt_app.utils.request_metrics import RequestMetrics
+
+
+def test_percentiles_and_prometheus_output() -> None:
+    """Test histogram percentiles, error counts and the exposition format."""
+    metrics = RequestMetrics()
+    for _ in range(98):
+        metrics.record("game", "game.check_answer", "POST", 200, 0.002)
+    metrics.record("game", "game.check_answer", "POST", 500, 0.2)
+    metrics.record("game", "game.check_answer", "POST", 200, 3.0)
+
+    route = metrics.summary()[0]
+    assert route["count"] == 100
+    assert route["errors"] == 1
+    assert 1.0 <= route["p50_ms"] <= 2.5
+    assert 100.0 <= route["p99_ms"] <= 250.0
+    assert route["max_ms"] == 3000.0
+
+    text = metrics.prometheus_text()
+    labels = 'blueprint="game",endpoint="game.check_answer",method="POST"'
+    assert f'revijouer_http_request_duration_seconds_bucket{{{labels},le="0.0025"}} 98' in text
+    assert f'revijouer_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 100' in text
+    assert f"revijouer_http_request_errors_total{{{labels}}} 1" in text
+
+
+def test_metrics_endpoints_record_requests() -> None:
+    """Test that requests to the application show up at /metrics and /metrics/summary."""
+    client = create_app().test_client()
+    client.get("/settings/")
+    client.get("/settings/")
+
+    summary = client.get("/metrics/summary").get_json()["routes"]
+    settings = [route for route in summary if route["blueprint"] == "settings"]
+    assert settings and settings[0]["count"] == 2
+    response = client.get("/metrics")
+    assert response.mimetype == "text/plain"
+    assert 'blueprint="settings"' in response.get_data(as_text=True)
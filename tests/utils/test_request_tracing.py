@@ -0,0 +1,46 @@
+"""Tests for the sampled request tracing."""
+
+from flask import Flask, session
+
+from svt_app.utils.request_tracing import RequestTracer, init_request_tracing
+
+
+def _app(tracer: RequestTracer) -> Flask:
+    """Create a minimal application traced by the given tracer."""
+    app = Flask(__name__)
+    app.secret_key = "test"
+    init_request_tracing(app, tracer)
+
+    @app.route("/visit")
+    def visit() -> str:
+        session["visits"] = session.get("visits", 0) + 1
+        return "ok"
+
+    return app
+
+
+def test_only_sampled_or_slow_requests_are_kept() -> None:
+    """Test sampling, the slow threshold and the bounded ring buffer."""
+    unsampled = _app(RequestTracer(sample_rate=0.0, slow_threshold_ms=None))
+    unsampled.test_client().get("/visit")
+    assert unsampled.extensions["request_tracer"].spans() == []
+
+    slow = RequestTracer(sample_rate=0.0, slow_threshold_ms=0.0, capacity=2)
+    client = _app(slow).test_client()
+    for _ in range(3):
+        client.get("/visit")
+    spans = client.get("/debug/traces").get_json()["spans"]
+    assert len(spans) == 2
+    assert spans[0]["reason"] == "slow"
+    assert spans[0]["endpoint"] == "visit"
+    assert spans[0]["response_bytes"] == 2
+    assert spans[0]["session_bytes"] > 0
+    assert spans[0]["session"] is None
+
+
+def test_session_is_dumped_only_when_enabled() -> None:
+    """Test that spans carry the session content only when asked to."""
+    client = _app(RequestTracer(sample_rate=1.0, include_session=True)).test_client()
+    client.get("/visit")
+    spans = client.get("/debug/traces?limit=1").get_json()["spans"]
+    assert spans[0]["session"] == {"visits": 1}